@@ -2,6 +2,8 @@
 Debug script to inspect the exact API request being made for order placement.
 """
 
+from dataclasses import asdict
+
 from mudrex import MudrexClient
 from mudrex.models import OrderRequest, OrderType, TriggerType
 import json
@@ -66,7 +68,7 @@ def main():
         print(f"\n📊 {symbol} Asset Details:")
         print(f"   Asset ID: {asset.asset_id if hasattr(asset, 'asset_id') else 'N/A'}")
         print(f"   Symbol: {asset.symbol}")
-        print(f"   Raw data: {asset.__dict__}")
+        print(f"   Raw data: {asdict(asset)}")
         
         # Try with asset_id instead
         if hasattr(asset, 'asset_id') and asset.asset_id:
@@ -4,6 +4,8 @@ Mudrex SDK - Live Trading Script
 Places a small test trade to verify the SDK works end-to-end.
 """
 
+from dataclasses import asdict
+
 from mudrex import MudrexClient
 import time
 
@@ -69,7 +71,7 @@ def main():
         if btc_pos:
             print(f"✅ Position opened!")
             print(f"\n📊 Position Details:")
-            pos_data = btc_pos.__dict__
+            pos_data = asdict(btc_pos)
             print(f"   Symbol: {pos_data.get('symbol', 'N/A')}")
             print(f"   Quantity: {pos_data.get('quantity', 'N/A')}")
             print(f"   Entry Price: ${pos_data.get('entry_price', 'N/A')}")
@@ -4,6 +4,8 @@ Simple Manual Trading Script for Mudrex SDK
 This script allows you to manually trade with better debugging.
 """
 
+from dataclasses import asdict
+
 from mudrex import MudrexClient
 import json
 
@@ -27,7 +29,7 @@ def main():
     if assets:
         first_asset = assets[0]
         print(f"Sample asset data for {first_asset.symbol}:")
-        print(f"  Raw data: {first_asset.__dict__}\n")
+        print(f"  Raw data: {asdict(first_asset)}\n")
     
     # Let's get BTCUSDT which should have data
     print("📊 Getting BTCUSDT details...")
@@ -35,7 +37,7 @@ def main():
         btc = client.assets.get("BTCUSDT")
         print(f"BTCUSDT data:")
         print(f"  Symbol: {btc.symbol}")
-        print(f"  Raw data: {btc.__dict__}\n")
+        print(f"  Raw data: {asdict(btc)}\n")
     except Exception as e:
         print(f"❌ Error: {e}\n")
     
@@ -44,7 +46,7 @@ def main():
     try:
         balance = client.wallet.get_futures_balance()
         print(f"Futures Balance:")
-        print(f"  Raw data: {balance.__dict__}\n")
+        print(f"  Raw data: {asdict(balance)}\n")
     except Exception as e:
         print(f"❌ Error: {e}\n")
     
@@ -56,7 +58,7 @@ def main():
         try:
             asset = client.assets.get(symbol)
             # Access raw dict to see all available fields
-            data = asset.__dict__
+            data = asdict(asset)
             print(f"\n{symbol}:")
             print(f"  ID: {data.get('id', 'N/A')}")
             print(f"  Symbol: {data.get('symbol', 'N/A')}")
@@ -104,7 +106,7 @@ order = client.orders.create_market_order(
 # Check positions
 positions = client.positions.list_open()
 for p in positions:
-    print(f"{p.symbol}: {p.__dict__}")
+    print(p)
 
 # Close position
 close_order = client.orders.create_market_order(
@@ -10,6 +10,7 @@ from typing import TYPE_CHECKING, Optional, List, Union
 
 from mudrex.api.base import BaseAPI
 from mudrex.models import Order, OrderRequest, OrderType, TriggerType, PaginatedResponse
+from mudrex.utils import step_precision
 
 if TYPE_CHECKING:
     from mudrex.client import MudrexClient
@@ -234,8 +235,7 @@ class OrdersAPI(BaseAPI):
                 # Round to nearest multiple of quantity_step
                 rounded_qty = round(raw_qty / quantity_step) * quantity_step
                 # Determine precision from quantity_step
-                precision = len(str(quantity_step).split('.')[-1]) if '.' in str(quantity_step) else 0
-                quantity = str(round(rounded_qty, precision))
+                quantity = str(round(rounded_qty, step_precision(quantity_step)))
             
             # Auto-round price to match asset's price_step (tick size)
             if price and asset.price_step:
@@ -243,8 +243,7 @@ class OrdersAPI(BaseAPI):
                 if price_step > 0:
                     raw_price = float(price)
                     rounded_price = round(raw_price / price_step) * price_step
-                    price_precision = len(str(asset.price_step).split('.')[-1]) if '.' in str(asset.price_step) else 0
-                    price = str(round(rounded_price, price_precision))
+                    price = str(round(rounded_price, step_precision(asset.price_step)))
         except Exception:
             # If asset fetch fails, use values as-is
             pass
@@ -10,6 +10,7 @@ Supports both live trading and paper trading modes.
 
 import time
 import logging
+import threading
 from typing import Optional, Dict, Any, List
 from decimal import Decimal
 import requests
@@ -43,16 +44,18 @@ class RateLimiter:
     def __init__(self, requests_per_second: float = 2.0):
         self.min_interval = 1.0 / requests_per_second
         self.last_request_time = 0.0
+        self._lock = threading.Lock()
     
     def wait(self) -> None:
-        """Wait if necessary to respect rate limits."""
-        now = time.time()
-        elapsed = now - self.last_request_time
-        if elapsed < self.min_interval:
-            sleep_time = self.min_interval - elapsed
-            logger.debug(f"Rate limiter: sleeping {sleep_time:.3f}s")
-            time.sleep(sleep_time)
-        self.last_request_time = time.time()
+        """Wait if necessary to respect rate limits (thread-safe: callers get slots in turn)."""
+        with self._lock:
+            now = time.time()
+            elapsed = now - self.last_request_time
+            if elapsed < self.min_interval:
+                sleep_time = self.min_interval - elapsed
+                logger.debug(f"Rate limiter: sleeping {sleep_time:.3f}s")
+                time.sleep(sleep_time)
+            self.last_request_time = time.time()
 
 
 class MudrexClient:
@@ -376,6 +379,7 @@ class MudrexClient:
         
         if self._paper_sltp_monitor:
             self._paper_sltp_monitor.stop()
+        self._paper_engine.price_feed.close()
         
         from mudrex.paper import PaperTradingEngine, PriceFeedService
         
@@ -489,6 +493,7 @@ class MudrexClient:
         
         if self._paper_sltp_monitor:
             self._paper_sltp_monitor.stop()
+        self._paper_engine.price_feed.close()
         
         from mudrex.paper import PaperTradingEngine, PriceFeedService
         
@@ -588,6 +593,9 @@ class MudrexClient:
             if self._paper_liquidation_engine:
                 self._paper_liquidation_engine.stop()
             
+            if self._paper_engine:
+                self._paper_engine.price_feed.close()
+            
             # PaperDB uses context manager, no explicit close needed
         
         self._session.close()
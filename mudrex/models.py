@@ -6,12 +6,18 @@ Pydantic models for type-safe API interactions.
 All numeric values are strings to preserve precision (as per API spec).
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Optional, List, Dict, Any
 
 
+# Slotted dataclasses drop the per-instance __dict__ (smaller records, faster
+# attribute access); dataclass(slots=True) needs Python 3.10+
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 # ============================================================================
 # Enums
 # ============================================================================
@@ -57,11 +63,40 @@ class WalletType(str, Enum):
     FUTURES = "FUTURES"
 
 
+# Enum member per API value: a dict lookup is several times cheaper than
+# calling the Enum class on the from_dict() paths
+_ORDER_TYPES = {m.value: m for m in OrderType}
+_TRIGGER_TYPES = {m.value: m for m in TriggerType}
+_MARGIN_TYPES = {m.value: m for m in MarginType}
+_ORDER_STATUSES = {m.value: m for m in OrderStatus}
+_POSITION_STATUSES = {m.value: m for m in PositionStatus}
+
+
+# Sentinel for "key absent" where None is a legitimate value
+_MISSING = object()
+
+
+def _intern(value: Any) -> Any:
+    """
+    sys.intern() a repeated identifier string (symbol, asset_id, ...).
+    
+    Every response row decodes its own copy; interning leaves one object per
+    distinct value. Non-strings are returned unchanged.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _to_enum(members: Dict[str, Enum], enum_cls: type, value: Any) -> Any:
+    """Enum member for an API value; unknown values raise like enum_cls(value)."""
+    member = members.get(value)
+    return member if member is not None else enum_cls(value)
+
+
 # ============================================================================
 # Wallet Models
 # ============================================================================
 
-@dataclass
+@dataclass(**_SLOTS)
 class WalletBalance:
     """Spot wallet balance information.
     
@@ -96,7 +131,7 @@ class WalletBalance:
         return f"WalletBalance(total={self.total}, withdrawable={self.withdrawable}, invested={self.invested})"
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class FuturesBalance:
     """Futures wallet balance information.
     
@@ -155,7 +190,25 @@ class TransferResult:
 # Asset Models
 # ============================================================================
 
-@dataclass
+# Asset fields the API may send under another name, preferred name first
+_ASSET_ALIASES = {
+    "asset_id": ("asset_id", "id"),
+    "min_quantity": ("min_quantity", "min_contract"),
+    "max_quantity": ("max_quantity", "max_contract"),
+    "taker_fee": ("taker_fee", "trading_fee_perc"),
+}
+
+
+def _first_present(data: Dict[str, Any], keys: tuple, default: Any) -> Any:
+    """Value of the first key in data, else default (one lookup per key)."""
+    for key in keys:
+        value = data.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+    return default
+
+
+@dataclass(**_SLOTS)
 class Asset:
     """Futures trading instrument/asset details."""
     asset_id: str
@@ -181,17 +234,17 @@ class Asset:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Asset":
         return cls(
-            asset_id=data.get("asset_id", data.get("id", "")),
-            symbol=data.get("symbol", ""),
-            base_currency=data.get("base_currency", ""),
-            quote_currency=data.get("quote_currency", "USDT"),
-            min_quantity=str(data.get("min_quantity", data.get("min_contract", "0"))),
-            max_quantity=str(data.get("max_quantity", data.get("max_contract", "0"))),
+            asset_id=_intern(_first_present(data, _ASSET_ALIASES["asset_id"], "")),
+            symbol=_intern(data.get("symbol", "")),
+            base_currency=_intern(data.get("base_currency", "")),
+            quote_currency=_intern(data.get("quote_currency", "USDT")),
+            min_quantity=str(_first_present(data, _ASSET_ALIASES["min_quantity"], "0")),
+            max_quantity=str(_first_present(data, _ASSET_ALIASES["max_quantity"], "0")),
             quantity_step=str(data.get("quantity_step", "0")),
             min_leverage=str(data.get("min_leverage", "1")),
             max_leverage=str(data.get("max_leverage", "100")),
             maker_fee=str(data.get("maker_fee", "0")),
-            taker_fee=str(data.get("taker_fee", data.get("trading_fee_perc", "0"))),
+            taker_fee=str(_first_present(data, _ASSET_ALIASES["taker_fee"], "0")),
             is_active=data.get("is_active", True),
             # Price precision fields
             price_step=data.get("price_step"),
@@ -203,7 +256,7 @@ class Asset:
         )
 
 
-@dataclass  
+@dataclass(**_SLOTS)
 class Leverage:
     """Current leverage settings for an asset."""
     asset_id: str
@@ -215,7 +268,7 @@ class Leverage:
         return cls(
             asset_id=data.get("asset_id", ""),
             leverage=str(data.get("leverage", "1")),
-            margin_type=MarginType(data.get("margin_type", "ISOLATED")),
+            margin_type=_to_enum(_MARGIN_TYPES, MarginType, data.get("margin_type", "ISOLATED")),
         )
 
 
@@ -261,7 +314,7 @@ class OrderRequest:
         return data
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Order:
     """Represents a futures order."""
     order_id: str
@@ -283,11 +336,11 @@ class Order:
     def from_dict(cls, data: Dict[str, Any]) -> "Order":
         return cls(
             order_id=data.get("order_id", data.get("id", "")),
-            asset_id=data.get("asset_id", ""),
-            symbol=data.get("symbol", ""),
-            order_type=OrderType(data.get("order_type", "LONG")),
-            trigger_type=TriggerType(data.get("trigger_type", "MARKET")),
-            status=OrderStatus(data.get("status", "OPEN")),
+            asset_id=_intern(data.get("asset_id", "")),
+            symbol=_intern(data.get("symbol", "")),
+            order_type=_to_enum(_ORDER_TYPES, OrderType, data.get("order_type", "LONG")),
+            trigger_type=_to_enum(_TRIGGER_TYPES, TriggerType, data.get("trigger_type", "MARKET")),
+            status=_to_enum(_ORDER_STATUSES, OrderStatus, data.get("status", "OPEN")),
             quantity=str(data.get("quantity", "0")),
             filled_quantity=str(data.get("filled_quantity", "0")),
             price=str(data.get("price", data.get("order_price", "0"))),
@@ -303,7 +356,7 @@ class Order:
 # Position Models
 # ============================================================================
 
-@dataclass
+@dataclass(**_SLOTS)
 class Position:
     """Represents an open or closed futures position."""
     position_id: str
@@ -343,9 +396,9 @@ class Position:
         
         return cls(
             position_id=data.get("position_id", data.get("id", "")),
-            asset_id=data.get("asset_id", ""),
-            symbol=data.get("symbol", ""),
-            side=OrderType(data.get("side", data.get("order_type", "LONG"))),
+            asset_id=_intern(data.get("asset_id", "")),
+            symbol=_intern(data.get("symbol", "")),
+            side=_to_enum(_ORDER_TYPES, OrderType, data.get("side", data.get("order_type", "LONG"))),
             quantity=str(data.get("quantity", "0")),
             entry_price=str(data.get("entry_price", "0")),
             mark_price=str(data.get("mark_price", "0")),
@@ -356,7 +409,7 @@ class Position:
             liquidation_price=data.get("liquidation_price"),
             stoploss_price=stoploss_price,
             takeprofit_price=takeprofit_price,
-            status=PositionStatus(data.get("status", "OPEN")),
+            status=_to_enum(_POSITION_STATUSES, PositionStatus, data.get("status", "OPEN")),
             created_at=_parse_datetime(data.get("created_at")),
         )
     
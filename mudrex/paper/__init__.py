@@ -149,6 +149,7 @@ from mudrex.paper.external_data import (
     TickerInfo,
     FundingInfo,
     Kline,
+    KlineFrame,
 )
 
 # Funding rate monitor (V2)
@@ -175,6 +176,7 @@ __all__.extend([
     "TickerInfo",
     "FundingInfo",
     "Kline",
+    "KlineFrame",
     
     # Funding (V2)
     "FundingMonitor",
@@ -0,0 +1,53 @@
+"""
+Paper Trading Clock
+===================
+
+Shared source of "now" for paper trading timestamps.
+Model mutators stamp times through now(). While an engine operation has the
+clock pinned (see pinned()), every stamp it makes on that thread reuses a
+single datetime.utcnow() reading.
+"""
+
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
+from typing import Callable, Iterator, TypeVar
+
+_F = TypeVar("_F", bound=Callable)
+
+_local = threading.local()
+
+
+def now() -> datetime:
+    """Current UTC time (naive), or the pinned time inside pinned()."""
+    pinned_at = getattr(_local, "now", None)
+    return pinned_at if pinned_at is not None else datetime.utcnow()
+
+
+@contextmanager
+def pinned() -> Iterator[datetime]:
+    """
+    Pin now() to one reading for the current thread.
+    
+    Nested use keeps the outermost reading.
+    """
+    pinned_at = getattr(_local, "now", None)
+    if pinned_at is not None:
+        yield pinned_at
+        return
+    
+    _local.now = pinned_at = datetime.utcnow()
+    try:
+        yield pinned_at
+    finally:
+        _local.now = None
+
+
+def pin_clock(method: _F) -> _F:
+    """Decorator: run the method with the clock pinned."""
+    @wraps(method)
+    def wrapper(*args, **kwargs):
+        with pinned():
+            return method(*args, **kwargs)
+    return wrapper  # type: ignore[return-value]
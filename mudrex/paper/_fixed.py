@@ -0,0 +1,41 @@
+"""
+Paper Trading Fixed-Point Math
+==============================
+
+Integer fixed-point helpers shared by the position, funding and margin math.
+Values are integers scaled by SCALE (10^8, i.e. 8 decimal places); every
+conversion and division rounds half-to-even.
+"""
+
+from decimal import Decimal, ROUND_HALF_EVEN
+from typing import Any
+
+# 1 unit = 10^-8
+SCALE = 10 ** 8
+
+
+def to_scaled(value: Any) -> int:
+    """Convert a price, quantity or amount to an integer scaled by SCALE (banker's rounding)."""
+    if isinstance(value, int):
+        return value * SCALE
+    return int((Decimal(value) * SCALE).to_integral_value(ROUND_HALF_EVEN))
+
+
+def div_round(numerator: int, denominator: int) -> int:
+    """Integer division rounded half-to-even (denominator > 0)."""
+    q, r = divmod(numerator, denominator)
+    if r * 2 > denominator or (r * 2 == denominator and q & 1):
+        q += 1
+    return q
+
+
+def from_scaled(value: int, scale: int = SCALE) -> Decimal:
+    """
+    Convert an integer scaled by ``scale`` back to a Decimal.
+    
+    Products of scaled values carry a power of SCALE (e.g. SCALE ** 2);
+    those are rounded to 8 decimal places.
+    """
+    if scale != SCALE:
+        value = div_round(value * SCALE, scale)
+    return Decimal(value).scaleb(-8)
@@ -7,10 +7,12 @@ Handles order execution, position management, and PnL calculations.
 """
 
 import logging
+import time
 from datetime import datetime, timedelta
 from decimal import Decimal
-from typing import Dict, List, Optional, Union, TYPE_CHECKING
+from typing import Dict, List, Optional, Tuple, Union, TYPE_CHECKING
 
+from mudrex.paper._clock import now as _now, pin_clock
 from mudrex.paper.models import (
     PaperWallet,
     PaperOrder,
@@ -20,6 +22,7 @@ from mudrex.paper.models import (
     PaperPositionStatus,
     CloseReason,
     generate_paper_id,
+    update_all_pnls,
 )
 from mudrex.paper.exceptions import (
     InsufficientMarginError,
@@ -83,6 +86,8 @@ class PaperTradingEngine:
         price_feed: "PriceFeedService",
         fee_rate: Decimal = None,
         enable_logging: bool = True,
+        wallet: Optional[PaperWallet] = None,
+        state: Optional[dict] = None,
     ):
         """
         Initialize the paper trading engine.
@@ -92,35 +97,56 @@ class PaperTradingEngine:
             price_feed: Price feed service for getting live prices
             fee_rate: Trading fee rate (default: 0.05%)
             enable_logging: Enable detailed logging
+            wallet: Prebuilt wallet to use instead of a fresh one holding
+                initial_balance
+            state: Exported state to restore orders, positions, history
+                and settings from (see from_state)
         """
         self.price_feed = price_feed
         self.fee_rate = fee_rate or self.DEFAULT_FEE_RATE
         self.enable_logging = enable_logging
         
         # Core state
-        self.wallet = PaperWallet(
-            balance=initial_balance,
-            available=initial_balance,
-        )
+        if wallet is None:
+            wallet = PaperWallet(
+                balance=initial_balance,
+                available=initial_balance,
+            )
+        self.wallet = wallet
+        
+        if state is None:
+            # Order and position storage
+            self.orders: Dict[str, PaperOrder] = {}
+            self.positions: Dict[str, PaperPosition] = {}
+            self.trade_history: List[TradeRecord] = []
+            
+            # Pending limit orders (symbol -> list of order_ids)
+            self.pending_orders: Dict[str, List[str]] = {}
+            
+            # Leverage settings per symbol (symbol -> leverage)
+            self.leverage_settings: Dict[str, int] = {}
+        else:
+            self._load_containers(state)
         
-        # Order and position storage
-        self.orders: Dict[str, PaperOrder] = {}
-        self.positions: Dict[str, PaperPosition] = {}
-        self.trade_history: List[TradeRecord] = []
+        # Last export timestamp: (epoch second, ISO string)
+        self._last_export_ts: Tuple[int, str] = (0, "")
         
-        # Pending limit orders (symbol -> list of order_ids)
-        self.pending_orders: Dict[str, List[str]] = {}
+        # Wallet unrealized PnL freshness (see get_wallet)
+        self._unrealized_dirty = True
+        self._unrealized_refreshed_at = 0.0
         
-        # Leverage settings per symbol (symbol -> leverage)
-        self.leverage_settings: Dict[str, int] = {}
+        # Bumped whenever a position is opened, changed or closed, so
+        # monitors can reuse their view of open positions until it moves
+        self.positions_version = 0
         
         if enable_logging:
-            logger.info(f"Paper trading engine initialized with ${initial_balance} balance")
+            logger.info(f"Paper trading engine initialized with ${self.wallet.balance} balance")
     
     # =========================================================================
     # Order Creation
     # =========================================================================
     
+    @pin_clock
     def create_market_order(
         self,
         symbol: str,
@@ -187,6 +213,7 @@ class PaperTradingEngine:
         
         return order
     
+    @pin_clock
     def create_limit_order(
         self,
         symbol: str,
@@ -259,7 +286,7 @@ class PaperTradingEngine:
             takeprofit_price=takeprofit_price,
             reduce_only=reduce_only,
             margin_used=required_margin,
-            expires_at=datetime.utcnow() + timedelta(hours=self.LIMIT_ORDER_EXPIRY_HOURS),
+            expires_at=_now() + timedelta(hours=self.LIMIT_ORDER_EXPIRY_HOURS),
         )
         
         # Reserve margin
@@ -336,6 +363,8 @@ class PaperTradingEngine:
         
         # Handle position
         position = self._handle_position_for_order(order, execution_price)
+        self._unrealized_dirty = True
+        self.positions_version += 1
         
         # Set SL/TP on position
         if order.stoploss_price and position:
@@ -361,7 +390,7 @@ class PaperTradingEngine:
             price=execution_price,
             notional=notional,
             fee=fee,
-            executed_at=datetime.utcnow(),
+            executed_at=_now(),
         )
         self.trade_history.append(trade)
         
@@ -457,7 +486,7 @@ class PaperTradingEngine:
         position.quantity = new_quantity
         position.entry_price = new_entry_price
         position.margin += order.margin_used
-        position.updated_at = datetime.utcnow()
+        position.updated_at = _now()
         position.liquidation_price = position.calculate_liquidation_price()
         
         if self.enable_logging:
@@ -492,10 +521,7 @@ class PaperTradingEngine:
             
             # Release proportional margin and realize PnL
             released_margin = order.margin_used
-            self.wallet.release_margin(released_margin)
-            self.wallet.balance += pnl
-            self.wallet.available += pnl
-            self.wallet.realized_pnl += pnl
+            self.wallet.realize_pnl(pnl, released_margin)
             
             if self.enable_logging:
                 logger.info(
@@ -538,24 +564,31 @@ class PaperTradingEngine:
     # Position Management
     # =========================================================================
     
+    @pin_clock
     def list_open_positions(self) -> List[PaperPosition]:
         """Get all open positions with updated PnL."""
-        open_positions = []
+        open_positions = [
+            p for p in self.positions.values() if p.status == PaperPositionStatus.OPEN
+        ]
         
-        for position in self.positions.values():
-            if position.status == PaperPositionStatus.OPEN:
-                # Update PnL with current price
-                try:
-                    current_price = self.price_feed.get_price(position.symbol)
-                    position.update_pnl(current_price)
-                except Exception as e:
-                    logger.warning(f"Failed to update PnL for {position.position_id}: {e}")
-                
-                open_positions.append(position)
+        # Update PnL with current prices, one price per symbol; positions
+        # whose price could not be fetched keep their last PnL
+        if open_positions:
+            try:
+                prices = self.price_feed.get_prices_batch(
+                    list({p.symbol for p in open_positions})
+                )
+            except Exception as e:
+                logger.warning(f"Failed to update position PnL: {e}")
+                prices = {}
+            update_all_pnls(open_positions, prices)
         
         # Update wallet unrealized PnL
-        total_unrealized = sum(p.unrealized_pnl for p in open_positions)
-        self.wallet.unrealized_pnl = total_unrealized
+        self.wallet.unrealized_pnl = sum(
+            (p.unrealized_pnl for p in open_positions), Decimal("0")
+        )
+        self._unrealized_dirty = False
+        self._unrealized_refreshed_at = time.monotonic()
         
         return open_positions
     
@@ -570,12 +603,13 @@ class PaperTradingEngine:
         if position.status == PaperPositionStatus.OPEN:
             try:
                 current_price = self.price_feed.get_price(position.symbol)
-                position.update_pnl(current_price)
+                self.wallet.unrealized_pnl += position.update_pnl(current_price)
             except Exception:
                 pass
         
         return position
     
+    @pin_clock
     def close_position(
         self,
         position_id: str,
@@ -615,6 +649,8 @@ class PaperTradingEngine:
             "LIQUIDATION": CloseReason.LIQUIDATION,
         }
         close_reason = reason_map.get(reason.upper(), CloseReason.MANUAL)
+        self._unrealized_dirty = True
+        self.positions_version += 1
         
         if quantity is None or quantity >= position.quantity:
             # Full close
@@ -642,7 +678,7 @@ class PaperTradingEngine:
                 fee=Decimal("0"),
                 pnl=pnl,
                 pnl_percent=(pnl / (quantity * position.entry_price)) * 100,
-                executed_at=datetime.utcnow(),
+                executed_at=_now(),
             )
             self.trade_history.append(trade)
         
@@ -659,7 +695,10 @@ class PaperTradingEngine:
         
         Returns: realized PnL
         """
+        self.wallet.unrealized_pnl -= position.unrealized_pnl
         pnl = position.close(exit_price, reason)
+        self._unrealized_dirty = True
+        self.positions_version += 1
         
         # Calculate exit fee
         exit_notional = position.quantity * exit_price
@@ -691,7 +730,7 @@ class PaperTradingEngine:
             fee=exit_fee,
             pnl=net_pnl,
             pnl_percent=(pnl / (position.quantity * position.entry_price)) * 100 if position.entry_price else Decimal("0"),
-            executed_at=datetime.utcnow(),
+            executed_at=_now(),
         )
         self.trade_history.append(trade)
         
@@ -711,7 +750,7 @@ class PaperTradingEngine:
             raise PositionAlreadyClosedError(position_id)
         
         position.stoploss_price = stoploss_price
-        position.updated_at = datetime.utcnow()
+        position.updated_at = _now()
         
         if self.enable_logging:
             logger.info(f"Stop-loss set: {position_id} @ {stoploss_price}")
@@ -726,7 +765,7 @@ class PaperTradingEngine:
             raise PositionAlreadyClosedError(position_id)
         
         position.takeprofit_price = takeprofit_price
-        position.updated_at = datetime.utcnow()
+        position.updated_at = _now()
         
         if self.enable_logging:
             logger.info(f"Take-profit set: {position_id} @ {takeprofit_price}")
@@ -750,7 +789,7 @@ class PaperTradingEngine:
         if takeprofit_price is not None:
             position.takeprofit_price = takeprofit_price
         
-        position.updated_at = datetime.utcnow()
+        position.updated_at = _now()
         
         if self.enable_logging:
             logger.info(f"Risk orders set: {position_id} SL={stoploss_price} TP={takeprofit_price}")
@@ -791,6 +830,7 @@ class PaperTradingEngine:
         orders.sort(key=lambda o: o.created_at, reverse=True)
         return orders[:limit]
     
+    @pin_clock
     def cancel_order(self, order_id: str) -> bool:
         """Cancel a pending order."""
         order = self.get_order(order_id)
@@ -817,6 +857,7 @@ class PaperTradingEngine:
         
         return True
     
+    @pin_clock
     def check_limit_orders(self) -> List[PaperOrder]:
         """
         Check all pending limit orders for fill conditions.
@@ -843,7 +884,7 @@ class PaperTradingEngine:
                     continue
                 
                 # Check expiry
-                if order.expires_at and datetime.utcnow() > order.expires_at:
+                if order.expires_at and _now() > order.expires_at:
                     order.status = PaperOrderStatus.EXPIRED
                     self.wallet.release_margin(order.margin_used)
                     order_ids.remove(order_id)
@@ -934,9 +975,22 @@ class PaperTradingEngine:
     # =========================================================================
     
     def get_wallet(self) -> PaperWallet:
-        """Get current wallet state with updated unrealized PnL."""
-        # Update unrealized PnL from positions
-        self.list_open_positions()  # This updates wallet.unrealized_pnl
+        """
+        Get current wallet state with updated unrealized PnL.
+        
+        wallet.unrealized_pnl is a running total, adjusted wherever a
+        position's PnL is written (get_position, closes, the SL/TP monitor).
+        It is only recomputed from the feed when positions changed since the
+        last refresh, or when the price feed's cache TTL has elapsed (prices
+        cannot change before then). Feeds without a ``cache_ttl`` are
+        refreshed on every call.
+        """
+        price_ttl = getattr(self.price_feed, "cache_ttl", 0)
+        if (
+            self._unrealized_dirty
+            or time.monotonic() - self._unrealized_refreshed_at >= price_ttl
+        ):
+            self.list_open_positions()  # This updates wallet.unrealized_pnl
         return self.wallet
     
     def reset_wallet(self, new_balance: Decimal = None) -> None:
@@ -953,6 +1007,8 @@ class PaperTradingEngine:
         self.pending_orders.clear()
         self.trade_history.clear()
         self.leverage_settings.clear()
+        self._unrealized_dirty = True
+        self.positions_version += 1
         
         if self.enable_logging:
             logger.info(f"Wallet reset to ${new_balance}")
@@ -979,49 +1035,99 @@ class PaperTradingEngine:
     # State Export/Import
     # =========================================================================
     
-    def export_state(self) -> dict:
-        """Export engine state for persistence."""
+    def _export_timestamp(self) -> str:
+        """ISO timestamp for exports, recomputed at most once per second."""
+        now = int(time.time())
+        if now != self._last_export_ts[0]:
+            self._last_export_ts = (now, datetime.utcfromtimestamp(now).isoformat())
+        return self._last_export_ts[1]
+    
+    def export_state(self, trade_history_from: int = 0) -> dict:
+        """
+        Export engine state for persistence.
+        
+        ``pending_orders`` and ``leverage_settings`` are copies, so mutating
+        the export never changes engine state.
+        
+        Args:
+            trade_history_from: Export only trade records from this index on
+                (for callers that already hold the earlier, unchanged ones)
+        """
+        trades = self.trade_history[trade_history_from:] if trade_history_from else self.trade_history
         return {
             "wallet": self.wallet.to_dict(),
             "orders": {k: v.to_dict() for k, v in self.orders.items()},
             "positions": {k: v.to_dict() for k, v in self.positions.items()},
-            "trade_history": [t.to_dict() for t in self.trade_history],
-            "pending_orders": self.pending_orders,
-            "leverage_settings": self.leverage_settings,
-            "exported_at": datetime.utcnow().isoformat(),
+            "trade_history": [t.to_dict() for t in trades],
+            "pending_orders": {
+                symbol: list(order_ids) for symbol, order_ids in self.pending_orders.items()
+            },
+            "leverage_settings": dict(self.leverage_settings),
+            "exported_at": self._export_timestamp(),
         }
     
     def import_state(self, state: dict) -> None:
         """Import engine state from persistence."""
         self.wallet = PaperWallet.from_dict(state["wallet"])
-        self.orders = {k: PaperOrder.from_dict(v) for k, v in state.get("orders", {}).items()}
-        self.positions = {k: PaperPosition.from_dict(v) for k, v in state.get("positions", {}).items()}
-        self.trade_history = [TradeRecord.from_dict(t) for t in state.get("trade_history", [])]
-        self.pending_orders = state.get("pending_orders", {})
-        self.leverage_settings = state.get("leverage_settings", {})
+        self._load_containers(state)
+        self._unrealized_dirty = True
+        self._unrealized_refreshed_at = 0.0
+        self.positions_version += 1
         
         if self.enable_logging:
             logger.info(f"State imported: {len(self.positions)} positions, {len(self.orders)} orders")
     
+    def _load_containers(self, state: dict) -> None:
+        """Replace orders, positions, history and settings from exported state."""
+        # dict.fromkeys() sizes the table from the input up front, so filling
+        # in the values below never triggers a rehash
+        orders_in = state.get("orders", {})
+        self.orders = dict.fromkeys(orders_in)
+        for order_id, data in orders_in.items():
+            self.orders[order_id] = PaperOrder.from_dict(data)
+        positions_in = state.get("positions", {})
+        self.positions = dict.fromkeys(positions_in)
+        for position_id, data in positions_in.items():
+            self.positions[position_id] = PaperPosition.from_dict(data)
+        self.trade_history = [TradeRecord.from_dict(t) for t in state.get("trade_history", [])]
+        # Copy so the engine never shares the caller's containers
+        self.pending_orders = {
+            symbol: list(order_ids)
+            for symbol, order_ids in state.get("pending_orders", {}).items()
+        }
+        self.leverage_settings = dict(state.get("leverage_settings", {}))
+    
     @classmethod
-    def from_state(cls, state: dict, price_feed) -> "PaperTradingEngine":
+    def from_state(
+        cls,
+        state: dict,
+        price_feed,
+        fee_rate: Decimal = None,
+        enable_logging: bool = True,
+    ) -> "PaperTradingEngine":
         """
         Create a new engine from saved state.
         
         Args:
             state: Previously exported state dict
             price_feed: Price feed service instance
+            fee_rate: Trading fee rate (default: 0.05%)
+            enable_logging: Enable detailed logging
             
         Returns:
             New PaperTradingEngine with restored state
         """
-        # Create engine with dummy balance (will be overwritten)
-        engine = cls(
-            initial_balance=Decimal("0"),
+        # The saved wallet and containers are built once and handed to
+        # __init__, rather than built empty and then replaced
+        wallet = PaperWallet.from_dict(state["wallet"])
+        return cls(
+            initial_balance=wallet.balance,
             price_feed=price_feed,
+            fee_rate=fee_rate,
+            enable_logging=enable_logging,
+            wallet=wallet,
+            state=state,
         )
-        engine.import_state(state)
-        return engine
     
     # =========================================================================
     # Statistics
@@ -1032,8 +1138,12 @@ class PaperTradingEngine:
         open_positions = self.list_open_positions()
         closed_positions = self.get_position_history(limit=1000)
         
-        winning_trades = [p for p in closed_positions if p.realized_pnl > 0]
-        losing_trades = [p for p in closed_positions if p.realized_pnl < 0]
+        # Single pass; comparisons are bools, so they add as 0/1
+        winning_trades = losing_trades = 0
+        for position in closed_positions:
+            pnl = position.realized_pnl
+            winning_trades += pnl > 0
+            losing_trades += pnl < 0
         
         total_pnl = self.wallet.realized_pnl + self.wallet.unrealized_pnl
         
@@ -1047,7 +1157,7 @@ class PaperTradingEngine:
             "total_fees_paid": str(self.wallet.total_fees_paid),
             "open_positions": len(open_positions),
             "total_trades": len(closed_positions),
-            "winning_trades": len(winning_trades),
-            "losing_trades": len(losing_trades),
-            "win_rate": f"{(len(winning_trades) / len(closed_positions) * 100):.1f}%" if closed_positions else "N/A",
+            "winning_trades": winning_trades,
+            "losing_trades": losing_trades,
+            "win_rate": f"{(winning_trades / len(closed_positions) * 100):.1f}%" if closed_positions else "N/A",
         }
@@ -12,10 +12,12 @@ class PaperTradingError(Exception):
     def __init__(self, message: str, code: str = "PAPER_ERROR"):
         self.message = message
         self.code = code
+        # Formatted once; str() is called repeatedly when errors are logged
+        self._str = f"[{code}] {message}"
         super().__init__(message)
     
     def __str__(self) -> str:
-        return f"[{self.code}] {self.message}"
+        return self._str
 
 
 class InsufficientMarginError(PaperTradingError):
@@ -9,19 +9,27 @@ This service fetches real-time data for:
 """
 
 import time
+import threading
 import requests
+from array import array
+from collections import OrderedDict
 from decimal import Decimal
 from datetime import datetime, timezone
-from typing import Dict, Optional, List, Tuple
+from typing import Any, Dict, Iterable, Optional, List, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+# __slots__ is declared by hand: dataclass(slots=True) needs Python 3.10+.
+
 @dataclass
 class FundingInfo:
     """Funding rate information for a symbol."""
+    __slots__ = ("symbol", "funding_rate", "next_funding_time", "mark_price", "index_price")
+    
     symbol: str
     funding_rate: Decimal  # e.g., 0.0001 = 0.01%
     next_funding_time: datetime
@@ -32,6 +40,11 @@ class FundingInfo:
 @dataclass
 class TickerInfo:
     """Real-time ticker information."""
+    __slots__ = (
+        "symbol", "last_price", "mark_price", "index_price",
+        "funding_rate", "next_funding_time", "open_interest", "volume_24h",
+    )
+    
     symbol: str
     last_price: Decimal
     mark_price: Decimal
@@ -44,13 +57,65 @@ class TickerInfo:
 
 @dataclass
 class Kline:
-    """OHLCV candlestick data."""
+    """
+    OHLCV candlestick data.
+    
+    Prices and volume are floats: klines are statistical (backtesting,
+    plotting), while TickerInfo is transactional and keeps Decimal for the
+    prices that feed settlement.
+    """
+    __slots__ = ("timestamp", "open", "high", "low", "close", "volume")
+    
     timestamp: datetime
-    open: Decimal
-    high: Decimal
-    low: Decimal
-    close: Decimal
-    volume: Decimal
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+
+@dataclass
+class KlineFrame:
+    """
+    Columnar (struct-of-arrays) OHLCV data for backtesting.
+    
+    Each column is a contiguous ``array.array`` (int64 epoch milliseconds
+    for timestamps, float64 for prices and volume), so indicator loops walk
+    flat memory. numpy users can wrap a column without copying via
+    ``np.frombuffer(frame.closes)``.
+    """
+    timestamps: array  # epoch milliseconds
+    opens: array
+    highs: array
+    lows: array
+    closes: array
+    volumes: array
+    
+    def __len__(self) -> int:
+        return len(self.timestamps)
+    
+    def __getitem__(self, index: int) -> Kline:
+        """Materialize a single bar as a Kline."""
+        return Kline(
+            timestamp=datetime.fromtimestamp(self.timestamps[index] / 1000, tz=timezone.utc),
+            open=self.opens[index],
+            high=self.highs[index],
+            low=self.lows[index],
+            close=self.closes[index],
+            volume=self.volumes[index],
+        )
+    
+    @classmethod
+    def from_klines(cls, klines: List[Kline]) -> "KlineFrame":
+        """Build a frame from a list of Kline objects."""
+        return cls(
+            timestamps=array("q", [round(k.timestamp.timestamp() * 1000) for k in klines]),
+            opens=array("d", [float(k.open) for k in klines]),
+            highs=array("d", [float(k.high) for k in klines]),
+            lows=array("d", [float(k.low) for k in klines]),
+            closes=array("d", [float(k.close) for k in klines]),
+            volumes=array("d", [float(k.volume) for k in klines]),
+        )
 
 
 class ExternalDataError(Exception):
@@ -58,6 +123,76 @@ class ExternalDataError(Exception):
     pass
 
 
+@lru_cache(maxsize=512)
+def _convert_symbol(mudrex_symbol: str) -> str:
+    """
+    Convert Mudrex symbol format to external format.
+    Mudrex: BTCUSDT → External: BTCUSDT (same for most)
+    
+    Memoized: the set of actively traded symbols is small and hot.
+    """
+    return mudrex_symbol.upper()
+
+
+# Endpoint paths and query parameters. Parameters are immutable tuples of
+# pairs so the cached values can be shared.
+_PATH_TICKERS = "/v5/market/tickers"
+_PATH_FUNDING_HISTORY = "/v5/market/funding/history"
+_PATH_KLINE = "/v5/market/kline"
+
+_ALL_TICKERS_PARAMS = (("category", "linear"),)
+
+
+@lru_cache(maxsize=256)
+def _ticker_params(ext_symbol: str) -> Tuple[Tuple[str, str], ...]:
+    """Query parameters for a single-symbol ticker request."""
+    return (("category", "linear"), ("symbol", ext_symbol))
+
+
+@lru_cache(maxsize=256)
+def _funding_history_params(ext_symbol: str, limit: int) -> Tuple[Tuple[str, Any], ...]:
+    """Query parameters for a funding history request."""
+    return (("category", "linear"), ("symbol", ext_symbol), ("limit", limit))
+
+
+@lru_cache(maxsize=256)
+def _kline_params(ext_symbol: str, interval: str, limit: int) -> Tuple[Tuple[str, Any], ...]:
+    """Query parameters for a kline request."""
+    return (
+        ("category", "linear"),
+        ("symbol", ext_symbol),
+        ("interval", interval),
+        ("limit", limit),
+    )
+
+
+def _ms_to_datetimes(timestamps_ms: Iterable) -> List[datetime]:
+    """Convert millisecond epoch timestamps to UTC datetimes in one pass."""
+    fromtimestamp = datetime.fromtimestamp
+    utc = timezone.utc
+    return [fromtimestamp(int(ts) / 1000, utc) for ts in timestamps_ms]
+
+
+def _parse_ticker(symbol: str, ticker_data: Dict) -> TickerInfo:
+    """Build a TickerInfo from a raw API ticker item."""
+    # Parse next funding time
+    next_funding_ts = int(ticker_data.get("nextFundingTime", 0))
+    next_funding_time = datetime.fromtimestamp(
+        next_funding_ts / 1000, tz=timezone.utc
+    ) if next_funding_ts else datetime.now(timezone.utc)
+    
+    return TickerInfo(
+        symbol=symbol,
+        last_price=Decimal(ticker_data.get("lastPrice", "0")),
+        mark_price=Decimal(ticker_data.get("markPrice", "0")),
+        index_price=Decimal(ticker_data.get("indexPrice", "0")),
+        funding_rate=Decimal(ticker_data.get("fundingRate", "0")),
+        next_funding_time=next_funding_time,
+        open_interest=Decimal(ticker_data.get("openInterest", "0")),
+        volume_24h=Decimal(ticker_data.get("volume24h", "0")),
+    )
+
+
 class ExternalDataService:
     """
     Fetches market data from external public API.
@@ -68,34 +203,54 @@ class ExternalDataService:
     - Mark price for liquidation
     - Klines for backtesting (future)
     - Built-in caching to minimize API calls
+    - Bounded LRU ticker cache with short-lived failure caching
+    - Concurrent requests for the same symbol share a single fetch
     
     All endpoints are public and require no authentication.
     """
     
     BASE_URL = "https://api.bybit.com"
     
-    def __init__(self, cache_ttl: int = 5):
+    # Endpoint URLs, built once instead of per request
+    _URL_TICKERS = BASE_URL + _PATH_TICKERS
+    _URL_FUNDING_HISTORY = BASE_URL + _PATH_FUNDING_HISTORY
+    _URL_KLINE = BASE_URL + _PATH_KLINE
+    
+    # Cache misses in get_tickers() at or above which one bulk request is used
+    BATCH_THRESHOLD = 3
+    
+    def __init__(
+        self,
+        cache_ttl: int = 5,
+        cache_maxsize: int = 512,
+        error_ttl: float = 1.0,
+    ):
         """
         Initialize the external data service.
         
         Args:
             cache_ttl: Cache time-to-live in seconds (default: 5)
+            cache_maxsize: Maximum number of symbols kept in the ticker cache (default: 512)
+            error_ttl: Seconds a failed ticker fetch is cached before retrying (default: 1)
         """
         self.cache_ttl = cache_ttl
-        self._ticker_cache: Dict[str, Tuple[TickerInfo, float]] = {}
+        self.cache_maxsize = cache_maxsize
+        self.error_ttl = error_ttl
+        
+        # Ticker cache: symbol -> (ticker, fetched_at), least recently used first
+        self._ticker_cache: "OrderedDict[str, Tuple[TickerInfo, float]]" = OrderedDict()
+        # Failed fetches: symbol -> (error message, failed_at)
+        self._error_cache: Dict[str, Tuple[str, float]] = {}
+        # Symbols currently being fetched: symbol -> event set when the fetch finishes
+        self._inflight: Dict[str, threading.Event] = {}
+        self._cache_lock = threading.Lock()
+        
         self._session = requests.Session()
         self._session.headers.update({
             "Accept": "application/json",
             "User-Agent": "MudrexPaperSDK/2.0"
         })
     
-    def _convert_symbol(self, mudrex_symbol: str) -> str:
-        """
-        Convert Mudrex symbol format to external format.
-        Mudrex: BTCUSDT → External: BTCUSDT (same for most)
-        """
-        return mudrex_symbol.upper()
-    
     def get_ticker(self, symbol: str) -> TickerInfo:
         """
         Get real-time ticker information including mark price and funding rate.
@@ -109,21 +264,55 @@ class ExternalDataService:
         Raises:
             ExternalDataError: If API request fails
         """
-        now = time.time()
-        
-        # Check cache
-        if symbol in self._ticker_cache:
-            cached, cached_at = self._ticker_cache[symbol]
-            if now - cached_at < self.cache_ttl:
-                return cached
-        
-        # Fetch fresh data
-        ext_symbol = self._convert_symbol(symbol)
+        while True:
+            now = time.time()
+            
+            with self._cache_lock:
+                # Check cache
+                cached = self._ticker_cache.get(symbol)
+                if cached and now - cached[1] < self.cache_ttl:
+                    self._ticker_cache.move_to_end(symbol)
+                    return cached[0]
+                
+                # Recently failed - don't hammer the API
+                failed = self._error_cache.get(symbol)
+                if failed and now - failed[1] < self.error_ttl:
+                    raise ExternalDataError(failed[0])
+                
+                # Join an in-flight fetch for this symbol, or start one
+                event = self._inflight.get(symbol)
+                is_leader = event is None
+                if is_leader:
+                    event = threading.Event()
+                    self._inflight[symbol] = event
+            
+            if not is_leader:
+                event.wait(timeout=15)
+                continue
+            
+            try:
+                ticker = self._fetch_ticker(symbol)
+            except ExternalDataError as e:
+                with self._cache_lock:
+                    self._error_cache[symbol] = (str(e), time.time())
+                raise
+            else:
+                with self._cache_lock:
+                    self._cache_ticker(symbol, ticker, now)
+                return ticker
+            finally:
+                with self._cache_lock:
+                    self._inflight.pop(symbol, None)
+                event.set()
+    
+    def _fetch_ticker(self, symbol: str) -> TickerInfo:
+        """Fetch a single ticker from the API (uncached)."""
+        ext_symbol = _convert_symbol(symbol)
         
         try:
             response = self._session.get(
-                f"{self.BASE_URL}/v5/market/tickers",
-                params={"category": "linear", "symbol": ext_symbol},
+                self._URL_TICKERS,
+                params=_ticker_params(ext_symbol),
                 timeout=10
             )
             response.raise_for_status()
@@ -136,33 +325,132 @@ class ExternalDataService:
             if not result_list:
                 raise ExternalDataError(f"No data found for {symbol}")
             
-            ticker_data = result_list[0]
-            
-            # Parse next funding time
-            next_funding_ts = int(ticker_data.get("nextFundingTime", 0))
-            next_funding_time = datetime.fromtimestamp(
-                next_funding_ts / 1000, tz=timezone.utc
-            ) if next_funding_ts else datetime.now(timezone.utc)
-            
-            ticker = TickerInfo(
-                symbol=symbol,
-                last_price=Decimal(ticker_data.get("lastPrice", "0")),
-                mark_price=Decimal(ticker_data.get("markPrice", "0")),
-                index_price=Decimal(ticker_data.get("indexPrice", "0")),
-                funding_rate=Decimal(ticker_data.get("fundingRate", "0")),
-                next_funding_time=next_funding_time,
-                open_interest=Decimal(ticker_data.get("openInterest", "0")),
-                volume_24h=Decimal(ticker_data.get("volume24h", "0")),
-            )
-            
-            # Cache it
-            self._ticker_cache[symbol] = (ticker, now)
+            ticker = _parse_ticker(symbol, result_list[0])
             logger.debug(f"Fetched ticker for {symbol}: mark={ticker.mark_price}, funding={ticker.funding_rate}")
             return ticker
             
         except requests.RequestException as e:
             raise ExternalDataError(f"Failed to fetch ticker for {symbol}: {e}")
     
+    def _cache_ticker(self, symbol: str, ticker: TickerInfo, fetched_at: float) -> None:
+        """Store a ticker in the LRU cache. Caller must hold ``_cache_lock``."""
+        self._error_cache.pop(symbol, None)
+        self._ticker_cache[symbol] = (ticker, fetched_at)
+        self._ticker_cache.move_to_end(symbol)
+        while len(self._ticker_cache) > self.cache_maxsize:
+            self._ticker_cache.popitem(last=False)
+    
+    def _fetch_all_tickers(self) -> Dict[str, Dict]:
+        """
+        Fetch every linear ticker in a single request (uncached).
+        
+        Returns:
+            Raw API ticker items keyed by external symbol; callers parse
+            only the ones they need, under their own symbol
+        """
+        try:
+            response = self._session.get(
+                self._URL_TICKERS,
+                params=_ALL_TICKERS_PARAMS,
+                timeout=10
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            if data.get("retCode") != 0:
+                raise ExternalDataError(f"API error: {data.get('retMsg')}")
+            
+            return {
+                item["symbol"]: item
+                for item in data.get("result", {}).get("list", [])
+                if item.get("symbol")
+            }
+            
+        except requests.RequestException as e:
+            raise ExternalDataError(f"Failed to fetch tickers: {e}")
+    
+    def prefetch_all_tickers(self) -> Dict[str, TickerInfo]:
+        """
+        Fetch all linear tickers in one request and populate the cache.
+        
+        Symbols already cached are refreshed. Other symbols are only added
+        while the cache has room, so a prefetch never evicts entries.
+        
+        Returns:
+            Dictionary mapping symbol to TickerInfo
+            
+        Raises:
+            ExternalDataError: If API request fails
+        """
+        tickers = {
+            symbol: _parse_ticker(symbol, item)
+            for symbol, item in self._fetch_all_tickers().items()
+        }
+        now = time.time()
+        
+        with self._cache_lock:
+            for symbol, ticker in tickers.items():
+                if symbol in self._ticker_cache or len(self._ticker_cache) < self.cache_maxsize:
+                    self._cache_ticker(symbol, ticker, now)
+        
+        logger.debug(f"Prefetched {len(tickers)} tickers")
+        return tickers
+    
+    def get_tickers(self, symbols: List[str]) -> Dict[str, TickerInfo]:
+        """
+        Get tickers for multiple symbols.
+        
+        Cached symbols are served from the cache. When at least
+        ``BATCH_THRESHOLD`` symbols miss the cache, all tickers are fetched
+        in a single request instead of one request per symbol.
+        
+        Args:
+            symbols: List of trading pairs
+            
+        Returns:
+            Dictionary mapping symbol to TickerInfo (failed symbols are skipped)
+        """
+        now = time.time()
+        tickers: Dict[str, TickerInfo] = {}
+        misses: List[str] = []
+        
+        with self._cache_lock:
+            for symbol in dict.fromkeys(symbols):
+                cached = self._ticker_cache.get(symbol)
+                if cached and now - cached[1] < self.cache_ttl:
+                    self._ticker_cache.move_to_end(symbol)
+                    tickers[symbol] = cached[0]
+                else:
+                    misses.append(symbol)
+        
+        if len(misses) >= self.BATCH_THRESHOLD:
+            try:
+                fetched = self._fetch_all_tickers()
+            except ExternalDataError as e:
+                logger.warning(f"Batch ticker fetch failed, falling back to per-symbol: {e}")
+                fetched = {}
+            
+            # Parse only the requested tickers, keyed by the caller's symbol
+            found = {}
+            for symbol in misses:
+                item = fetched.get(_convert_symbol(symbol))
+                if item is not None:
+                    found[symbol] = _parse_ticker(symbol, item)
+            
+            with self._cache_lock:
+                for symbol, ticker in found.items():
+                    self._cache_ticker(symbol, ticker, now)
+            tickers.update(found)
+            misses = [s for s in misses if s not in tickers]
+        
+        for symbol in misses:
+            try:
+                tickers[symbol] = self.get_ticker(symbol)
+            except ExternalDataError as e:
+                logger.warning(f"Failed to fetch ticker for {symbol}: {e}")
+        
+        return tickers
+    
     def get_mark_price(self, symbol: str) -> Decimal:
         """
         Get current mark price for a symbol.
@@ -177,6 +465,21 @@ class ExternalDataService:
         ticker = self.get_ticker(symbol)
         return ticker.mark_price
     
+    def get_mark_prices(self, symbols: List[str]) -> Dict[str, Decimal]:
+        """
+        Get mark prices for multiple symbols (batched via get_tickers()).
+        
+        Args:
+            symbols: List of trading pairs
+            
+        Returns:
+            Dictionary mapping symbol to mark price (failed symbols are skipped)
+        """
+        return {
+            symbol: ticker.mark_price
+            for symbol, ticker in self.get_tickers(symbols).items()
+        }
+    
     def get_funding_rate(self, symbol: str) -> Decimal:
         """
         Get current funding rate for a symbol.
@@ -237,16 +540,12 @@ class ExternalDataService:
         Returns:
             List of historical funding rate records
         """
-        ext_symbol = self._convert_symbol(symbol)
+        ext_symbol = _convert_symbol(symbol)
         
         try:
             response = self._session.get(
-                f"{self.BASE_URL}/v5/market/funding/history",
-                params={
-                    "category": "linear",
-                    "symbol": ext_symbol,
-                    "limit": min(limit, 200)
-                },
+                self._URL_FUNDING_HISTORY,
+                params=_funding_history_params(ext_symbol, min(limit, 200)),
                 timeout=10
             )
             response.raise_for_status()
@@ -255,22 +554,52 @@ class ExternalDataService:
             if data.get("retCode") != 0:
                 raise ExternalDataError(f"API error: {data.get('retMsg')}")
             
-            history = []
-            for item in data.get("result", {}).get("list", []):
-                history.append({
+            items = data.get("result", {}).get("list", [])
+            funding_times = _ms_to_datetimes(
+                item.get("fundingRateTimestamp", 0) for item in items
+            )
+            history = [
+                {
                     "symbol": symbol,
                     "funding_rate": Decimal(item.get("fundingRate", "0")),
-                    "funding_time": datetime.fromtimestamp(
-                        int(item.get("fundingRateTimestamp", 0)) / 1000,
-                        tz=timezone.utc
-                    ),
-                })
+                    "funding_time": funding_time,
+                }
+                for item, funding_time in zip(items, funding_times)
+            ]
             
             return history
             
         except requests.RequestException as e:
             raise ExternalDataError(f"Failed to fetch funding history: {e}")
     
+    def _fetch_kline_rows(self, symbol: str, interval: str, limit: int) -> List[List[str]]:
+        """
+        Fetch raw kline rows in chronological order.
+        
+        Row format: [timestamp, open, high, low, close, volume, turnover]
+        """
+        ext_symbol = _convert_symbol(symbol)
+        
+        try:
+            response = self._session.get(
+                self._URL_KLINE,
+                params=_kline_params(ext_symbol, interval, min(limit, 1000)),
+                timeout=10
+            )
+            response.raise_for_status()
+            data = response.json()
+            
+            if data.get("retCode") != 0:
+                raise ExternalDataError(f"API error: {data.get('retMsg')}")
+            
+            # Reverse to chronological order (API returns newest first)
+            rows = data.get("result", {}).get("list", [])
+            rows.reverse()
+            return rows
+            
+        except requests.RequestException as e:
+            raise ExternalDataError(f"Failed to fetch klines: {e}")
+    
     def get_klines(
         self,
         symbol: str,
@@ -288,49 +617,55 @@ class ExternalDataService:
         Returns:
             List of Kline objects in chronological order
         """
-        ext_symbol = self._convert_symbol(symbol)
-        
-        try:
-            response = self._session.get(
-                f"{self.BASE_URL}/v5/market/kline",
-                params={
-                    "category": "linear",
-                    "symbol": ext_symbol,
-                    "interval": interval,
-                    "limit": min(limit, 1000)
-                },
-                timeout=10
+        rows = self._fetch_kline_rows(symbol, interval, limit)
+        timestamps = _ms_to_datetimes(row[0] for row in rows)
+        return [
+            Kline(
+                timestamp=timestamp,
+                open=float(row[1]),
+                high=float(row[2]),
+                low=float(row[3]),
+                close=float(row[4]),
+                volume=float(row[5]),
             )
-            response.raise_for_status()
-            data = response.json()
-            
-            if data.get("retCode") != 0:
-                raise ExternalDataError(f"API error: {data.get('retMsg')}")
-            
-            klines = []
-            for item in data.get("result", {}).get("list", []):
-                # Format: [timestamp, open, high, low, close, volume, turnover]
-                klines.append(Kline(
-                    timestamp=datetime.fromtimestamp(
-                        int(item[0]) / 1000, tz=timezone.utc
-                    ),
-                    open=Decimal(item[1]),
-                    high=Decimal(item[2]),
-                    low=Decimal(item[3]),
-                    close=Decimal(item[4]),
-                    volume=Decimal(item[5]),
-                ))
-            
-            # Reverse to chronological order (API returns newest first)
-            klines.reverse()
-            return klines
+            for row, timestamp in zip(rows, timestamps)
+        ]
+    
+    def get_klines_frame(
+        self,
+        symbol: str,
+        interval: str = "15",  # minutes
+        limit: int = 200
+    ) -> "KlineFrame":
+        """
+        Get historical OHLCV data as columnar arrays.
+        
+        Preferred over get_klines() for backtesting: each column is one
+        contiguous float64 buffer instead of a list of per-bar objects.
+        
+        Args:
+            symbol: Trading pair (e.g., "BTCUSDT")
+            interval: Kline interval ("1", "5", "15", "60", "240", "D")
+            limit: Number of klines (max 1000)
             
-        except requests.RequestException as e:
-            raise ExternalDataError(f"Failed to fetch klines: {e}")
+        Returns:
+            KlineFrame in chronological order
+        """
+        rows = self._fetch_kline_rows(symbol, interval, limit)
+        return KlineFrame(
+            timestamps=array("q", [int(row[0]) for row in rows]),
+            opens=array("d", [float(row[1]) for row in rows]),
+            highs=array("d", [float(row[2]) for row in rows]),
+            lows=array("d", [float(row[3]) for row in rows]),
+            closes=array("d", [float(row[4]) for row in rows]),
+            volumes=array("d", [float(row[5]) for row in rows]),
+        )
     
     def clear_cache(self):
         """Clear all cached data."""
-        self._ticker_cache.clear()
+        with self._cache_lock:
+            self._ticker_cache.clear()
+            self._error_cache.clear()
         logger.debug("External data cache cleared")
 
 
@@ -411,10 +746,25 @@ class MockExternalDataService:
             raise ExternalDataError(f"No mock data for {symbol}. Call set_ticker() first.")
         return self._tickers[symbol]
     
+    def get_tickers(self, symbols: List[str]) -> Dict[str, TickerInfo]:
+        """Get tickers for multiple symbols (unknown symbols are skipped)."""
+        return {s: self._tickers[s] for s in symbols if s in self._tickers}
+    
+    def prefetch_all_tickers(self) -> Dict[str, TickerInfo]:
+        """Get all mock tickers."""
+        return dict(self._tickers)
+    
     def get_mark_price(self, symbol: str) -> Decimal:
         """Get mark price."""
         return self.get_ticker(symbol).mark_price
     
+    def get_mark_prices(self, symbols: List[str]) -> Dict[str, Decimal]:
+        """Get mark prices for multiple symbols."""
+        return {
+            symbol: ticker.mark_price
+            for symbol, ticker in self.get_tickers(symbols).items()
+        }
+    
     def get_funding_rate(self, symbol: str) -> Decimal:
         """Get funding rate."""
         return self.get_ticker(symbol).funding_rate
@@ -444,6 +794,12 @@ class MockExternalDataService:
         """Get klines."""
         return self._klines.get(symbol, [])[:limit]
     
+    def get_klines_frame(
+        self, symbol: str, interval: str = "15", limit: int = 200
+    ) -> KlineFrame:
+        """Get klines as a columnar frame."""
+        return KlineFrame.from_klines(self.get_klines(symbol, interval, limit))
+    
     def add_klines(self, symbol: str, klines: List[Kline]):
         """Add klines for a symbol."""
         if symbol not in self._klines:
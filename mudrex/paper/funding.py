@@ -17,25 +17,63 @@ Example:
 - Payment = $100,000 × 0.0001 = $10 (LONG pays $10)
 """
 
+import heapq
+from array import array
+import itertools
+import json
+import os
 import threading
 import time
-import uuid
+import weakref
 import logging
 from decimal import Decimal
 from datetime import datetime, timezone, timedelta
-from typing import Dict, Optional, List, Callable, Any, TYPE_CHECKING
+from typing import Dict, Iterable, Iterator, Optional, List, Set, Tuple, Callable, Any, TYPE_CHECKING
 from dataclasses import dataclass, field
 
 if TYPE_CHECKING:
     from .engine import PaperTradingEngine
-    from .external_data import ExternalDataService
+    from .external_data import ExternalDataService, FundingInfo
 
 logger = logging.getLogger(__name__)
 
+# ciso8601 (optional, `pip install mudrex-trading-sdk[speedups]`) parses the
+# ISO timestamps in saved state in C; fall back to the stdlib parser.
+try:
+    from ciso8601 import parse_datetime as _parse_iso
+except ImportError:
+    _parse_iso = datetime.fromisoformat
 
-@dataclass
+# orjson (optional, same extra) serializes to_state_bytes() faster than json.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _as_utc(dt: datetime) -> datetime:
+    """Treat naive datetimes (e.g. from datetime.utcnow()) as UTC."""
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+
+def _funding_epoch(value: Any) -> int:
+    """Saved funding time -> epoch seconds (older states stored ISO strings)."""
+    if isinstance(value, str):
+        return int(_as_utc(_parse_iso(value)).timestamp())
+    return int(value)
+
+
+@dataclass(frozen=True)
 class FundingPayment:
-    """Record of a funding payment."""
+    """Record of a funding payment (immutable once created)."""
+    # Hand-written __slots__ (dataclass(slots=True) is Python 3.10+); with
+    # frozen=True, pickling needs the explicit __getstate__/__setstate__ below.
+    __slots__ = (
+        "payment_id", "position_id", "symbol", "side", "funding_rate",
+        "position_value", "payment_amount", "payment_time", "mark_price",
+        "quantity",
+    )
+    
     payment_id: str
     position_id: str
     symbol: str
@@ -52,6 +90,13 @@ class FundingPayment:
         """Whether funding was received (vs paid)."""
         return self.payment_amount > 0
     
+    def __getstate__(self) -> Tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__(self, state: Tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+    
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
         return {
@@ -78,7 +123,7 @@ class FundingPayment:
             funding_rate=Decimal(data["funding_rate"]),
             position_value=Decimal(data["position_value"]),
             payment_amount=Decimal(data["payment_amount"]),
-            payment_time=datetime.fromisoformat(data["payment_time"]),
+            payment_time=_parse_iso(data["payment_time"]),
             mark_price=Decimal(data["mark_price"]),
             quantity=Decimal(data["quantity"]),
         )
@@ -100,6 +145,187 @@ class FundingStats:
         else:
             self.total_paid += abs(amount)
         self.net_funding = self.total_received - self.total_paid
+    
+    def add_batch(self, amounts: List[Decimal]) -> Decimal:
+        """
+        Add several payments to stats in one pass.
+        
+        Returns:
+            Net amount of the batch (received - paid)
+        """
+        received = Decimal("0")
+        paid = Decimal("0")
+        for amount in amounts:
+            if amount > 0:
+                received += amount
+            else:
+                paid -= amount
+        
+        self.payment_count += len(amounts)
+        self.total_received += received
+        self.total_paid += paid
+        self.net_funding = self.total_received - self.total_paid
+        return received - paid
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+class _PaymentLedger:
+    """
+    Column-oriented funding payment history.
+    
+    Each FundingPayment field is a column; payment times (epoch
+    microseconds, UTC) live in a typed array, amounts stay exact Decimals.
+    FundingPayment records are only built when a caller asks for them.
+    Row numbers per position and per symbol are indexed for lookups.
+    """
+    
+    def __init__(self):
+        self.payment_ids: List[str] = []
+        self.position_ids: List[str] = []
+        self.symbols: List[str] = []
+        self.sides: List[str] = []
+        self.funding_rates: List[Decimal] = []
+        self.position_values: List[Decimal] = []
+        self.amounts: List[Decimal] = []
+        self.times = array("q")
+        self.mark_prices: List[Decimal] = []
+        self.quantities: List[Decimal] = []
+        self.by_position: Dict[str, List[int]] = {}
+        self.by_symbol: Dict[str, List[int]] = {}
+    
+    def __len__(self) -> int:
+        return len(self.payment_ids)
+    
+    def extend(self, payments: Iterable[FundingPayment]) -> None:
+        """Append payments as new rows."""
+        row = len(self.payment_ids)
+        for payment in payments:
+            self.payment_ids.append(payment.payment_id)
+            self.position_ids.append(payment.position_id)
+            self.symbols.append(payment.symbol)
+            self.sides.append(payment.side)
+            self.funding_rates.append(payment.funding_rate)
+            self.position_values.append(payment.position_value)
+            self.amounts.append(payment.payment_amount)
+            self.times.append((_as_utc(payment.payment_time) - _EPOCH) // _MICROSECOND)
+            self.mark_prices.append(payment.mark_price)
+            self.quantities.append(payment.quantity)
+            self.by_position.setdefault(payment.position_id, []).append(row)
+            self.by_symbol.setdefault(payment.symbol, []).append(row)
+            row += 1
+    
+    def row(self, i: int) -> FundingPayment:
+        """Build the FundingPayment record for row i."""
+        return FundingPayment(
+            payment_id=self.payment_ids[i],
+            position_id=self.position_ids[i],
+            symbol=self.symbols[i],
+            side=self.sides[i],
+            funding_rate=self.funding_rates[i],
+            position_value=self.position_values[i],
+            payment_amount=self.amounts[i],
+            payment_time=_EPOCH + self.times[i] * _MICROSECOND,
+            mark_price=self.mark_prices[i],
+            quantity=self.quantities[i],
+        )
+    
+    def rows(self, indices: Iterable[int]) -> List[FundingPayment]:
+        """Build FundingPayment records for the given rows."""
+        return [self.row(i) for i in indices]
+    
+    def iter_dicts(self) -> Iterator[Dict]:
+        """Yield every row in FundingPayment.to_dict() form, straight from the columns."""
+        for i in range(len(self.payment_ids)):
+            yield {
+                "payment_id": self.payment_ids[i],
+                "position_id": self.position_ids[i],
+                "symbol": self.symbols[i],
+                "side": self.sides[i],
+                "funding_rate": str(self.funding_rates[i]),
+                "position_value": str(self.position_values[i]),
+                "payment_amount": str(self.amounts[i]),
+                "payment_time": (_EPOCH + self.times[i] * _MICROSECOND).isoformat(),
+                "mark_price": str(self.mark_prices[i]),
+                "quantity": str(self.quantities[i]),
+            }
+
+
+class _FundingScheduler:
+    """
+    Single background thread that runs every started FundingMonitor.
+    
+    Monitors are kept in a heap ordered by when their next cycle is due, so
+    any number of monitors costs one mostly-sleeping thread. Entries hold
+    weak references and a start token; entries left over from a stopped
+    (or garbage-collected) monitor are dropped when they come due. Started
+    monitors are also held strongly, so one the caller stops referencing
+    keeps running until stop() releases it.
+    """
+    
+    def __init__(self):
+        self._heap: List[Tuple[float, int, "weakref.ref[FundingMonitor]", int]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._started: Set["FundingMonitor"] = set()
+    
+    def hold(self, monitor: "FundingMonitor"):
+        """Keep a started monitor alive until release()."""
+        with self._cond:
+            self._started.add(monitor)
+    
+    def release(self, monitor: "FundingMonitor"):
+        """Drop the reference taken by hold()."""
+        with self._cond:
+            self._started.discard(monitor)
+    
+    def schedule(self, monitor: "FundingMonitor", due: float, token: int):
+        """Run monitor's next cycle at epoch time ``due``."""
+        with self._cond:
+            heapq.heappush(self._heap, (due, next(self._seq), weakref.ref(monitor), token))
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name="FundingScheduler",
+                    daemon=True
+                )
+                self._thread.start()
+            self._cond.notify()
+    
+    def _run(self):
+        """Scheduler loop: sleep until the earliest entry is due, then run it."""
+        while True:
+            with self._cond:
+                while not self._heap:
+                    self._cond.wait()
+                due, _, monitor_ref, token = self._heap[0]
+                delay = due - time.time()
+                if delay > 0:
+                    self._cond.wait(delay)
+                    continue
+                heapq.heappop(self._heap)
+            
+            monitor = monitor_ref()
+            if monitor is not None and monitor._is_current(token):
+                self.schedule(monitor, monitor._run_cycle(), token)
+            # Don't pin the monitor while sleeping until the next entry
+            del monitor
+
+
+_scheduler: Optional[_FundingScheduler] = None
+_scheduler_lock = threading.Lock()
+
+
+def _get_scheduler() -> _FundingScheduler:
+    """Get the shared funding scheduler, creating it on first use."""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = _FundingScheduler()
+        return _scheduler
 
 
 class FundingMonitor:
@@ -122,11 +348,14 @@ class FundingMonitor:
     # Standard funding hours (UTC)
     FUNDING_HOURS = [0, 8, 16]
     
+    # Seconds between funding times (FUNDING_HOURS are multiples of this)
+    FUNDING_INTERVAL = 8 * 3600
+    
     def __init__(
         self,
         engine: "PaperTradingEngine",
         external_data: "ExternalDataService",
-        check_interval: int = 60,  # Check every minute
+        check_interval: Optional[int] = None,  # Max sleep between checks
         enabled: bool = True,
         on_funding_payment: Optional[Callable[[FundingPayment], None]] = None,
     ):
@@ -136,7 +365,9 @@ class FundingMonitor:
         Args:
             engine: Paper trading engine to apply payments to
             external_data: External data service for funding rates
-            check_interval: How often to check for funding (seconds)
+            check_interval: Optional cap on how long the monitor sleeps
+                between checks (seconds). By default it sleeps until the
+                next funding time.
             enabled: Whether funding is enabled
             on_funding_payment: Optional callback when funding is paid/received
         """
@@ -147,14 +378,22 @@ class FundingMonitor:
         self._on_funding_payment = on_funding_payment
         
         self._running = False
-        self._thread: Optional[threading.Thread] = None
+        # Bumped on every start/stop so stale scheduler entries are ignored
+        self._run_token = 0
         self._lock = threading.Lock()
         
         # Track last processed funding time per position
-        self._last_funding_time: Dict[str, datetime] = {}
+        # (epoch seconds; funding times are whole multiples of FUNDING_INTERVAL)
+        self._last_funding_time: Dict[str, int] = {}
         
         # Payment history
-        self._payments: List[FundingPayment] = []
+        self._ledger = _PaymentLedger()
+        # Payment IDs: random per-monitor prefix + counter (unique across
+        # restarts without hitting the OS RNG for every payment)
+        self._monitor_id = os.urandom(4).hex()
+        self._payment_counter = itertools.count(1)
+        # Read-only snapshot handed out by `payments`; None once stale
+        self._payments_snapshot: Optional[Tuple[FundingPayment, ...]] = None
         self._stats = FundingStats()
     
     @property
@@ -173,9 +412,13 @@ class FundingMonitor:
         return self._running
     
     @property
-    def payments(self) -> List[FundingPayment]:
-        """Get all funding payments."""
-        return self._payments.copy()
+    def payments(self) -> Tuple[FundingPayment, ...]:
+        """Get all funding payments (snapshot rebuilt only after changes)."""
+        snapshot = self._payments_snapshot
+        if snapshot is None:
+            ledger = self._ledger
+            snapshot = self._payments_snapshot = tuple(ledger.rows(range(len(ledger))))
+        return snapshot
     
     @property
     def stats(self) -> FundingStats:
@@ -189,32 +432,53 @@ class FundingMonitor:
             return
         
         self._running = True
-        self._thread = threading.Thread(
-            target=self._monitor_loop,
-            name="FundingMonitor",
-            daemon=True
-        )
-        self._thread.start()
+        self._run_token += 1
+        scheduler = _get_scheduler()
+        scheduler.hold(self)
+        scheduler.schedule(self, time.time(), self._run_token)
         logger.info("Funding monitor started")
     
     def stop(self):
         """Stop the background funding monitor."""
         self._running = False
-        if self._thread:
-            self._thread.join(timeout=5)
-            self._thread = None
+        self._run_token += 1
+        _get_scheduler().release(self)
         logger.info("Funding monitor stopped")
     
-    def _monitor_loop(self):
-        """Main monitoring loop."""
-        while self._running:
-            try:
-                if self._enabled:
-                    self._process_funding()
-            except Exception as e:
-                logger.error(f"Error in funding monitor: {e}")
-            
-            time.sleep(self._check_interval)
+    def _is_current(self, token: int) -> bool:
+        """Whether a scheduler entry with this token belongs to the current run."""
+        return self._running and token == self._run_token
+    
+    def _run_cycle(self) -> float:
+        """
+        Run one funding check (called by the shared scheduler thread).
+        
+        Returns:
+            Epoch time of the next check: just past the next funding time,
+            capped by check_interval if set
+        """
+        try:
+            if self._enabled:
+                self._process_funding()
+        except Exception as e:
+            logger.error(f"Error in funding monitor: {e}")
+        
+        now = datetime.now(timezone.utc)
+        delay = self._seconds_until_next_funding(now) + 1
+        if self._check_interval is not None:
+            delay = min(delay, self._check_interval)
+        return now.timestamp() + delay
+    
+    def _seconds_until_next_funding(self, now: datetime) -> float:
+        """Seconds from now until the next funding time (UTC)."""
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        for hour in self.FUNDING_HOURS:
+            funding_time = midnight.replace(hour=hour)
+            if funding_time > now:
+                break
+        else:
+            funding_time = midnight + timedelta(days=1, hours=self.FUNDING_HOURS[0])
+        return (funding_time - now).total_seconds()
     
     def _process_funding(self):
         """Check and process funding for all open positions."""
@@ -224,88 +488,122 @@ class FundingMonitor:
         
         now = datetime.now(timezone.utc)
         
+        # Funding info fetched this cycle, so each symbol is requested once
+        funding_cache: Dict[str, "FundingInfo"] = {}
+        payments: List[FundingPayment] = []
+        
         for position in positions:
             try:
-                self._process_position_funding(position, now)
+                payments.extend(
+                    self._process_position_funding(position, now, funding_cache)
+                )
             except Exception as e:
                 logger.error(f"Error processing funding for {position.position_id}: {e}")
+        
+        self._commit_payments(payments)
     
-    def _process_position_funding(self, position: Any, now: datetime):
-        """Process funding for a single position."""
+    def _get_cycle_funding_info(
+        self,
+        symbol: str,
+        funding_cache: Dict[str, "FundingInfo"],
+    ) -> "FundingInfo":
+        """Get funding info for a symbol, fetching it at most once per cycle."""
+        funding_info = funding_cache.get(symbol)
+        if funding_info is None:
+            funding_info = self._external_data.get_funding_info(symbol)
+            funding_cache[symbol] = funding_info
+        return funding_info
+    
+    def _process_position_funding(
+        self,
+        position: Any,
+        now: datetime,
+        funding_cache: Optional[Dict[str, "FundingInfo"]] = None,
+    ) -> List[FundingPayment]:
+        """
+        Calculate funding owed by a single position since it was last settled.
+        
+        Returns the payments without applying them; see _commit_payments().
+        """
+        if funding_cache is None:
+            funding_cache = {}
+        
         # Get the last funding time we processed for this position
         last_processed = self._last_funding_time.get(position.position_id)
         
         # Find all funding times that should have occurred since position opened
-        # or since last processed
-        start_time = last_processed or position.opened_at
+        # or since last processed (both exclusive, so nothing is paid twice)
+        if last_processed is not None:
+            start_ts = last_processed
+        else:
+            start_ts = _as_utc(position.opened_at).timestamp()
         
-        # Get funding times between start_time and now
-        funding_times = self._get_funding_times_between(start_time, now)
+        # Nothing is due until the first funding time after start; most calls
+        # (fresh or just-settled positions) stop here
+        now_ts = now.timestamp()
+        interval = self.FUNDING_INTERVAL
+        if now_ts < (int(start_ts) // interval + 1) * interval:
+            return []
         
-        if not funding_times:
-            return
+        # Get funding info
+        try:
+            funding_info = self._get_cycle_funding_info(position.symbol, funding_cache)
+        except Exception as e:
+            logger.warning(f"Failed to get funding info for {position.symbol}: {e}")
+            return []
+        
+        # Every missed funding time settles at the current rate and mark
+        # price, so the amounts are computed once for all of them
+        amounts = self._calculate_funding_amounts(
+            position, funding_info.funding_rate, funding_info.mark_price
+        )
+        
+        # Get funding times between start and now
+        funding_times = self._get_funding_times_between(start_ts, now_ts)
+        payments: List[FundingPayment] = []
         
         # Process each funding time
-        for funding_time in funding_times:
-            # Skip if already processed
-            if last_processed and funding_time <= last_processed:
-                continue
-            
-            # Get funding info
-            try:
-                funding_info = self._external_data.get_funding_info(position.symbol)
-            except Exception as e:
-                logger.warning(f"Failed to get funding info for {position.symbol}: {e}")
-                continue
-            
+        for funding_ts in funding_times:
             # Calculate payment
             payment = self._calculate_funding_payment(
                 position=position,
                 funding_rate=funding_info.funding_rate,
                 mark_price=funding_info.mark_price,
-                funding_time=funding_time,
+                funding_time=datetime.fromtimestamp(funding_ts, tz=timezone.utc),
+                amounts=amounts,
             )
             
-            # Apply payment
-            self._apply_funding_payment(payment)
+            payments.append(payment)
             
             # Update last processed time
-            self._last_funding_time[position.position_id] = funding_time
+            self._last_funding_time[position.position_id] = funding_ts
             
             logger.info(
-                f"Funding payment: {position.symbol} {position.side.value} "
+                f"Funding payment: {position.symbol} {position.side} "
                 f"rate={funding_info.funding_rate:.6f} amount={payment.payment_amount:.4f}"
             )
-    
-    def _get_funding_times_between(
-        self, 
-        start: datetime, 
-        end: datetime
-    ) -> List[datetime]:
-        """Get all funding times between start and end."""
-        funding_times = []
         
-        # Start from the beginning of the start day
-        current = start.replace(hour=0, minute=0, second=0, microsecond=0)
-        
-        while current <= end:
-            for hour in self.FUNDING_HOURS:
-                funding_time = current.replace(hour=hour)
-                if start < funding_time <= end:
-                    funding_times.append(funding_time)
-            current += timedelta(days=1)
+        return payments
+    
+    def _get_funding_times_between(self, start: float, end: float) -> range:
+        """
+        Get all funding times in (start, end] as epoch seconds, oldest first.
         
-        return sorted(funding_times)
+        Funding times are every FUNDING_INTERVAL seconds from the epoch, so
+        they are generated arithmetically.
+        """
+        interval = self.FUNDING_INTERVAL
+        first = (int(start) // interval + 1) * interval
+        return range(first, int(end) + 1, interval)
     
-    def _calculate_funding_payment(
+    def _calculate_funding_amounts(
         self,
         position: Any,
         funding_rate: Decimal,
         mark_price: Decimal,
-        funding_time: datetime,
-    ) -> FundingPayment:
+    ) -> Tuple[Decimal, Decimal]:
         """
-        Calculate funding payment for a position.
+        Calculate (position value, payment amount) for a position.
         
         Funding formula:
         - Position Value = Quantity × Mark Price
@@ -318,23 +616,36 @@ class FundingMonitor:
         - Negative rate + SHORT = pay (negative payment)
         """
         position_value = position.quantity * mark_price
-        raw_payment = position_value * funding_rate
+        payment = position_value * funding_rate
         
-        # Determine payment direction based on position side
-        is_long = position.side.value == "LONG"
+        # The payment carries the rate's sign, so LONG always pays it and
+        # SHORT receives it (a negative rate therefore credits LONG)
+        return position_value, (-payment if position.is_long else payment)
+    
+    def _calculate_funding_payment(
+        self,
+        position: Any,
+        funding_rate: Decimal,
+        mark_price: Decimal,
+        funding_time: datetime,
+        amounts: Optional[Tuple[Decimal, Decimal]] = None,
+    ) -> FundingPayment:
+        """
+        Build the funding payment record for a position.
         
-        if funding_rate > 0:
-            # Positive rate: LONG pays, SHORT receives
-            payment_amount = -raw_payment if is_long else raw_payment
-        else:
-            # Negative rate: SHORT pays, LONG receives
-            payment_amount = raw_payment if is_long else -raw_payment
+        Args:
+            amounts: Precomputed result of _calculate_funding_amounts() for
+                the same position, rate and mark price
+        """
+        if amounts is None:
+            amounts = self._calculate_funding_amounts(position, funding_rate, mark_price)
+        position_value, payment_amount = amounts
         
         return FundingPayment(
-            payment_id=f"fund_{uuid.uuid4().hex[:12]}",
+            payment_id=f"fund_{self._monitor_id}_{next(self._payment_counter):06x}",
             position_id=position.position_id,
             symbol=position.symbol,
-            side=position.side.value,
+            side=position.side,
             funding_rate=funding_rate,
             position_value=position_value,
             payment_amount=payment_amount,
@@ -343,26 +654,37 @@ class FundingMonitor:
             quantity=position.quantity,
         )
     
-    def _apply_funding_payment(self, payment: FundingPayment):
-        """Apply a funding payment to the engine."""
+    def _commit_payments(self, payments: List[FundingPayment]):
+        """
+        Apply funding payments to the engine.
+        
+        All payments are applied under a single lock acquisition with one
+        wallet update; callbacks run afterwards, outside the lock.
+        """
+        if not payments:
+            return
+        
         with self._lock:
-            # Apply to wallet balance
-            self._engine._wallet.balance += payment.payment_amount
+            positions = self._engine.positions
             
-            # Track in position's cumulative funding
-            for pos in self._engine._positions.values():
-                if pos.position_id == payment.position_id:
-                    if not hasattr(pos, 'cumulative_funding'):
-                        pos.cumulative_funding = Decimal("0")
+            for payment in payments:
+                # Track in position's cumulative funding (positions are keyed by ID)
+                pos = positions.get(payment.position_id)
+                if pos is not None:
                     pos.cumulative_funding += payment.payment_amount
-                    break
             
-            # Record payment
-            self._payments.append(payment)
-            self._stats.add_payment(payment.payment_amount)
+            wallet_delta = self._stats.add_batch([p.payment_amount for p in payments])
+            
+            # Apply to wallet balance
+            self._engine.wallet.balance += wallet_delta
             
-            # Callback
-            if self._on_funding_payment:
+            # Record payments
+            self._ledger.extend(payments)
+            self._payments_snapshot = None
+        
+        # Callbacks
+        if self._on_funding_payment:
+            for payment in payments:
                 try:
                     self._on_funding_payment(payment)
                 except Exception as e:
@@ -386,10 +708,11 @@ class FundingMonitor:
             positions = [p for p in positions if p.symbol == symbol]
         
         now = datetime.now(timezone.utc)
+        funding_cache: Dict[str, "FundingInfo"] = {}
         
         for position in positions:
             try:
-                funding_info = self._external_data.get_funding_info(position.symbol)
+                funding_info = self._get_cycle_funding_info(position.symbol, funding_cache)
                 
                 payment = self._calculate_funding_payment(
                     position=position,
@@ -398,21 +721,21 @@ class FundingMonitor:
                     funding_time=now,
                 )
                 
-                self._apply_funding_payment(payment)
                 payments.append(payment)
                 
             except Exception as e:
                 logger.error(f"Error processing manual funding for {position.position_id}: {e}")
         
+        self._commit_payments(payments)
         return payments
     
     def get_position_funding(self, position_id: str) -> List[FundingPayment]:
         """Get all funding payments for a specific position."""
-        return [p for p in self._payments if p.position_id == position_id]
+        return self._ledger.rows(self._ledger.by_position.get(position_id, ()))
     
     def get_symbol_funding(self, symbol: str) -> List[FundingPayment]:
         """Get all funding payments for a specific symbol."""
-        return [p for p in self._payments if p.symbol == symbol]
+        return self._ledger.rows(self._ledger.by_symbol.get(symbol, ()))
     
     def get_total_funding(self) -> Decimal:
         """Get net total funding (received - paid)."""
@@ -421,17 +744,17 @@ class FundingMonitor:
     def clear_history(self):
         """Clear funding payment history and reset stats."""
         with self._lock:
-            self._payments.clear()
+            self._ledger = _PaymentLedger()
+            self._payments_snapshot = None
             self._last_funding_time.clear()
             self._stats = FundingStats()
     
     def to_state(self) -> Dict:
         """Serialize state for persistence."""
         return {
-            "payments": [p.to_dict() for p in self._payments],
-            "last_funding_time": {
-                k: v.isoformat() for k, v in self._last_funding_time.items()
-            },
+            "payments": list(self._ledger.iter_dicts()),
+            # Epoch seconds per position
+            "last_funding_time": dict(self._last_funding_time),
             "stats": {
                 "total_paid": str(self._stats.total_paid),
                 "total_received": str(self._stats.total_received),
@@ -440,13 +763,25 @@ class FundingMonitor:
             },
         }
     
+    def to_state_bytes(self) -> bytes:
+        """
+        Serialize state straight to JSON bytes.
+        
+        Uses orjson when installed, otherwise the stdlib json module. The
+        result loads back with json.loads() into a from_state() dict.
+        """
+        state = self.to_state()
+        if _orjson is not None:
+            return _orjson.dumps(state)
+        return json.dumps(state, separators=(",", ":")).encode()
+    
     def from_state(self, state: Dict):
         """Restore state from persistence."""
-        self._payments = [
-            FundingPayment.from_dict(p) for p in state.get("payments", [])
-        ]
+        self._ledger = _PaymentLedger()
+        self._ledger.extend(map(FundingPayment.from_dict, state.get("payments", [])))
+        self._payments_snapshot = None
         self._last_funding_time = {
-            k: datetime.fromisoformat(v) 
+            k: _funding_epoch(v)
             for k, v in state.get("last_funding_time", {}).items()
         }
         
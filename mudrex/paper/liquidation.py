@@ -19,21 +19,48 @@ Liquidation Fees:
 """
 
 import threading
-import time
 import uuid
 import logging
+import queue
+from bisect import bisect_left, bisect_right
+from collections import deque
 from decimal import Decimal
-from datetime import datetime, timezone
-from typing import Dict, Optional, List, Callable, Any, TYPE_CHECKING
+from datetime import datetime, timedelta, timezone
+from typing import Dict, NamedTuple, Optional, List, Tuple, Callable, Any, TYPE_CHECKING
 from dataclasses import dataclass
 from enum import Enum
 
+from ._fixed import SCALE, div_round, to_scaled
+from .exceptions import PositionAlreadyClosedError
+from .models import PaperPositionStatus
+
 if TYPE_CHECKING:
     from .engine import PaperTradingEngine
     from .external_data import ExternalDataService
 
 logger = logging.getLogger(__name__)
 
+# Decimal constants, parsed once
+_ZERO = Decimal("0")
+_SAFE_MARGIN_RATIO = Decimal("999")  # Reported when there is no maintenance margin
+
+
+# Event timestamps are serialized as integer nanoseconds since the epoch
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_epoch_ns(dt: datetime) -> int:
+    """datetime (naive = UTC) -> nanoseconds since the epoch, exactly."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _MICROSECOND * 1000
+
+
+def _from_epoch_ns(ns: int) -> datetime:
+    """Nanoseconds since the epoch -> aware UTC datetime (microsecond precision)."""
+    return _EPOCH + (ns // 1000) * _MICROSECOND
+
 
 class LiquidationReason(Enum):
     """Reason for liquidation."""
@@ -42,9 +69,25 @@ class LiquidationReason(Enum):
     BANKRUPTCY = "bankruptcy"  # Position value went negative
 
 
-@dataclass
+# LiquidationEvent fields serialized with str()
+_EVENT_DECIMAL_FIELDS = (
+    "entry_price", "liquidation_price", "mark_price_at_liq", "quantity",
+    "margin_lost", "liquidation_fee", "remaining_margin",
+)
+
+
+@dataclass(frozen=True)
 class LiquidationEvent:
-    """Record of a liquidation event."""
+    """Record of a liquidation event (immutable once created)."""
+    # Hand-written __slots__ (dataclass(slots=True) is Python 3.10+). The
+    # trailing "_total_loss" and "_dict" slots are derived caches, not fields.
+    __slots__ = (
+        "liquidation_id", "position_id", "symbol", "side", "reason",
+        "entry_price", "liquidation_price", "mark_price_at_liq", "quantity",
+        "margin_lost", "liquidation_fee", "remaining_margin",
+        "liquidation_time", "leverage", "_total_loss", "_dict",
+    )
+    
     liquidation_id: str
     position_id: str
     symbol: str
@@ -60,34 +103,51 @@ class LiquidationEvent:
     liquidation_time: datetime
     leverage: int
     
+    def __post_init__(self):
+        object.__setattr__(self, "_total_loss", self.margin_lost + self.liquidation_fee)
+    
     @property
     def total_loss(self) -> Decimal:
         """Total loss from liquidation."""
-        return self.margin_lost + self.liquidation_fee
+        return self._total_loss
+    
+    def __getstate__(self) -> Tuple:
+        return tuple(getattr(self, name) for name in self.__slots__[:-2])
+    
+    def __setstate__(self, state: Tuple) -> None:
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+        self.__post_init__()
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for serialization."""
-        return {
+        try:
+            data = self._dict
+        except AttributeError:
+            data = self._build_dict()
+            object.__setattr__(self, "_dict", data)
+        return dict(data)
+    
+    def _build_dict(self, decimal_strs: Optional[Dict[str, str]] = None) -> Dict:
+        data = {
             "liquidation_id": self.liquidation_id,
             "position_id": self.position_id,
             "symbol": self.symbol,
             "side": self.side,
             "reason": self.reason.value,
-            "entry_price": str(self.entry_price),
-            "liquidation_price": str(self.liquidation_price),
-            "mark_price_at_liq": str(self.mark_price_at_liq),
-            "quantity": str(self.quantity),
-            "margin_lost": str(self.margin_lost),
-            "liquidation_fee": str(self.liquidation_fee),
-            "remaining_margin": str(self.remaining_margin),
-            "liquidation_time": self.liquidation_time.isoformat(),
-            "leverage": self.leverage,
         }
+        if decimal_strs is None:
+            decimal_strs = {name: str(getattr(self, name)) for name in _EVENT_DECIMAL_FIELDS}
+        data.update(decimal_strs)
+        data["liquidation_time"] = self.liquidation_time.isoformat()
+        data["liquidation_time_ns"] = _to_epoch_ns(self.liquidation_time)
+        data["leverage"] = self.leverage
+        return data
     
     @classmethod
     def from_dict(cls, data: Dict) -> "LiquidationEvent":
         """Create from dictionary."""
-        return cls(
+        event = cls(
             liquidation_id=data["liquidation_id"],
             position_id=data["position_id"],
             symbol=data["symbol"],
@@ -100,14 +160,33 @@ class LiquidationEvent:
             margin_lost=Decimal(data["margin_lost"]),
             liquidation_fee=Decimal(data["liquidation_fee"]),
             remaining_margin=Decimal(data["remaining_margin"]),
-            liquidation_time=datetime.fromisoformat(data["liquidation_time"]),
+            liquidation_time=(
+                _from_epoch_ns(data["liquidation_time_ns"])
+                if "liquidation_time_ns" in data
+                # States saved before epoch timestamps hold only the ISO string
+                else datetime.fromisoformat(data["liquidation_time"])
+            ),
             leverage=data["leverage"],
         )
+        
+        # str(Decimal(s)) == s for the strings to_dict() writes, so a restored
+        # event reuses them instead of converting its Decimals back
+        decimal_strs = {name: data[name] for name in _EVENT_DECIMAL_FIELDS}
+        if all(type(value) is str for value in decimal_strs.values()):
+            object.__setattr__(event, "_dict", event._build_dict(decimal_strs))
+        return event
 
 
 @dataclass
 class MarginStatus:
     """Current margin status for a position."""
+    __slots__ = (
+        "position_id", "symbol", "side", "entry_price", "mark_price",
+        "quantity", "leverage", "initial_margin", "maintenance_margin",
+        "unrealized_pnl", "margin_balance", "margin_ratio",
+        "liquidation_price", "is_at_risk", "is_liquidatable", "distance_to_liq",
+    )
+    
     position_id: str
     symbol: str
     side: str
@@ -128,6 +207,38 @@ class MarginStatus:
     distance_to_liq: Decimal  # percentage distance to liquidation price
 
 
+class _MarginFactors(NamedTuple):
+    """
+    Per-position margin terms; they only change with entry, size or leverage.
+    
+    The Decimal margins feed MarginStatus and liquidation events. The scaled
+    integers (``_fp``: SCALE, ``2``: SCALE**2) only screen positions and
+    order the liquidation index; they are exact for prices and quantities
+    with at most 8 decimal places.
+    """
+    entry_price: Decimal
+    quantity: Decimal
+    leverage: int
+    is_long: bool
+    sign: int  # +1 for LONG, -1 for SHORT
+    initial_margin: Decimal
+    maintenance_margin: Decimal
+    entry_fp: int
+    qty_fp: int
+    initial2: int  # Initial margin, scaled by SCALE**2
+    maintenance2: int  # Maintenance margin, scaled by SCALE**2
+    liq_cents: int  # Liquidation price in cents
+    flag_fp: int  # Scaled mark price beyond which the position needs a full check
+
+
+class _LiquidationIndex(NamedTuple):
+    """One symbol's open positions, sorted by liquidation price (cents)."""
+    long_cents: List[int]
+    long_ids: List[str]
+    short_cents: List[int]
+    short_ids: List[str]
+
+
 class LiquidationEngine:
     """
     Liquidation engine for paper trading.
@@ -155,6 +266,15 @@ class LiquidationEngine:
     DEFAULT_LIQ_FEE = Decimal("0.005")  # 0.5% liquidation fee
     DEFAULT_WARNING_THRESHOLD = Decimal("1.5")  # Warn at 150% margin ratio
     
+    # Poll backoff: (minimum margin ratio above which it applies, multiplier
+    # for check_interval). Below the last step the monitor polls at 0.05x.
+    CHECK_BACKOFF = (
+        (Decimal("5"), 4.0),
+        (Decimal("2"), 1.0),
+        (Decimal("1.2"), 0.25),
+    )
+    MIN_CHECK_FACTOR = 0.05
+    
     def __init__(
         self,
         engine: "PaperTradingEngine",
@@ -166,6 +286,7 @@ class LiquidationEngine:
         enabled: bool = True,
         on_liquidation: Optional[Callable[[LiquidationEvent], None]] = None,
         on_margin_warning: Optional[Callable[[MarginStatus], None]] = None,
+        max_history: Optional[int] = 100_000,
     ):
         """
         Initialize the liquidation engine.
@@ -176,16 +297,24 @@ class LiquidationEngine:
             maintenance_margin_rate: MMR for liquidation calc (default 0.5%)
             liquidation_fee_rate: Fee charged on liquidation (default 0.5%)
             warning_threshold: Margin ratio threshold for warnings (default 1.5)
-            check_interval: How often to check positions (seconds)
+            check_interval: Base interval between position checks (seconds);
+                scaled by CHECK_BACKOFF with the lowest margin ratio seen
             enabled: Whether liquidation is enabled
-            on_liquidation: Callback when position is liquidated
+            on_liquidation: Callback when position is liquidated. While the
+                engine is running it is called from a separate callback
+                thread, so a slow callback does not delay monitoring; events
+                still queued if the process dies are lost.
             on_margin_warning: Callback when position is at risk
+            max_history: Liquidation events to keep (oldest dropped first;
+                None for unbounded)
         """
         self._engine = engine
         self._external_data = external_data
         self._mmr = maintenance_margin_rate or self.DEFAULT_MMR
         self._liq_fee_rate = liquidation_fee_rate or self.DEFAULT_LIQ_FEE
         self._warning_threshold = warning_threshold or self.DEFAULT_WARNING_THRESHOLD
+        self._mmr_fp = to_scaled(self._mmr)
+        self._warning_fp = to_scaled(self._warning_threshold)
         self._check_interval = check_interval
         self._enabled = enabled
         self._on_liquidation = on_liquidation
@@ -194,12 +323,34 @@ class LiquidationEngine:
         self._running = False
         self._thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
+        self._wake_event = threading.Event()
+        self._backoff_fp = [(to_scaled(ratio), factor) for ratio, factor in self.CHECK_BACKOFF]
+        
+        # on_liquidation runs on its own thread while started (see start())
+        self._callback_queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._callback_thread: Optional[threading.Thread] = None
         
         # Track warned positions to avoid duplicate warnings
         self._warned_positions: set = set()
         
+        # Positions a thread is liquidating right now (guarded by _lock)
+        self._liquidating: set = set()
+        
         # Liquidation history
-        self._liquidations: List[LiquidationEvent] = []
+        self._liquidations: "deque[LiquidationEvent]" = deque(maxlen=max_history)
+        
+        # Running sum of total_loss (also counts events dropped from history)
+        self._total_liq_loss = _ZERO
+        
+        # Cached margin factors per position_id (see _margin_factors)
+        self._factor_cache: Dict[str, _MarginFactors] = {}
+        
+        # Liquidation prices by symbol for on_mark_price(), rebuilt each poll
+        self._liq_index: Dict[str, _LiquidationIndex] = {}
+        
+        # Open positions as of engine.positions_version (see _open_positions)
+        self._open_positions: List[Any] = []
+        self._positions_version: Optional[int] = None
     
     @property
     def enabled(self) -> bool:
@@ -219,7 +370,7 @@ class LiquidationEngine:
     @property
     def liquidations(self) -> List[LiquidationEvent]:
         """Get all liquidation events."""
-        return self._liquidations.copy()
+        return list(self._liquidations)
     
     @property
     def maintenance_margin_rate(self) -> Decimal:
@@ -238,51 +389,246 @@ class LiquidationEngine:
             return
         
         self._running = True
+        self._wake_event.clear()
         self._thread = threading.Thread(
             target=self._monitor_loop,
             name="LiquidationEngine",
             daemon=True
         )
         self._thread.start()
+        
+        if self._on_liquidation:
+            self._callback_thread = threading.Thread(
+                target=self._callback_loop,
+                name="LiquidationCallbacks",
+                daemon=True
+            )
+            self._callback_thread.start()
         logger.info("Liquidation engine started")
     
     def stop(self):
         """Stop the background liquidation monitor."""
         self._running = False
+        self._wake_event.set()
         if self._thread:
             self._thread.join(timeout=5)
             self._thread = None
+        if self._callback_thread:
+            # Sentinel: the worker delivers everything queued before it, then exits
+            self._callback_queue.put(None)
+            self._callback_thread.join(timeout=5)
+            self._callback_thread = None
         logger.info("Liquidation engine stopped")
     
+    def _callback_loop(self):
+        """Deliver queued liquidation events to on_liquidation."""
+        while True:
+            event = self._callback_queue.get()
+            if event is None:
+                return
+            self._run_liquidation_callback(event)
+    
+    def _run_liquidation_callback(self, event: LiquidationEvent):
+        """Invoke on_liquidation, logging (not raising) its errors."""
+        try:
+            self._on_liquidation(event)
+        except Exception as e:
+            logger.error(f"Error in liquidation callback: {e}")
+    
+    def wake(self):
+        """
+        Re-check positions now instead of waiting out the current interval.
+        
+        Call after opening or resizing a position while the monitor is
+        backed off.
+        """
+        self._wake_event.set()
+    
     def _monitor_loop(self):
         """Main monitoring loop."""
         while self._running:
+            min_ratio_fp = None
             try:
                 if self._enabled:
-                    self._check_positions()
+                    min_ratio_fp = self._check_positions()
             except Exception as e:
                 logger.error(f"Error in liquidation engine: {e}")
             
-            time.sleep(self._check_interval)
+            self._wake_event.wait(self._next_check_delay(min_ratio_fp))
+            self._wake_event.clear()
     
-    def _check_positions(self):
-        """Check all open positions for liquidation."""
-        positions = self._engine.list_open_positions()
+    def _fetch_mark_prices(self, positions: List[Any]) -> List[Decimal]:
+        """
+        Mark price per position, from one batched call for all symbols.
+        
+        Symbols the batch could not price fall back per position.
+        """
+        try:
+            marks = self._external_data.get_mark_prices(list({p.symbol for p in positions}))
+        except Exception as e:
+            logger.warning(f"Failed to fetch mark prices: {e}")
+            marks = {}
+        return [
+            marks[p.symbol] if p.symbol in marks else self._fallback_mark_price(p)
+            for p in positions
+        ]
+    
+    def _open_positions_snapshot(self) -> List[Any]:
+        """
+        Open positions, re-read from the engine only when they changed.
+        
+        Unlike engine.list_open_positions() this does not refresh each
+        position's PnL from the price feed; the checks use mark prices.
+        """
+        version = getattr(self._engine, "positions_version", None)
+        if version is None:
+            return self._engine.list_open_positions()
+        if version != self._positions_version:
+            # Read the version first: a change racing with the copy just
+            # means the next tick copies again
+            self._open_positions = [
+                p for p in list(self._engine.positions.values())
+                if p.status == PaperPositionStatus.OPEN
+            ]
+            self._positions_version = version
+        return self._open_positions
+    
+    def _next_check_delay(self, min_ratio_fp: Optional[int]) -> float:
+        """Seconds until the next check, given the lowest margin ratio (scaled by SCALE)."""
+        if min_ratio_fp is None:
+            return self._check_interval
+        for ratio_fp, factor in self._backoff_fp:
+            if min_ratio_fp > ratio_fp:
+                return self._check_interval * factor
+        return self._check_interval * self.MIN_CHECK_FACTOR
+    
+    def _check_positions(self) -> Optional[int]:
+        """
+        Check all open positions for liquidation.
+        
+        Positions are screened column-wise in scaled integers first; only
+        those at risk get a full MarginStatus.
+        
+        Returns:
+            Lowest margin ratio seen (scaled by SCALE), or None if no position
+            has a maintenance margin
+        """
+        positions = self._open_positions_snapshot()
+        if not positions:
+            self._liq_index = {}
+            return None
+        
+        mark_prices = self._fetch_mark_prices(positions)
+        
+        # Position columns (margin terms come from the per-position cache)
+        factors = [self._margin_factors(p) for p in positions]
+        marks_fp = [to_scaled(m) for m in mark_prices]
+        
+        # Forget positions that are no longer open
+        if len(self._factor_cache) > len(positions):
+            self._factor_cache = {p.position_id: f for p, f in zip(positions, factors)}
+        self._liq_index = self._build_liq_index(positions, factors)
+        
+        # A position is flagged once the mark crosses its cached trigger
+        # price; the lowest margin ratio is tracked as a (balance, maintenance)
+        # pair compared by cross-multiplication, so the loop never divides
+        flagged: List[int] = []
+        min_balance2, min_maintenance2 = 0, 0
+        for i, (f, mark_fp) in enumerate(zip(factors, marks_fp)):
+            maintenance2 = f.maintenance2
+            if maintenance2 <= 0:
+                continue
+            if f.sign * (mark_fp - f.flag_fp) < 0:
+                flagged.append(i)
+            balance2 = f.initial2 + f.sign * f.qty_fp * (mark_fp - f.entry_fp)
+            if not min_maintenance2 or balance2 * min_maintenance2 < min_balance2 * maintenance2:
+                min_balance2, min_maintenance2 = balance2, maintenance2
+        min_ratio_fp = min_balance2 * SCALE // min_maintenance2 if min_maintenance2 else None
+        
+        # Clear warnings for positions that are safe now (or no longer open)
+        # in one set operation rather than a discard per safe position
+        if self._warned_positions:
+            self._warned_positions.intersection_update(
+                [positions[i].position_id for i in flagged]
+            )
         
-        for position in positions:
+        for i in flagged:
+            position = positions[i]
             try:
-                status = self.get_margin_status(position)
+                status = self.get_margin_status(position, mark_prices[i])
                 
                 if status.is_liquidatable:
                     self._liquidate_position(position, status)
                 elif status.is_at_risk:
                     self._warn_margin(status)
-                else:
-                    # Clear warning if position is safe now
-                    self._warned_positions.discard(position.position_id)
                     
             except Exception as e:
                 logger.error(f"Error checking position {position.position_id}: {e}")
+        
+        return min_ratio_fp
+    
+    @staticmethod
+    def _build_liq_index(
+        positions: List[Any],
+        factors: List[_MarginFactors],
+    ) -> Dict[str, _LiquidationIndex]:
+        """Group positions by symbol and side, sorted by liquidation price."""
+        grouped: Dict[str, Tuple[list, list]] = {}
+        for position, f in zip(positions, factors):
+            longs, shorts = grouped.setdefault(position.symbol, ([], []))
+            (longs if f.is_long else shorts).append((f.liq_cents, position.position_id))
+        
+        index = {}
+        for symbol, (longs, shorts) in grouped.items():
+            longs.sort()
+            shorts.sort()
+            index[symbol] = _LiquidationIndex(
+                long_cents=[cents for cents, _ in longs],
+                long_ids=[pid for _, pid in longs],
+                short_cents=[cents for cents, _ in shorts],
+                short_ids=[pid for _, pid in shorts],
+            )
+        return index
+    
+    def on_mark_price(self, symbol: str, mark_price: Decimal):
+        """
+        Liquidate positions whose liquidation price a new mark price crosses.
+        
+        For feeding a price stream (e.g. a websocket or a backtest replay)
+        so liquidations happen on the tick instead of the next poll. Only
+        positions indexed by the last poll are considered; call wake() after
+        opening a position to index it straight away.
+        
+        Args:
+            symbol: Trading pair
+            mark_price: Latest mark price
+        """
+        if not self._enabled:
+            return
+        index = self._liq_index.get(symbol)
+        if index is None:
+            return
+        
+        # LONGs liquidate at or below their price, SHORTs at or above. A cent
+        # of slack covers the rounding of liq_cents; get_margin_status()
+        # makes the exact call.
+        mark_cents = to_scaled(mark_price) // 10 ** 6
+        crossed = (
+            index.long_ids[bisect_left(index.long_cents, mark_cents - 1):]
+            + index.short_ids[:bisect_right(index.short_cents, mark_cents + 1)]
+        )
+        
+        positions = self._engine.positions
+        for position_id in crossed:
+            position = positions.get(position_id)
+            if position is None or position.status != PaperPositionStatus.OPEN:
+                continue
+            try:
+                status = self.get_margin_status(position, mark_price)
+                if status.is_liquidatable:
+                    self._liquidate_position(position, status)
+            except Exception as e:
+                logger.error(f"Error checking position {position_id}: {e}")
     
     def calculate_liquidation_price(
         self,
@@ -307,50 +653,144 @@ class LiquidationEngine:
         Returns:
             Liquidation price
         """
-        mmr = mmr or self._mmr
-        leverage_factor = Decimal("1") / Decimal(leverage)
+        mmr_fp = to_scaled(mmr) if mmr else self._mmr_fp
+        cents = self._liquidation_price_cents(
+            to_scaled(entry_price), leverage, side == "LONG", mmr_fp
+        )
+        return Decimal(cents).scaleb(-2)
+    
+    @staticmethod
+    def _liquidation_price_cents(
+        entry_fp: int,
+        leverage: int,
+        is_long: bool,
+        mmr_fp: int,
+    ) -> int:
+        """
+        Liquidation price in cents (rounded half-to-even) from scaled inputs.
         
-        if side == "LONG":
-            # LONG liquidates when price drops
-            liq_price = entry_price * (Decimal("1") - leverage_factor + mmr)
-        else:
-            # SHORT liquidates when price rises
-            liq_price = entry_price * (Decimal("1") + leverage_factor - mmr)
+        Liq = Entry × (1 - sign/Leverage + sign × MMR) with sign = +1 for
+        LONG (liquidates when price drops) and -1 for SHORT, multiplied
+        through by Leverage × SCALE so the only division is the final rounding.
+        """
+        sign = 1 if is_long else -1
+        factor = leverage * SCALE + sign * (leverage * mmr_fp - SCALE)
+        # entry_fp is scaled by 10**8 and cents by 10**2
+        return div_round(entry_fp * factor, leverage * SCALE * 10 ** 6)
+    
+    def _margin_factors(self, position: Any) -> _MarginFactors:
+        """
+        Get the mark-price-independent margin terms for a position.
+        
+        Cached per position and recomputed when its entry price, quantity
+        or leverage changes (e.g. after averaging in).
+        """
+        cached = self._factor_cache.get(position.position_id)
+        if (
+            cached is not None
+            and cached.entry_price == position.entry_price
+            and cached.quantity == position.quantity
+            and cached.leverage == position.leverage
+        ):
+            return cached
         
-        return liq_price.quantize(Decimal("0.01"))
+        leverage = position.leverage
+        is_long = position.side == "LONG"
+        sign = 1 if is_long else -1
+        notional = position.quantity * position.entry_price
+        entry_fp = to_scaled(position.entry_price)
+        qty_fp = to_scaled(position.quantity)
+        notional2 = qty_fp * entry_fp
+        initial2 = div_round(notional2, leverage)
+        maintenance2 = div_round(notional2 * self._mmr_fp, SCALE)
+        factors = _MarginFactors(
+            entry_price=position.entry_price,
+            quantity=position.quantity,
+            leverage=leverage,
+            is_long=is_long,
+            sign=sign,
+            initial_margin=notional / leverage,
+            maintenance_margin=notional * self._mmr,
+            entry_fp=entry_fp,
+            qty_fp=qty_fp,
+            initial2=initial2,
+            maintenance2=maintenance2,
+            liq_cents=self._liquidation_price_cents(entry_fp, leverage, is_long, self._mmr_fp),
+            flag_fp=self._flag_mark_fp(entry_fp, qty_fp, sign, initial2, maintenance2),
+        )
+        self._factor_cache[position.position_id] = factors
+        return factors
+    
+    def _flag_mark_fp(
+        self,
+        entry_fp: int,
+        qty_fp: int,
+        sign: int,
+        initial2: int,
+        maintenance2: int,
+    ) -> int:
+        """
+        Scaled mark price at which a position becomes at risk or liquidatable.
+        
+        The margin balance is linear in the mark price, so the checks
+        ``balance <= maintenance`` and ``balance < warning × maintenance``
+        reduce to one comparison against this price:
+        ``sign × (mark_fp - flag_fp) < 0``. Exact in integers (the bounds
+        are floored or ceiled the way each comparison needs).
+        """
+        if maintenance2 <= 0:
+            return 0
+        # Warning: sign × qty × (mark - entry) × SCALE < warn_room
+        warn_room = self._warning_fp * maintenance2 - initial2 * SCALE
+        # Liquidation: sign × qty × (mark - entry) <= liq_room
+        liq_room = maintenance2 - initial2
+        if sign > 0:
+            warn_below = -(-warn_room // (qty_fp * SCALE))  # ceil
+            liq_below = liq_room // qty_fp + 1
+            return entry_fp + max(warn_below, liq_below)
+        warn_above = -warn_room // (qty_fp * SCALE)  # floor
+        liq_above = -(liq_room // qty_fp) - 1  # ceil(-liq_room / qty) - 1
+        return entry_fp + min(warn_above, liq_above)
     
-    def get_margin_status(self, position: Any) -> MarginStatus:
+    @staticmethod
+    def _fallback_mark_price(position: Any) -> Decimal:
+        """Position's current price or entry, for when no mark price is available."""
+        return getattr(position, 'current_price', position.entry_price)
+    
+    def get_margin_status(
+        self,
+        position: Any,
+        mark_price: Optional[Decimal] = None,
+    ) -> MarginStatus:
         """
         Get current margin status for a position.
         
         Args:
             position: Position object from engine
+            mark_price: Mark price to use (fetched from external data if None)
             
         Returns:
             MarginStatus with all margin information
         """
         # Get current mark price
-        try:
-            mark_price = self._external_data.get_mark_price(position.symbol)
-        except Exception:
-            # Fall back to position's current price or entry
-            mark_price = getattr(position, 'current_price', position.entry_price)
+        if mark_price is None:
+            try:
+                mark_price = self._external_data.get_mark_price(position.symbol)
+            except Exception:
+                mark_price = self._fallback_mark_price(position)
         
-        side = position.side.value
+        side = position.side
         entry_price = position.entry_price
         quantity = position.quantity
         leverage = position.leverage
         
-        # Calculate position values
-        notional = quantity * entry_price
-        initial_margin = notional / Decimal(leverage)
-        maintenance_margin = notional * self._mmr
+        # Money values are exact Decimal; the margin terms are cached per position
+        factors = self._margin_factors(position)
+        initial_margin = factors.initial_margin
+        maintenance_margin = factors.maintenance_margin
         
         # Calculate unrealized PnL
-        if side == "LONG":
-            unrealized_pnl = quantity * (mark_price - entry_price)
-        else:
-            unrealized_pnl = quantity * (entry_price - mark_price)
+        unrealized_pnl = factors.sign * quantity * (mark_price - entry_price)
         
         # Margin balance = initial margin + unrealized PnL
         margin_balance = initial_margin + unrealized_pnl
@@ -359,16 +799,13 @@ class LiquidationEngine:
         if maintenance_margin > 0:
             margin_ratio = margin_balance / maintenance_margin
         else:
-            margin_ratio = Decimal("999")  # Safe
+            margin_ratio = _SAFE_MARGIN_RATIO
         
         # Liquidation price
-        liq_price = self.calculate_liquidation_price(entry_price, leverage, side)
+        liq_price = Decimal(factors.liq_cents).scaleb(-2)
         
         # Distance to liquidation (percentage)
-        if side == "LONG":
-            distance_to_liq = ((mark_price - liq_price) / mark_price) * 100
-        else:
-            distance_to_liq = ((liq_price - mark_price) / mark_price) * 100
+        distance_to_liq = factors.sign * (mark_price - liq_price) / mark_price * 100
         
         return MarginStatus(
             position_id=position.position_id,
@@ -385,81 +822,117 @@ class LiquidationEngine:
             margin_ratio=margin_ratio,
             liquidation_price=liq_price,
             is_at_risk=margin_ratio < self._warning_threshold,
-            is_liquidatable=margin_ratio <= Decimal("1"),
+            is_liquidatable=margin_ratio <= 1,
             distance_to_liq=distance_to_liq,
         )
     
     def _liquidate_position(self, position: Any, status: MarginStatus):
-        """Liquidate a position."""
+        """
+        Liquidate a position, at most once.
+        
+        The monitor loop and on_mark_price() can find the same position
+        liquidatable at the same time. The position id is claimed under
+        _lock first; a call that finds it claimed, or finds the position no
+        longer open in the engine, does nothing.
+        """
+        position_id = position.position_id
         with self._lock:
-            logger.warning(
-                f"LIQUIDATING {position.symbol} {position.side.value} - "
-                f"Mark: {status.mark_price}, Liq: {status.liquidation_price}"
-            )
-            
-            # Calculate liquidation values
-            notional_at_liq = position.quantity * status.mark_price
-            liquidation_fee = notional_at_liq * self._liq_fee_rate
-            
-            # The margin is lost (minus any remaining after covering losses)
-            margin_lost = status.initial_margin + status.unrealized_pnl
-            if margin_lost < 0:
-                margin_lost = status.initial_margin  # Can't lose more than initial
-            
-            remaining_margin = max(Decimal("0"), status.margin_balance - liquidation_fee)
-            
-            # Create liquidation event
-            event = LiquidationEvent(
-                liquidation_id=f"liq_{uuid.uuid4().hex[:12]}",
+            if position_id in self._liquidating:
+                return
+            self._liquidating.add(position_id)
+        try:
+            if (
+                position.status != PaperPositionStatus.OPEN
+                or self._engine.positions.get(position_id) is not position
+            ):
+                return
+            self._execute_liquidation(position, status)
+        finally:
+            with self._lock:
+                self._liquidating.discard(position_id)
+    
+    def _execute_liquidation(self, position: Any, status: MarginStatus):
+        """
+        Close a claimed position and record the liquidation.
+        
+        Only the history append and loss total are done under _lock; the
+        cache/warning removals below are each atomic.
+        """
+        logger.warning(
+            f"LIQUIDATING {position.symbol} {position.side} - "
+            f"Mark: {status.mark_price}, Liq: {status.liquidation_price}"
+        )
+        
+        # Calculate liquidation values
+        notional_at_liq = position.quantity * status.mark_price
+        liquidation_fee = notional_at_liq * self._liq_fee_rate
+        
+        # The margin is lost (minus any remaining after covering losses)
+        margin_lost = status.initial_margin + status.unrealized_pnl
+        if margin_lost < 0:
+            margin_lost = status.initial_margin  # Can't lose more than initial
+        
+        remaining_margin = max(_ZERO, status.margin_balance - liquidation_fee)
+        
+        # Create liquidation event
+        event = LiquidationEvent(
+            liquidation_id=f"liq_{uuid.uuid4().hex[:12]}",
+            position_id=position.position_id,
+            symbol=position.symbol,
+            side=position.side,
+            reason=LiquidationReason.MARGIN_CALL,
+            entry_price=position.entry_price,
+            liquidation_price=status.liquidation_price,
+            mark_price_at_liq=status.mark_price,
+            quantity=position.quantity,
+            margin_lost=margin_lost,
+            liquidation_fee=liquidation_fee,
+            remaining_margin=remaining_margin,
+            liquidation_time=datetime.now(timezone.utc),
+            leverage=position.leverage,
+        )
+        
+        # Force close position in engine
+        try:
+            # Close at liquidation price (or current mark)
+            self._engine.close_position(
                 position_id=position.position_id,
-                symbol=position.symbol,
-                side=position.side.value,
-                reason=LiquidationReason.MARGIN_CALL,
-                entry_price=position.entry_price,
-                liquidation_price=status.liquidation_price,
-                mark_price_at_liq=status.mark_price,
-                quantity=position.quantity,
-                margin_lost=margin_lost,
-                liquidation_fee=liquidation_fee,
-                remaining_margin=remaining_margin,
-                liquidation_time=datetime.now(timezone.utc),
-                leverage=position.leverage,
+                close_price=status.mark_price,
+                reason="LIQUIDATED"
             )
-            
-            # Force close position in engine
-            try:
-                # Close at liquidation price (or current mark)
-                self._engine.close_position(
-                    position_id=position.position_id,
-                    close_price=status.mark_price,
-                    reason="LIQUIDATED"
-                )
-            except Exception as e:
-                # If engine close fails, manually remove position
-                logger.error(f"Error closing liquidated position: {e}")
-                if position.position_id in self._engine._positions:
-                    del self._engine._positions[position.position_id]
-            
-            # Deduct liquidation fee from wallet
-            self._engine._wallet.balance -= liquidation_fee
-            
-            # Record event
+        except PositionAlreadyClosedError:
+            # Closed in the meantime (manually or by a concurrent check)
+            return
+        except Exception as e:
+            # If engine close fails, manually remove position
+            logger.error(f"Error closing liquidated position: {e}")
+            if self._engine.positions.pop(position.position_id, None) is not None:
+                self._engine.wallet.unrealized_pnl -= position.unrealized_pnl
+            self._engine.positions_version += 1
+        
+        # Deduct liquidation fee from wallet
+        self._engine.wallet.balance -= liquidation_fee
+        
+        # Record event
+        with self._lock:
             self._liquidations.append(event)
-            
-            # Clear warning
-            self._warned_positions.discard(position.position_id)
-            
-            # Callback
-            if self._on_liquidation:
-                try:
-                    self._on_liquidation(event)
-                except Exception as e:
-                    logger.error(f"Error in liquidation callback: {e}")
-            
-            logger.warning(
-                f"Position {position.position_id} liquidated. "
-                f"Loss: {event.total_loss}, Fee: {liquidation_fee}"
-            )
+            self._total_liq_loss += event.total_loss
+        
+        # Clear warning
+        self._warned_positions.discard(position.position_id)
+        self._factor_cache.pop(position.position_id, None)
+        
+        # Callback (queued while the callback thread runs, else inline)
+        if self._on_liquidation:
+            if self._callback_thread is not None:
+                self._callback_queue.put(event)
+            else:
+                self._run_liquidation_callback(event)
+        
+        logger.warning(
+            f"Position {position.position_id} liquidated. "
+            f"Loss: {event.total_loss}, Fee: {liquidation_fee}"
+        )
     
     def _warn_margin(self, status: MarginStatus):
         """Issue margin warning for at-risk position."""
@@ -502,33 +975,52 @@ class LiquidationEngine:
     
     def get_at_risk_positions(self) -> List[MarginStatus]:
         """Get all positions that are at risk of liquidation."""
-        return [s for s in self.get_all_margin_status() if s.is_at_risk]
+        positions = self._engine.list_open_positions()
+        at_risk = []
+        # Screen against the cached trigger price; only flagged positions
+        # get a MarginStatus
+        for position, mark_price in zip(positions, self._fetch_mark_prices(positions)):
+            f = self._margin_factors(position)
+            if f.maintenance2 > 0 and f.sign * (to_scaled(mark_price) - f.flag_fp) < 0:
+                status = self.get_margin_status(position, mark_price)
+                if status.is_at_risk:
+                    at_risk.append(status)
+        return at_risk
     
     def get_total_liquidation_losses(self) -> Decimal:
         """Get total losses from all liquidations."""
-        return sum(liq.total_loss for liq in self._liquidations)
+        return self._total_liq_loss
     
     def clear_history(self):
         """Clear liquidation history."""
         with self._lock:
             self._liquidations.clear()
+            self._total_liq_loss = _ZERO
             self._warned_positions.clear()
     
     def to_state(self) -> Dict:
         """Serialize state for persistence."""
         return {
             "liquidations": [liq.to_dict() for liq in self._liquidations],
+            # The history is capped, so the running total is saved on its own
+            "total_liq_loss": str(self._total_liq_loss),
             "mmr": str(self._mmr),
             "liq_fee_rate": str(self._liq_fee_rate),
         }
     
     def from_state(self, state: Dict):
         """Restore state from persistence."""
-        self._liquidations = [
-            LiquidationEvent.from_dict(liq) 
-            for liq in state.get("liquidations", [])
-        ]
+        self._liquidations = deque(
+            map(LiquidationEvent.from_dict, state.get("liquidations", [])),
+            maxlen=self._liquidations.maxlen,
+        )
+        if "total_liq_loss" in state:
+            self._total_liq_loss = Decimal(state["total_liq_loss"])
+        else:
+            self._total_liq_loss = sum((liq.total_loss for liq in self._liquidations), _ZERO)
         if "mmr" in state:
             self._mmr = Decimal(state["mmr"])
+            self._mmr_fp = to_scaled(self._mmr)
+            self._factor_cache.clear()
         if "liq_fee_rate" in state:
             self._liq_fee_rate = Decimal(state["liq_fee_rate"])
@@ -10,8 +10,12 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
 from enum import Enum
-from typing import Optional, Dict, Any
-import uuid
+from functools import lru_cache
+from typing import Optional, Dict, Any, Iterable, List, Tuple
+import os
+import sys
+
+from mudrex.paper._clock import now as _now
 
 
 class PaperOrderStatus(str, Enum):
@@ -37,12 +41,47 @@ class CloseReason(str, Enum):
     LIQUIDATION = "LIQUIDATION"  # Warning only in V1
 
 
+# Serialized (interned) value per enum member: a dict lookup is several times
+# cheaper than the Enum.value descriptor on the to_dict()/to_sdk_*() paths
+_ORDER_STATUS_VALUE = {m: sys.intern(m.value) for m in PaperOrderStatus}
+_POSITION_STATUS_VALUE = {m: sys.intern(m.value) for m in PaperPositionStatus}
+_CLOSE_REASON_VALUE = {m: sys.intern(m.value) for m in CloseReason}
+
+# Orders in these states are never modified again
+_FINAL_ORDER_STATUSES = frozenset((
+    PaperOrderStatus.FILLED,
+    PaperOrderStatus.CANCELLED,
+    PaperOrderStatus.EXPIRED,
+    PaperOrderStatus.REJECTED,
+))
+
+
+# Slotted dataclasses drop the per-instance __dict__ (smaller records, faster
+# attribute access); dataclass(slots=True) needs Python 3.10+
+_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 def generate_paper_id(prefix: str) -> str:
     """Generate a unique paper trading ID."""
-    return f"paper_{prefix}_{uuid.uuid4().hex[:12]}"
+    return f"paper_{prefix}_{os.urandom(6).hex()}"
+
+
+# Decimal constants, parsed once
+_ZERO = Decimal("0")
+_HUNDRED = Decimal("100")
+
 
+# Records restored together often share timestamps (e.g. an order's fill time
+# is also its position's and trade's), so recent parses are memoized
+_parse_iso = lru_cache(maxsize=4096)(datetime.fromisoformat)
 
-@dataclass
+
+def _parse_datetime(value: Any) -> Optional[datetime]:
+    """Saved timestamp -> datetime (ISO strings are parsed; None and datetimes pass through)."""
+    return _parse_iso(value) if type(value) is str else value
+
+
+@dataclass(**_SLOTS)
 class PaperWallet:
     """
     Virtual wallet for paper trading.
@@ -57,8 +96,8 @@ class PaperWallet:
     unrealized_pnl: Decimal = Decimal("0")       # Sum of position unrealized PnL
     realized_pnl: Decimal = Decimal("0")         # Cumulative realized PnL
     total_fees_paid: Decimal = Decimal("0")      # Total trading fees paid
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_now)
+    updated_at: datetime = field(default_factory=_now)
     
     def lock_margin(self, amount: Decimal) -> None:
         """Lock margin for a new position."""
@@ -66,13 +105,13 @@ class PaperWallet:
             raise ValueError(f"Cannot lock {amount}, only {self.available} available")
         self.available -= amount
         self.locked_margin += amount
-        self.updated_at = datetime.utcnow()
+        self.updated_at = _now()
     
     def release_margin(self, amount: Decimal) -> None:
         """Release margin when position closes."""
         self.locked_margin -= amount
         self.available += amount
-        self.updated_at = datetime.utcnow()
+        self.updated_at = _now()
     
     def realize_pnl(self, pnl: Decimal, released_margin: Decimal) -> None:
         """Record realized PnL and release margin."""
@@ -80,14 +119,14 @@ class PaperWallet:
         self.locked_margin -= released_margin
         self.available += released_margin + pnl
         self.balance += pnl
-        self.updated_at = datetime.utcnow()
+        self.updated_at = _now()
     
     def deduct_fee(self, fee: Decimal) -> None:
         """Deduct trading fee from available balance."""
         self.available -= fee
         self.balance -= fee
         self.total_fees_paid += fee
-        self.updated_at = datetime.utcnow()
+        self.updated_at = _now()
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -112,12 +151,12 @@ class PaperWallet:
             unrealized_pnl=Decimal(data.get("unrealized_pnl", "0")),
             realized_pnl=Decimal(data.get("realized_pnl", "0")),
             total_fees_paid=Decimal(data.get("total_fees_paid", "0")),
-            created_at=datetime.fromisoformat(data["created_at"]) if isinstance(data["created_at"], str) else data["created_at"],
-            updated_at=datetime.fromisoformat(data["updated_at"]) if isinstance(data["updated_at"], str) else data["updated_at"],
+            created_at=_parse_datetime(data["created_at"]),
+            updated_at=_parse_datetime(data["updated_at"]),
         )
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PaperOrder:
     """
     Simulated order record.
@@ -146,7 +185,7 @@ class PaperOrder:
     margin_used: Decimal = Decimal("0")
     
     # Timestamps
-    created_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_now)
     filled_at: Optional[datetime] = None
     cancelled_at: Optional[datetime] = None
     expires_at: Optional[datetime] = None  # For limit orders
@@ -154,22 +193,27 @@ class PaperOrder:
     # Links
     position_id: Optional[str] = None
     
+    # (status, to_sdk_order() result) once the order is final
+    _sdk_cache: Optional[Tuple[PaperOrderStatus, Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
     def fill(self, price: Decimal, position_id: str) -> None:
         """Mark order as filled."""
         self.status = PaperOrderStatus.FILLED
         self.filled_price = price
-        self.filled_at = datetime.utcnow()
+        self.filled_at = _now()
         self.position_id = position_id
     
     def cancel(self) -> None:
         """Cancel the order."""
         self.status = PaperOrderStatus.CANCELLED
-        self.cancelled_at = datetime.utcnow()
+        self.cancelled_at = _now()
     
     @property
     def notional_value(self) -> Decimal:
         """Calculate notional value using filled or limit price."""
-        price = self.filled_price or self.price or Decimal("0")
+        price = self.filled_price or self.price or _ZERO
         return self.quantity * price
     
     def to_dict(self) -> Dict[str, Any]:
@@ -181,7 +225,7 @@ class PaperOrder:
             "order_type": self.order_type,
             "quantity": str(self.quantity),
             "leverage": self.leverage,
-            "status": self.status.value,
+            "status": _ORDER_STATUS_VALUE[self.status],
             "price": str(self.price) if self.price else None,
             "filled_price": str(self.filled_price) if self.filled_price else None,
             "stoploss_price": str(self.stoploss_price) if self.stoploss_price else None,
@@ -199,11 +243,6 @@ class PaperOrder:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PaperOrder":
         """Create from dictionary."""
-        def parse_dt(val):
-            if val is None:
-                return None
-            return datetime.fromisoformat(val) if isinstance(val, str) else val
-        
         return cls(
             order_id=data["order_id"],
             symbol=data["symbol"],
@@ -219,36 +258,47 @@ class PaperOrder:
             reduce_only=data.get("reduce_only", False),
             fee_paid=Decimal(data.get("fee_paid", "0")),
             margin_used=Decimal(data.get("margin_used", "0")),
-            created_at=parse_dt(data["created_at"]) or datetime.utcnow(),
-            filled_at=parse_dt(data.get("filled_at")),
-            cancelled_at=parse_dt(data.get("cancelled_at")),
-            expires_at=parse_dt(data.get("expires_at")),
+            created_at=_parse_datetime(data["created_at"]) or _now(),
+            filled_at=_parse_datetime(data.get("filled_at")),
+            cancelled_at=_parse_datetime(data.get("cancelled_at")),
+            expires_at=_parse_datetime(data.get("expires_at")),
             position_id=data.get("position_id"),
         )
     
     def to_sdk_order(self) -> Dict[str, Any]:
         """Convert to format matching SDK Order model."""
-        return {
+        # Orders in a final state no longer change; reuse the built dict
+        status = self.status
+        cached = self._sdk_cache
+        if cached is not None and cached[0] is status:
+            return dict(cached[1])
+        
+        price = str(self.filled_price or self.price or "0")
+        sdk_order = {
             "order_id": self.order_id,
             "id": self.order_id,
             "asset_id": self.symbol,
             "symbol": self.symbol,
             "order_type": self.side,  # SDK uses order_type for LONG/SHORT
             "trigger_type": self.order_type,  # SDK uses trigger_type for MARKET/LIMIT
-            "status": self.status.value,
+            "status": _ORDER_STATUS_VALUE[self.status],
             "quantity": str(self.quantity),
             "filled_quantity": str(self.quantity) if self.status == PaperOrderStatus.FILLED else "0",
-            "price": str(self.filled_price or self.price or "0"),
-            "order_price": str(self.filled_price or self.price or "0"),
+            "price": price,
+            "order_price": price,
             "leverage": str(self.leverage),
             "created_at": self.created_at.isoformat(),
             "updated_at": (self.filled_at or self.created_at).isoformat(),
             "stoploss_price": str(self.stoploss_price) if self.stoploss_price else None,
             "takeprofit_price": str(self.takeprofit_price) if self.takeprofit_price else None,
         }
+        if status in _FINAL_ORDER_STATUSES:
+            self._sdk_cache = (status, sdk_order)
+            return dict(sdk_order)
+        return sdk_order
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class PaperPosition:
     """
     Simulated futures position.
@@ -279,14 +329,32 @@ class PaperPosition:
     cumulative_funding: Decimal = Decimal("0")  # Net funding received/paid
     
     # Timestamps
-    opened_at: datetime = field(default_factory=datetime.utcnow)
+    opened_at: datetime = field(default_factory=_now)
     closed_at: Optional[datetime] = None
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    updated_at: datetime = field(default_factory=_now)
     
     # Close info
     close_reason: Optional[CloseReason] = None
     exit_price: Optional[Decimal] = None
     
+    # Derived from side, which never changes after creation
+    is_long: bool = field(init=False, repr=False, compare=False)
+    _side_sign: int = field(init=False, repr=False, compare=False)  # +1 LONG, -1 SHORT
+    
+    # (entry_price, quantity, margin, result) of calculate_liquidation_price()
+    _liq_cache: Optional[Tuple[Decimal, Decimal, Decimal, Decimal]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    # (opened_at, opened_at.isoformat()) for to_dict()/to_sdk_position()
+    _opened_at_iso: Optional[Tuple[datetime, str]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    
+    def __post_init__(self) -> None:
+        self.is_long = self.side == "LONG"
+        self._side_sign = 1 if self.is_long else -1
+    
     @property
     def notional_value(self) -> Decimal:
         """Current notional value based on entry price."""
@@ -296,31 +364,36 @@ class PaperPosition:
     def roe_percent(self) -> Decimal:
         """Return on Equity (PnL / Margin) * 100."""
         if self.margin == 0:
-            return Decimal("0")
-        return (self.unrealized_pnl / self.margin) * 100
+            return _ZERO
+        return (self.unrealized_pnl / self.margin) * _HUNDRED
     
     @property
     def pnl_percentage(self) -> float:
         """PnL as percentage of entry value."""
-        if self.notional_value == 0:
+        # The result is a float anyway, so skip the Decimal division
+        notional = float(self.quantity) * float(self.entry_price)
+        if notional == 0:
             return 0.0
-        return float((self.unrealized_pnl / self.notional_value) * 100)
+        return float(self.unrealized_pnl) * 100.0 / notional
     
     def calculate_unrealized_pnl(self, current_price: Decimal) -> Decimal:
         """Calculate unrealized PnL based on current market price."""
         price_diff = current_price - self.entry_price
         
-        if self.side == "LONG":
-            pnl = price_diff * self.quantity
-        else:  # SHORT
-            pnl = -price_diff * self.quantity
-        
-        return pnl
+        if self.is_long:
+            return price_diff * self.quantity
+        return -price_diff * self.quantity
     
-    def update_pnl(self, current_price: Decimal) -> None:
-        """Update unrealized PnL with current price."""
+    def update_pnl(self, current_price: Decimal) -> Decimal:
+        """
+        Update unrealized PnL with current price.
+        
+        Returns: change in unrealized PnL, for the wallet's running total
+        """
+        previous = self.unrealized_pnl
         self.unrealized_pnl = self.calculate_unrealized_pnl(current_price)
-        self.updated_at = datetime.utcnow()
+        self.updated_at = _now()
+        return self.unrealized_pnl - previous
     
     def calculate_liquidation_price(self) -> Optional[Decimal]:
         """
@@ -333,13 +406,31 @@ class PaperPosition:
         if self.quantity == 0:
             return None
         
+        # Reuse the last result while entry price, quantity and margin are unchanged
+        cached = self._liq_cache
+        if (
+            cached is not None
+            and cached[0] == self.entry_price
+            and cached[1] == self.quantity
+            and cached[2] == self.margin
+        ):
+            return cached[3]
+        
         safety_factor = Decimal("0.9")  # 90% of margin triggers liquidation warning
         margin_per_unit = self.margin / self.quantity
         
-        if self.side == "LONG":
-            return self.entry_price - (margin_per_unit * safety_factor)
-        else:
-            return self.entry_price + (margin_per_unit * safety_factor)
+        # LONG liquidates below entry, SHORT above
+        liq_price = self.entry_price - self._side_sign * (margin_per_unit * safety_factor)
+        self._liq_cache = (self.entry_price, self.quantity, self.margin, liq_price)
+        return liq_price
+    
+    def _opened_at_str(self) -> str:
+        """opened_at in ISO format, formatted once per position."""
+        cached = self._opened_at_iso
+        if cached is None or cached[0] is not self.opened_at:
+            cached = (self.opened_at, self.opened_at.isoformat())
+            self._opened_at_iso = cached
+        return cached[1]
     
     def close(self, exit_price: Decimal, reason: CloseReason) -> Decimal:
         """
@@ -350,12 +441,12 @@ class PaperPosition:
         final_pnl = self.calculate_unrealized_pnl(exit_price)
         
         self.status = PaperPositionStatus.CLOSED
-        self.closed_at = datetime.utcnow()
-        self.updated_at = datetime.utcnow()
+        self.closed_at = _now()
+        self.updated_at = _now()
         self.close_reason = reason
         self.exit_price = exit_price
         self.realized_pnl = final_pnl
-        self.unrealized_pnl = Decimal("0")
+        self.unrealized_pnl = _ZERO
         
         return final_pnl
     
@@ -376,12 +467,12 @@ class PaperPosition:
         self.quantity -= close_quantity
         self.margin *= (1 - ratio)
         self.realized_pnl += partial_pnl
-        self.updated_at = datetime.utcnow()
+        self.updated_at = _now()
         
         # Fully closed
         if self.quantity == 0:
             self.status = PaperPositionStatus.CLOSED
-            self.closed_at = datetime.utcnow()
+            self.closed_at = _now()
             self.close_reason = CloseReason.MANUAL
             self.exit_price = exit_price
         
@@ -393,7 +484,7 @@ class PaperPosition:
             "position_id": self.position_id,
             "symbol": self.symbol,
             "side": self.side,
-            "status": self.status.value,
+            "status": _POSITION_STATUS_VALUE[self.status],
             "quantity": str(self.quantity),
             "entry_price": str(self.entry_price),
             "leverage": self.leverage,
@@ -404,21 +495,16 @@ class PaperPosition:
             "takeprofit_price": str(self.takeprofit_price) if self.takeprofit_price else None,
             "liquidation_price": str(self.liquidation_price) if self.liquidation_price else None,
             "cumulative_funding": str(self.cumulative_funding),
-            "opened_at": self.opened_at.isoformat(),
+            "opened_at": self._opened_at_str(),
             "closed_at": self.closed_at.isoformat() if self.closed_at else None,
             "updated_at": self.updated_at.isoformat(),
-            "close_reason": self.close_reason.value if self.close_reason else None,
+            "close_reason": _CLOSE_REASON_VALUE[self.close_reason] if self.close_reason else None,
             "exit_price": str(self.exit_price) if self.exit_price else None,
         }
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PaperPosition":
         """Create from dictionary."""
-        def parse_dt(val):
-            if val is None:
-                return None
-            return datetime.fromisoformat(val) if isinstance(val, str) else val
-        
         return cls(
             position_id=data["position_id"],
             symbol=data["symbol"],
@@ -434,15 +520,18 @@ class PaperPosition:
             takeprofit_price=Decimal(data["takeprofit_price"]) if data.get("takeprofit_price") else None,
             liquidation_price=Decimal(data["liquidation_price"]) if data.get("liquidation_price") else None,
             cumulative_funding=Decimal(data.get("cumulative_funding", "0")),
-            opened_at=parse_dt(data["opened_at"]) or datetime.utcnow(),
-            closed_at=parse_dt(data.get("closed_at")),
-            updated_at=parse_dt(data.get("updated_at")) or datetime.utcnow(),
+            opened_at=_parse_datetime(data["opened_at"]) or _now(),
+            closed_at=_parse_datetime(data.get("closed_at")),
+            updated_at=_parse_datetime(data.get("updated_at")) or _now(),
             close_reason=CloseReason(data["close_reason"]) if data.get("close_reason") else None,
             exit_price=Decimal(data["exit_price"]) if data.get("exit_price") else None,
         )
     
     def to_sdk_position(self) -> Dict[str, Any]:
         """Convert to format matching SDK Position model."""
+        entry_price = str(self.entry_price)
+        stoploss = str(self.stoploss_price) if self.stoploss_price else None
+        takeprofit = str(self.takeprofit_price) if self.takeprofit_price else None
         return {
             "position_id": self.position_id,
             "id": self.position_id,
@@ -450,25 +539,51 @@ class PaperPosition:
             "symbol": self.symbol,
             "side": self.side,
             "order_type": self.side,  # SDK uses order_type for side
-            "status": self.status.value,
+            "status": _POSITION_STATUS_VALUE[self.status],
             "quantity": str(self.quantity),
-            "entry_price": str(self.entry_price),
-            "mark_price": str(self.entry_price),  # Updated by caller with live price
+            "entry_price": entry_price,
+            "mark_price": entry_price,  # Updated by caller with live price
             "leverage": str(self.leverage),
             "margin": str(self.margin),
             "unrealized_pnl": str(self.unrealized_pnl),
             "realized_pnl": str(self.realized_pnl),
             "liquidation_price": str(self.liquidation_price) if self.liquidation_price else None,
-            "stoploss_price": str(self.stoploss_price) if self.stoploss_price else None,
-            "takeprofit_price": str(self.takeprofit_price) if self.takeprofit_price else None,
-            "stoploss": {"price": str(self.stoploss_price)} if self.stoploss_price else None,
-            "takeprofit": {"price": str(self.takeprofit_price)} if self.takeprofit_price else None,
-            "created_at": self.opened_at.isoformat(),
+            "stoploss_price": stoploss,
+            "takeprofit_price": takeprofit,
+            "stoploss": {"price": stoploss} if stoploss else None,
+            "takeprofit": {"price": takeprofit} if takeprofit else None,
+            "created_at": self._opened_at_str(),
             "updated_at": self.updated_at.isoformat(),
         }
 
 
-@dataclass
+def update_all_pnls(positions: Iterable[PaperPosition], prices: Dict[str, Decimal]) -> Decimal:
+    """
+    Update unrealized PnL for many positions at once.
+    
+    All updated positions share one ``updated_at`` stamp. Positions whose
+    symbol has no price are left unchanged.
+    
+    Args:
+        positions: Positions to update
+        prices: Current price per symbol
+        
+    Returns:
+        Total change in unrealized PnL, for the wallet's running total
+    """
+    now = _now()
+    delta = _ZERO
+    for position in positions:
+        price = prices.get(position.symbol)
+        if price is not None:
+            pnl = position.calculate_unrealized_pnl(price)
+            delta += pnl - position.unrealized_pnl
+            position.unrealized_pnl = pnl
+            position.updated_at = now
+    return delta
+
+
+@dataclass(**_SLOTS)
 class TradeRecord:
     """
     Historical record of an executed trade.
@@ -490,7 +605,7 @@ class TradeRecord:
     pnl: Optional[Decimal] = None       # Only for close actions
     pnl_percent: Optional[Decimal] = None
     
-    executed_at: datetime = field(default_factory=datetime.utcnow)
+    executed_at: datetime = field(default_factory=_now)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -526,5 +641,5 @@ class TradeRecord:
             fee=Decimal(data["fee"]),
             pnl=Decimal(data["pnl"]) if data.get("pnl") else None,
             pnl_percent=Decimal(data["pnl_percent"]) if data.get("pnl_percent") else None,
-            executed_at=datetime.fromisoformat(data["executed_at"]) if isinstance(data["executed_at"], str) else data["executed_at"],
+            executed_at=_parse_datetime(data["executed_at"]),
         )
@@ -10,10 +10,26 @@ import json
 import logging
 import os
 import sqlite3
+import threading
+import zlib
+from contextlib import contextmanager
 from datetime import datetime
 from decimal import Decimal
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Union
+
+# orjson (optional, `pip install mudrex-trading-sdk[speedups]`) encodes
+# saved state faster than json.
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+# zstandard (optional, same extra) compresses large stored JSON; zlib otherwise.
+try:
+    import zstandard as _zstd
+except ImportError:
+    _zstd = None
 
 if TYPE_CHECKING:
     from mudrex.paper.engine import PaperTradingEngine
@@ -21,10 +37,23 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# Exact type -> JSON-ready conversion: one dict lookup instead of an
+# isinstance() chain (subclasses still take the isinstance path)
+_ENCODERS = {
+    Decimal: str,
+    datetime: datetime.isoformat,
+}
+
+_SCALAR_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
 class DecimalEncoder(json.JSONEncoder):
-    """JSON encoder that handles Decimal types."""
+    """JSON encoder that handles Decimal and datetime types."""
     
     def default(self, obj):
+        encode = _ENCODERS.get(type(obj))
+        if encode is not None:
+            return encode(obj)
         if isinstance(obj, Decimal):
             return str(obj)
         if isinstance(obj, datetime):
@@ -32,6 +61,83 @@ class DecimalEncoder(json.JSONEncoder):
         return super().default(obj)
 
 
+def _to_plain(obj: Any) -> Any:
+    """Copy of obj with Decimal/datetime as strings."""
+    kind = type(obj)
+    if kind in _SCALAR_TYPES:
+        return obj
+    if kind is dict:
+        return {key: _to_plain(value) for key, value in obj.items()}
+    if kind is list or kind is tuple:
+        return [_to_plain(value) for value in obj]
+    encode = _ENCODERS.get(kind)
+    if encode is not None:
+        return encode(obj)
+    
+    # Subclasses of the handled types
+    if isinstance(obj, dict):
+        return {key: _to_plain(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_to_plain(value) for value in obj]
+    if isinstance(obj, Decimal):
+        return str(obj)
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return obj
+
+
+def _to_json(obj: Any, indent: bool = False) -> str:
+    """
+    Encode state as JSON text (same output types as DecimalEncoder).
+    
+    Decimals and datetimes are converted in one pre-pass, so the encoder
+    never calls back into Python (orjson when installed, else json).
+    """
+    obj = _to_plain(obj)
+    if _orjson is not None:
+        return _orjson.dumps(obj, option=_orjson.OPT_INDENT_2 if indent else 0).decode()
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+# Stored JSON at least this long is compressed; shorter values stay plain text
+_COMPRESS_MIN_CHARS = 1024
+
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+
+def _pack(text: str) -> Union[str, bytes]:
+    """JSON text -> stored value (compressed BLOB when large)."""
+    if len(text) < _COMPRESS_MIN_CHARS:
+        return text
+    data = text.encode()
+    if _zstd is not None:
+        return _zstd.ZstdCompressor(level=3).compress(data)
+    return zlib.compress(data)
+
+
+def _unpack(value: Union[str, bytes]) -> str:
+    """Stored value -> JSON text (plain TEXT, zstd or zlib BLOB)."""
+    if isinstance(value, str):
+        return value
+    if value.startswith(_ZSTD_MAGIC):
+        if _zstd is None:
+            raise ValueError(
+                "Saved state is zstd-compressed; install mudrex-trading-sdk[speedups] to read it"
+            )
+        return _zstd.ZstdDecompressor().decompress(value).decode()
+    return zlib.decompress(value).decode()
+
+
+def _upsert_sql(table: str, key: str, columns: Tuple[str, ...]) -> str:
+    """INSERT ... ON CONFLICT(key) DO UPDATE statement for a detail table."""
+    updates = ", ".join(f"{column} = excluded.{column}" for column in columns if column != key)
+    return (
+        f"INSERT INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' * len(columns))}) "
+        f"ON CONFLICT({key}) DO UPDATE SET {updates}"
+    )
+
+
 class PaperDB:
     """
     SQLite-based persistence for paper trading state.
@@ -41,6 +147,7 @@ class PaperDB:
     - Atomic state saves
     - State versioning for migration
     - Multiple named profiles
+    - One shared, lock-guarded connection per instance (call close() when done)
     
     Example:
         >>> db = PaperDB("~/.mudrex/paper_trading.db")
@@ -54,21 +161,95 @@ class PaperDB:
         ...     engine.import_state(state)
     """
     
-    SCHEMA_VERSION = 1
+    # v2: state_json/data_json may hold compressed BLOBs (see _pack)
+    SCHEMA_VERSION = 2
+    
+    SYNCHRONOUS_MODES = ("OFF", "NORMAL", "FULL", "EXTRA")
+    
+    # Per-connection tuning: in-memory temp tables, 64 MiB page cache, 256 MiB mmap
+    CONNECTION_PRAGMAS = (
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-65536",
+        "PRAGMA mmap_size=268435456",
+    )
+    
+    # Detail tables: (state key, table, primary key, columns in save_state()
+    # row order). They are the only stored copy of these state entries;
+    # paper_state.state_json holds the rest.
+    DETAIL_TABLES = (
+        ("positions", "paper_positions", "position_id",
+         ("position_id", "profile", "symbol", "side", "status", "data_json", "opened_at", "closed_at")),
+        ("orders", "paper_orders", "order_id",
+         ("order_id", "profile", "symbol", "status", "data_json", "created_at")),
+        ("trade_history", "paper_trades", "trade_id",
+         ("trade_id", "profile", "symbol", "side", "action", "data_json", "executed_at")),
+    )
     
-    def __init__(self, db_path: str = None, profile: str = "default"):
+    # Upsert statement per detail table, built once so every save passes the
+    # same SQL text to sqlite3's prepared-statement cache
+    UPSERT_SQL = {
+        table: _upsert_sql(table, key, columns)
+        for _, table, key, columns in DETAIL_TABLES
+    }
+    
+    # Detail-table indexes: table -> ((index name, indexed target), ...).
+    # The trade indexes serve get_trade_history(): filter on profile
+    # (+ symbol/action), newest first.
+    DETAIL_INDEXES = {
+        "paper_positions": (
+            ("idx_positions_profile_status", "paper_positions(profile, status)"),
+            ("idx_positions_symbol", "paper_positions(symbol)"),
+        ),
+        "paper_orders": (
+            ("idx_orders_profile", "paper_orders(profile)"),
+        ),
+        "paper_trades": (
+            ("idx_trades_profile_time", "paper_trades(profile, executed_at DESC)"),
+            ("idx_trades_profile_symbol_action_time", "paper_trades(profile, symbol, action, executed_at DESC)"),
+        ),
+    }
+    
+    # Full rewrites of at least this many rows drop the table's indexes and
+    # build them once afterwards instead of updating them row by row
+    REBUILD_INDEXES_MIN_ROWS = 5000
+    
+    # sqlite3 prepared-statement cache size per connection (library default: 128)
+    CACHED_STATEMENTS = 512
+    
+    def __init__(
+        self,
+        db_path: str = None,
+        profile: str = "default",
+        synchronous: str = "NORMAL",
+    ):
         """
         Initialize the database.
         
         Args:
             db_path: Path to SQLite database file (default: ~/.mudrex/paper_trading.db)
             profile: Named profile for multiple paper trading setups
+            synchronous: SQLite synchronous level. NORMAL is durable across
+                application crashes in WAL mode; OFF suits throwaway databases.
         """
+        synchronous = synchronous.upper()
+        if synchronous not in self.SYNCHRONOUS_MODES:
+            raise ValueError(
+                f"synchronous must be one of {', '.join(self.SYNCHRONOUS_MODES)}, got {synchronous!r}"
+            )
         if db_path is None:
             db_path = os.path.expanduser("~/.mudrex/paper_trading.db")
         
         self.db_path = os.path.expanduser(db_path)
         self.profile = profile
+        self.synchronous = synchronous
+        
+        # One connection per PaperDB, opened lazily and shared by all calls
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.RLock()
+        
+        # Exported entry last written per detail row (one {id: dict} dict per
+        # DETAIL_TABLES entry); None until the first save
+        self._saved_rows: Optional[Tuple[Dict[str, dict], ...]] = None
         
         # Ensure directory exists
         db_dir = os.path.dirname(self.db_path)
@@ -79,14 +260,46 @@ class PaperDB:
         self._init_schema()
     
     def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
-        conn = sqlite3.connect(self.db_path)
+        """Get the shared database connection, opening it on first use."""
+        if self._conn is not None:
+            return self._conn
+        
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=self.CACHED_STATEMENTS,
+        )
         conn.row_factory = sqlite3.Row
+        
+        # WAL: commits append to the log instead of rewriting pages, and
+        # readers no longer block the writer
+        conn.execute("PRAGMA journal_mode=WAL")
+        
+        conn.execute(f"PRAGMA synchronous={self.synchronous}")
+        for pragma in self.CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        
+        self._conn = conn
         return conn
     
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Hold the lock on the shared connection for one transaction."""
+        with self._lock:
+            conn = self._get_connection()
+            with conn:
+                yield conn
+    
+    def close(self) -> None:
+        """Close the database connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+    
     def _init_schema(self) -> None:
         """Initialize database schema."""
-        with self._get_connection() as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             
             # Schema version table
@@ -155,10 +368,12 @@ class PaperDB:
             """)
             
             # Create indexes
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_positions_profile ON paper_positions(profile)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_positions_symbol ON paper_positions(symbol)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_orders_profile ON paper_orders(profile)")
-            cursor.execute("CREATE INDEX IF NOT EXISTS idx_trades_profile ON paper_trades(profile)")
+            for table in self.DETAIL_INDEXES:
+                self._create_indexes(cursor, table)
+            
+            # Single-column profile indexes are prefixes of the ones above
+            cursor.execute("DROP INDEX IF EXISTS idx_positions_profile")
+            cursor.execute("DROP INDEX IF EXISTS idx_trades_profile")
             
             conn.commit()
             
@@ -168,10 +383,11 @@ class PaperDB:
         """Migrate schema to latest version."""
         cursor = conn.cursor()
         
-        if from_version < 1:
-            # Initial schema - no migration needed
-            cursor.execute("INSERT OR REPLACE INTO schema_version (version) VALUES (?)", 
-                          (self.SCHEMA_VERSION,))
+        # v1 -> v2: existing TEXT rows stay readable as-is (_unpack detects
+        # compressed BLOBs), so only the version number changes
+        cursor.execute("DELETE FROM schema_version")
+        cursor.execute("INSERT INTO schema_version (version) VALUES (?)", 
+                      (self.SCHEMA_VERSION,))
         
         conn.commit()
         logger.info(f"Schema migrated from v{from_version} to v{self.SCHEMA_VERSION}")
@@ -180,79 +396,130 @@ class PaperDB:
         """
         Save engine state to database.
         
+        Detail rows are written incrementally: only positions, orders and
+        trades that changed since this instance's last save are upserted,
+        and rows that disappeared are deleted. The first save (and
+        full_save()) rewrites every row for the profile.
+        
         Args:
             engine: PaperTradingEngine instance to save
         """
         state = engine.export_state()
-        state_json = json.dumps(state, cls=DecimalEncoder)
         now = datetime.utcnow().isoformat()
         
-        with self._get_connection() as conn:
+        # Positions, orders and trades live only in their detail tables
+        detail_keys = {spec[0] for spec in self.DETAIL_TABLES}
+        state_json = _pack(_to_json(
+            {key: value for key, value in state.items() if key not in detail_keys}
+        ))
+        profile = self.profile
+        
+        # Detail entries per DETAIL_TABLES entry, keyed by row id. Only new or
+        # changed ones are serialized and compressed, and that happens before
+        # the write transaction so it stays short.
+        current = (
+            state.get("positions", {}),
+            state.get("orders", {}),
+            {trade.get("trade_id", ""): trade for trade in state.get("trade_history", [])},
+        )
+        saved = self._saved_rows
+        detail_rows = []
+        for index, (state_key, _, _, _) in enumerate(self.DETAIL_TABLES):
+            previous = saved[index] if saved is not None else {}
+            detail_rows.append([
+                self._detail_row(state_key, row_id, data, now)
+                for row_id, data in current[index].items()
+                if previous.get(row_id) != data
+            ])
+        
+        with self._transaction() as conn:
             cursor = conn.cursor()
             
+            # Take the write lock up front rather than on the first INSERT
+            cursor.execute("BEGIN IMMEDIATE")
+            
             # Save main state
             cursor.execute("""
                 INSERT OR REPLACE INTO paper_state (profile, state_json, created_at, updated_at)
                 VALUES (?, ?, COALESCE((SELECT created_at FROM paper_state WHERE profile = ?), ?), ?)
-            """, (self.profile, state_json, self.profile, now, now))
-            
-            # Clear and repopulate detail tables
-            cursor.execute("DELETE FROM paper_positions WHERE profile = ?", (self.profile,))
-            cursor.execute("DELETE FROM paper_orders WHERE profile = ?", (self.profile,))
-            cursor.execute("DELETE FROM paper_trades WHERE profile = ?", (self.profile,))
-            
-            # Save positions
-            for pos_id, pos_data in state.get("positions", {}).items():
-                cursor.execute("""
-                    INSERT INTO paper_positions 
-                    (position_id, profile, symbol, side, status, data_json, opened_at, closed_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    pos_id,
-                    self.profile,
-                    pos_data.get("symbol", ""),
-                    pos_data.get("side", ""),
-                    pos_data.get("status", ""),
-                    json.dumps(pos_data, cls=DecimalEncoder),
-                    pos_data.get("opened_at", now),
-                    pos_data.get("closed_at"),
-                ))
-            
-            # Save orders
-            for order_id, order_data in state.get("orders", {}).items():
-                cursor.execute("""
-                    INSERT INTO paper_orders 
-                    (order_id, profile, symbol, status, data_json, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    order_id,
-                    self.profile,
-                    order_data.get("symbol", ""),
-                    order_data.get("status", ""),
-                    json.dumps(order_data, cls=DecimalEncoder),
-                    order_data.get("created_at", now),
-                ))
-            
-            # Save trades
-            for trade_data in state.get("trade_history", []):
-                cursor.execute("""
-                    INSERT INTO paper_trades 
-                    (trade_id, profile, symbol, side, action, data_json, executed_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    trade_data.get("trade_id", ""),
-                    self.profile,
-                    trade_data.get("symbol", ""),
-                    trade_data.get("side", ""),
-                    trade_data.get("action", ""),
-                    json.dumps(trade_data, cls=DecimalEncoder),
-                    trade_data.get("executed_at", now),
-                ))
-            
-            conn.commit()
-            
+            """, (profile, state_json, profile, now, now))
+            
+            for index, (_, table, key, _) in enumerate(self.DETAIL_TABLES):
+                rows = detail_rows[index]
+                rebuild_indexes = False
+                if saved is None:
+                    # Full rewrite: clear the profile's rows and insert them all
+                    rebuild_indexes = len(rows) >= self.REBUILD_INDEXES_MIN_ROWS
+                    if rebuild_indexes:
+                        for name, _ in self.DETAIL_INDEXES[table]:
+                            cursor.execute(f"DROP INDEX IF EXISTS {name}")
+                    cursor.execute(f"DELETE FROM {table} WHERE profile = ?", (profile,))
+                else:
+                    # Incremental: drop vanished rows; rows holds only new or changed ones
+                    removed = [(row_id,) for row_id in saved[index] if row_id not in current[index]]
+                    if removed:
+                        cursor.executemany(f"DELETE FROM {table} WHERE {key} = ?", removed)
+                
+                if rows:
+                    cursor.executemany(self.UPSERT_SQL[table], rows)
+                if rebuild_indexes:
+                    self._create_indexes(cursor, table)
+        
+        # Remember what is now on disk (only after the commit succeeded)
+        self._saved_rows = current
+        
         logger.info(f"State saved for profile '{self.profile}'")
     
+    def _detail_row(self, state_key: str, row_id: str, data: dict, now: str) -> tuple:
+        """One detail-table row, in DETAIL_TABLES column order."""
+        data_json = _pack(_to_json(data))
+        if state_key == "positions":
+            return (
+                row_id,
+                self.profile,
+                data.get("symbol", ""),
+                data.get("side", ""),
+                data.get("status", ""),
+                data_json,
+                data.get("opened_at", now),
+                data.get("closed_at"),
+            )
+        if state_key == "orders":
+            return (
+                row_id,
+                self.profile,
+                data.get("symbol", ""),
+                data.get("status", ""),
+                data_json,
+                data.get("created_at", now),
+            )
+        return (
+            row_id,
+            self.profile,
+            data.get("symbol", ""),
+            data.get("side", ""),
+            data.get("action", ""),
+            data_json,
+            data.get("executed_at", now),
+        )
+    
+    def full_save(self, engine: "PaperTradingEngine") -> None:
+        """
+        Save engine state, rewriting every detail row for the profile.
+        
+        Use this when another process may have written the same profile.
+        
+        Args:
+            engine: PaperTradingEngine instance to save
+        """
+        self._saved_rows = None
+        self.save_state(engine)
+    
+    def _create_indexes(self, cursor: sqlite3.Cursor, table: str) -> None:
+        """Create the DETAIL_INDEXES for one table (no-op if present)."""
+        for name, target in self.DETAIL_INDEXES[table]:
+            cursor.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {target}")
+    
     def load_state(self) -> Optional[dict]:
         """
         Load engine state from database.
@@ -260,7 +527,7 @@ class PaperDB:
         Returns:
             State dictionary or None if no saved state
         """
-        with self._get_connection() as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             
             cursor.execute(
@@ -269,13 +536,27 @@ class PaperDB:
             )
             row = cursor.fetchone()
             
-            if row:
-                state = json.loads(row["state_json"])
-                logger.info(f"State loaded for profile '{self.profile}'")
-                return state
+            if not row:
+                logger.info(f"No saved state found for profile '{self.profile}'")
+                return None
             
-            logger.info(f"No saved state found for profile '{self.profile}'")
-            return None
+            state = json.loads(_unpack(row["state_json"]))
+            
+            # States saved before the detail tables became the source of
+            # truth carry positions, orders and trades inline
+            if "positions" not in state:
+                for state_key, table, key, _ in self.DETAIL_TABLES:
+                    cursor.execute(
+                        f"SELECT {key}, data_json FROM {table} WHERE profile = ? ORDER BY rowid",
+                        (self.profile,)
+                    )
+                    if state_key == "trade_history":
+                        state[state_key] = [json.loads(_unpack(r["data_json"])) for r in cursor]
+                    else:
+                        state[state_key] = {r[key]: json.loads(_unpack(r["data_json"])) for r in cursor}
+            
+            logger.info(f"State loaded for profile '{self.profile}'")
+            return state
     
     def delete_state(self) -> bool:
         """
@@ -284,13 +565,14 @@ class PaperDB:
         Returns:
             True if state was deleted
         """
-        with self._get_connection() as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             
             cursor.execute("DELETE FROM paper_state WHERE profile = ?", (self.profile,))
             cursor.execute("DELETE FROM paper_positions WHERE profile = ?", (self.profile,))
             cursor.execute("DELETE FROM paper_orders WHERE profile = ?", (self.profile,))
             cursor.execute("DELETE FROM paper_trades WHERE profile = ?", (self.profile,))
+            self._saved_rows = None
             
             deleted = cursor.rowcount > 0
             conn.commit()
@@ -307,7 +589,7 @@ class PaperDB:
         Returns:
             List of profile names
         """
-        with self._get_connection() as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             cursor.execute("SELECT profile FROM paper_state ORDER BY updated_at DESC")
             return [row["profile"] for row in cursor.fetchall()]
@@ -324,46 +606,31 @@ class PaperDB:
         """
         profile = profile or self.profile
         
-        with self._get_connection() as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             
+            # One statement for the state row and all three detail counts
             cursor.execute("""
-                SELECT profile, created_at, updated_at, 
-                       LENGTH(state_json) as state_size
-                FROM paper_state WHERE profile = ?
+                SELECT s.profile, s.created_at, s.updated_at,
+                       LENGTH(s.state_json) AS state_size,
+                       (SELECT COUNT(*) FROM paper_positions WHERE profile = s.profile) AS positions_count,
+                       (SELECT COUNT(*) FROM paper_orders WHERE profile = s.profile) AS orders_count,
+                       (SELECT COUNT(*) FROM paper_trades WHERE profile = s.profile) AS trades_count
+                FROM paper_state s WHERE s.profile = ?
             """, (profile,))
             row = cursor.fetchone()
             
             if not row:
                 return None
             
-            # Count positions and orders
-            cursor.execute(
-                "SELECT COUNT(*) as count FROM paper_positions WHERE profile = ?",
-                (profile,)
-            )
-            positions_count = cursor.fetchone()["count"]
-            
-            cursor.execute(
-                "SELECT COUNT(*) as count FROM paper_orders WHERE profile = ?",
-                (profile,)
-            )
-            orders_count = cursor.fetchone()["count"]
-            
-            cursor.execute(
-                "SELECT COUNT(*) as count FROM paper_trades WHERE profile = ?",
-                (profile,)
-            )
-            trades_count = cursor.fetchone()["count"]
-            
             return {
                 "profile": row["profile"],
                 "created_at": row["created_at"],
                 "updated_at": row["updated_at"],
                 "state_size_bytes": row["state_size"],
-                "positions_count": positions_count,
-                "orders_count": orders_count,
-                "trades_count": trades_count,
+                "positions_count": row["positions_count"],
+                "orders_count": row["orders_count"],
+                "trades_count": row["trades_count"],
             }
     
     def get_trade_history(
@@ -383,7 +650,7 @@ class PaperDB:
         Returns:
             List of trade records
         """
-        with self._get_connection() as conn:
+        with self._transaction() as conn:
             cursor = conn.cursor()
             
             query = "SELECT data_json FROM paper_trades WHERE profile = ?"
@@ -402,7 +669,7 @@ class PaperDB:
             
             cursor.execute(query, params)
             
-            return [json.loads(row["data_json"]) for row in cursor.fetchall()]
+            return [json.loads(_unpack(row["data_json"])) for row in cursor.fetchall()]
     
     def export_to_json(self, filepath: str) -> None:
         """
@@ -444,10 +711,30 @@ class InMemoryPaperDB:
     
     def __init__(self):
         self._state = None
+        
+        # Trade history is append-only: remember how many records were
+        # exported (and the last of them) so each save converts only new ones
+        self._saved_trade_count = 0
+        self._last_saved_trade: Any = None
+        self._trade_dicts: List[dict] = []
     
     def save_state(self, engine: "PaperTradingEngine") -> None:
         """Save state to memory."""
-        self._state = engine.export_state()
+        trades = engine.trade_history
+        count = self._saved_trade_count
+        if count and (len(trades) < count or trades[count - 1] is not self._last_saved_trade):
+            # History was replaced or cleared: export it all again
+            self._trade_dicts = []
+            count = 0
+        
+        state = engine.export_state(trade_history_from=count)
+        self._trade_dicts.extend(state["trade_history"])
+        # Each saved state gets its own list, so an earlier load never changes
+        state["trade_history"] = list(self._trade_dicts)
+        
+        self._saved_trade_count = len(trades)
+        self._last_saved_trade = trades[-1] if trades else None
+        self._state = state
     
     def load_state(self) -> Optional[dict]:
         """Load state from memory."""
@@ -457,4 +744,7 @@ class InMemoryPaperDB:
         """Delete state from memory."""
         had_state = self._state is not None
         self._state = None
+        self._saved_trade_count = 0
+        self._last_saved_trade = None
+        self._trade_dicts = []
         return had_state
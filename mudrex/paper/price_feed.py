@@ -8,9 +8,13 @@ Includes caching to minimize API calls and respect rate limits.
 
 import time
 import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from decimal import Decimal
-from typing import Dict, Optional, Tuple, TYPE_CHECKING, Callable
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING, Callable, Union
 
+from mudrex.exceptions import MudrexAPIError, MudrexNotFoundError
 from mudrex.paper.exceptions import PriceFetchError, SymbolNotFoundError
 
 if TYPE_CHECKING:
@@ -19,12 +23,35 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _is_not_found(error: Exception, match_404: bool = False) -> bool:
+    """
+    Whether an assets API failure means the symbol does not exist.
+    
+    SDK errors are classified by type and HTTP status first. The API also
+    reports unknown assets with other client-error statuses (e.g. a 400
+    "Asset not found"), so their message is still checked; server errors
+    never count, whatever their message says.
+    """
+    if isinstance(error, MudrexNotFoundError):
+        return True
+    if isinstance(error, MudrexAPIError):
+        if error.status_code == 404:
+            return True
+        if error.status_code is not None and error.status_code >= 500:
+            return False
+        return "not found" in error.message.lower()
+    
+    text = str(error)
+    return "not found" in text.lower() or (match_404 and "404" in text)
+
+
 class PriceFeedService:
     """
     Fetches real prices from Mudrex for paper trading simulation.
     
     Features:
     - Caching with configurable TTL (default: 3 seconds)
+    - Short-lived negative cache for unknown symbols
     - Graceful error handling
     - Asset info caching for validation
     
@@ -37,11 +64,16 @@ class PriceFeedService:
         >>> print(f"BTC Price: ${price}")
     """
     
+    # Most unknown symbols remembered at once (oldest evicted first)
+    MAX_INVALID_SYMBOLS = 1024
+    
     def __init__(
         self,
         assets_api: "AssetsAPI",
         cache_ttl: int = 3,
         asset_cache_ttl: int = 300,  # 5 minutes for asset metadata
+        max_fetch_workers: int = 8,
+        negative_ttl: int = 60,
     ):
         """
         Initialize the price feed service.
@@ -50,19 +82,40 @@ class PriceFeedService:
             assets_api: The AssetsAPI instance for fetching prices
             cache_ttl: Cache time-to-live in seconds for prices
             asset_cache_ttl: Cache TTL for asset metadata (min qty, leverage, etc.)
+            max_fetch_workers: Max concurrent price requests in get_prices_batch()
+                (1 fetches sequentially). The client's rate limiter still
+                spaces out the requests themselves.
+            negative_ttl: Seconds to answer "not found" for an unknown symbol
+                without asking the API again
         """
         self.assets_api = assets_api
         self.cache_ttl = cache_ttl
         self.asset_cache_ttl = asset_cache_ttl
+        self.max_fetch_workers = max_fetch_workers
+        self.negative_ttl = negative_ttl
         
-        # Price cache: symbol -> (price, timestamp)
+        # Price cache: symbol -> (price, time.monotonic() when fetched)
         self._price_cache: Dict[str, Tuple[Decimal, float]] = {}
         
-        # Asset info cache: symbol -> (asset_info, timestamp)
+        # Asset info cache: symbol -> (asset_info, time.monotonic() when fetched)
         self._asset_cache: Dict[str, Tuple[dict, float]] = {}
         
+        # Parsed validation bounds: (symbol, min key) -> (asset_info, min, max),
+        # valid while asset_info is still the cached object
+        self._bounds_cache: Dict[Tuple[str, str], Tuple[dict, Any, Any]] = {}
+        
         # Track symbols we've verified exist
         self._valid_symbols: set = set()
+        
+        # Symbols the API reported as not found: symbol -> time.monotonic()
+        # (shared with get_prices_batch() worker threads, hence the lock)
+        self._invalid_symbols: "OrderedDict[str, float]" = OrderedDict()
+        self._invalid_lock = threading.Lock()
+        
+        # Worker pool for get_prices_batch(), started on first concurrent
+        # fetch and kept until close()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
     
     def get_price(self, symbol: str) -> Decimal:
         """
@@ -78,16 +131,23 @@ class PriceFeedService:
             SymbolNotFoundError: If symbol is invalid
             PriceFetchError: If unable to fetch price
         """
-        now = time.time()
-        
+        return self._get_price_at(symbol, time.monotonic())
+    
+    def _get_price_at(self, symbol: str, now: float) -> Decimal:
+        """get_price() with the caller's monotonic clock reading."""
         # Check cache first
-        if symbol in self._price_cache:
-            price, cached_at = self._price_cache[symbol]
-            if now - cached_at < self.cache_ttl:
-                logger.debug(f"Price cache hit for {symbol}: {price}")
-                return price
+        cached = self._price_cache.get(symbol)
+        if cached is not None and cached[1] > now - self.cache_ttl:
+            logger.debug("Price cache hit for %s: %s", symbol, cached[0])
+            return cached[0]
+        
+        return self._fetch_price(symbol, now)
+    
+    def _fetch_price(self, symbol: str, now: float) -> Decimal:
+        """Fetch a symbol's price from the API and cache it as of `now`."""
+        if self._is_known_invalid(symbol, now):
+            raise SymbolNotFoundError(symbol)
         
-        # Fetch fresh price
         try:
             asset = self.assets_api.get(symbol)
             
@@ -97,17 +157,19 @@ class PriceFeedService:
             if not price_str:
                 raise PriceFetchError(symbol, "No price field in asset data")
             
-            price = Decimal(str(price_str))
+            # Asset.price is already a string; only other types need str()
+            price = Decimal(price_str if type(price_str) is str else str(price_str))
             
             # Update cache
             self._price_cache[symbol] = (price, now)
             self._valid_symbols.add(symbol)
             
-            logger.debug(f"Fetched price for {symbol}: {price}")
+            logger.debug("Fetched price for %s: %s", symbol, price)
             return price
             
         except Exception as e:
-            if "not found" in str(e).lower() or "404" in str(e):
+            if _is_not_found(e, match_404=True):
+                self._mark_invalid(symbol, now)
                 raise SymbolNotFoundError(symbol)
             raise PriceFetchError(symbol, str(e))
     
@@ -121,13 +183,15 @@ class PriceFeedService:
         Returns:
             Dictionary with asset information
         """
-        now = time.time()
+        now = time.monotonic()
         
         # Check cache
-        if symbol in self._asset_cache:
-            info, cached_at = self._asset_cache[symbol]
-            if now - cached_at < self.asset_cache_ttl:
-                return info
+        cached = self._asset_cache.get(symbol)
+        if cached is not None and cached[1] > now - self.asset_cache_ttl:
+            return cached[0]
+        
+        if self._is_known_invalid(symbol, now):
+            raise SymbolNotFoundError(symbol)
         
         # Fetch fresh
         try:
@@ -150,31 +214,106 @@ class PriceFeedService:
             return info
             
         except Exception as e:
-            if "not found" in str(e).lower():
+            if _is_not_found(e):
+                self._mark_invalid(symbol, now)
                 raise SymbolNotFoundError(symbol)
             raise PriceFetchError(symbol, str(e))
     
+    def _is_known_invalid(self, symbol: str, now: float) -> bool:
+        """True if the API reported symbol as not found within negative_ttl."""
+        invalid = self._invalid_symbols
+        if symbol not in invalid:
+            return False
+        
+        with self._invalid_lock:
+            marked_at = invalid.get(symbol)
+            if marked_at is not None and marked_at > now - self.negative_ttl:
+                return True
+            invalid.pop(symbol, None)
+        return False
+    
+    def _mark_invalid(self, symbol: str, now: float) -> None:
+        """Remember a not-found symbol, evicting the oldest beyond the cap."""
+        with self._invalid_lock:
+            invalid = self._invalid_symbols
+            invalid[symbol] = now
+            invalid.move_to_end(symbol)
+            while len(invalid) > self.MAX_INVALID_SYMBOLS:
+                invalid.popitem(last=False)
+    
     def get_prices_batch(self, symbols: list) -> Dict[str, Decimal]:
         """
         Get prices for multiple symbols.
         
-        Note: This fetches one at a time due to Mudrex API design.
+        Note: Mudrex has no batch price endpoint, so each stale symbol is
+        its own request; up to ``max_fetch_workers`` run concurrently.
         Results are cached for subsequent calls.
         
+        Freshness is judged for the whole batch against one clock reading;
+        cached prices are returned directly and only stale or missing
+        symbols are fetched.
+        
         Args:
             symbols: List of trading symbols
             
         Returns:
             Dictionary mapping symbol to price
         """
+        now = time.monotonic()
+        fresh_after = now - self.cache_ttl
+        cache = self._price_cache
+        
         prices = {}
+        stale = []
         for symbol in symbols:
+            cached = cache.get(symbol)
+            if cached is not None and cached[1] > fresh_after:
+                prices[symbol] = cached[0]
+            else:
+                stale.append(symbol)
+        
+        for symbol, result in zip(stale, self._fetch_prices(stale, now)):
+            if isinstance(result, Decimal):
+                prices[symbol] = result
+            else:
+                logger.warning(f"Failed to fetch price for {symbol}: {result}")
+        return prices
+    
+    def _fetch_prices(
+        self,
+        symbols: List[str],
+        now: float,
+    ) -> List[Union[Decimal, SymbolNotFoundError, PriceFetchError]]:
+        """Fetch several prices, concurrently when allowed; errors are returned, not raised."""
+        def fetch(symbol: str) -> Union[Decimal, SymbolNotFoundError, PriceFetchError]:
             try:
-                prices[symbol] = self.get_price(symbol)
+                return self._fetch_price(symbol, now)
             except (SymbolNotFoundError, PriceFetchError) as e:
-                logger.warning(f"Failed to fetch price for {symbol}: {e}")
-                continue
-        return prices
+                return e
+        
+        workers = min(self.max_fetch_workers, len(symbols))
+        if workers <= 1:
+            return [fetch(symbol) for symbol in symbols]
+        
+        # Network-bound: threads overlap the round trips
+        return list(self._get_executor().map(fetch, symbols))
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Get the shared fetch pool, starting it on first use."""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_fetch_workers,
+                    thread_name_prefix="price-feed",
+                )
+            return self._executor
+    
+    def close(self) -> None:
+        """Shut down the fetch worker threads (restarted on next use)."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
     
     def is_valid_symbol(self, symbol: str) -> bool:
         """
@@ -195,6 +334,18 @@ class PriceFeedService:
         except (SymbolNotFoundError, PriceFetchError):
             return False
     
+    def _bounds(self, symbol: str, min_key: str, max_key: str, parse: Callable) -> Tuple[Any, Any]:
+        """Asset info min/max pair, parsed once per fetched asset info."""
+        info = self.get_asset_info(symbol)
+        key = (symbol, min_key)
+        cached = self._bounds_cache.get(key)
+        if cached is not None and cached[0] is info:
+            return cached[1], cached[2]
+        
+        low, high = parse(info[min_key]), parse(info[max_key])
+        self._bounds_cache[key] = (info, low, high)
+        return low, high
+    
     def validate_quantity(self, symbol: str, quantity: Decimal) -> Tuple[bool, str]:
         """
         Validate that a quantity is valid for a symbol.
@@ -207,9 +358,7 @@ class PriceFeedService:
             Tuple of (is_valid, error_message)
         """
         try:
-            info = self.get_asset_info(symbol)
-            min_qty = Decimal(info["min_quantity"])
-            max_qty = Decimal(info["max_quantity"])
+            min_qty, max_qty = self._bounds(symbol, "min_quantity", "max_quantity", Decimal)
             
             if quantity < min_qty:
                 return False, f"Quantity {quantity} below minimum {min_qty}"
@@ -233,9 +382,7 @@ class PriceFeedService:
             Tuple of (is_valid, error_message)
         """
         try:
-            info = self.get_asset_info(symbol)
-            min_lev = int(info["min_leverage"])
-            max_lev = int(info["max_leverage"])
+            min_lev, max_lev = self._bounds(symbol, "min_leverage", "max_leverage", int)
             
             if leverage < min_lev:
                 return False, f"Leverage {leverage}x below minimum {min_lev}x"
@@ -251,6 +398,9 @@ class PriceFeedService:
         """Clear all caches."""
         self._price_cache.clear()
         self._asset_cache.clear()
+        self._bounds_cache.clear()
+        with self._invalid_lock:
+            self._invalid_symbols.clear()
         logger.info("Price feed cache cleared")
     
     def get_cache_stats(self) -> dict:
@@ -259,6 +409,7 @@ class PriceFeedService:
             "price_cache_size": len(self._price_cache),
             "asset_cache_size": len(self._asset_cache),
             "valid_symbols": len(self._valid_symbols),
+            "invalid_symbols": len(self._invalid_symbols),
             "cache_ttl": self.cache_ttl,
             "asset_cache_ttl": self.asset_cache_ttl,
         }
@@ -321,6 +472,9 @@ class MockPriceFeedService:
         """Get prices for multiple symbols."""
         return {s: self.prices[s] for s in symbols if s in self.prices}
     
+    def close(self) -> None:
+        """No resources to release."""
+    
     def is_valid_symbol(self, symbol: str) -> bool:
         """Check if symbol is valid."""
         return symbol in self.prices
@@ -9,24 +9,78 @@ import logging
 import threading
 import time
 from decimal import Decimal
-from typing import TYPE_CHECKING, Callable, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
 
-from mudrex.paper.models import PaperPositionStatus, CloseReason
+from mudrex.paper.models import PaperPosition, PaperPositionStatus, CloseReason, update_all_pnls
 
 if TYPE_CHECKING:
     from mudrex.paper.engine import PaperTradingEngine
 
 logger = logging.getLogger(__name__)
 
+# Trigger log formats (%-style, formatted by logging only when emitted)
+_SL_TRIGGERED_FMT = "🔴 STOP-LOSS TRIGGERED: %s %s %s @ %s"
+_TP_TRIGGERED_FMT = "🟢 TAKE-PROFIT TRIGGERED: %s %s %s @ %s"
+_LIQ_WARNING_FMT = "⚠️ LIQUIDATION WARNING: %s %s is %.1f%% from liquidation (current: %s, liq: %s)"
+
+
+def _as_decimal(value) -> Decimal:
+    """
+    Price field as Decimal.
+    
+    Position prices are stored as Decimal already, so this is normally just
+    a type check; str or float values set by direct engine callers are
+    converted.
+    """
+    return value if type(value) is Decimal else Decimal(str(value))
+
+
+def check_triggers(
+    positions: Iterable[PaperPosition],
+    price: Decimal,
+) -> List[Tuple[PaperPosition, CloseReason]]:
+    """
+    Find every position whose SL or TP is hit at one symbol's price.
+    
+    Take-profit wins when both are hit.
+    
+    Args:
+        positions: Open positions, all on the symbol `price` is for
+        price: Current price of that symbol
+    
+    Returns:
+        (position, close reason) for each hit, in input order
+    """
+    hits = []
+    for position in positions:
+        tp = position.takeprofit_price
+        sl = position.stoploss_price
+        if not tp and not sl:
+            continue
+        
+        # LONG: TP above, SL below; SHORT mirrors both
+        if position.is_long:
+            if tp and price >= _as_decimal(tp):
+                hits.append((position, CloseReason.TAKEPROFIT))
+            elif sl and price <= _as_decimal(sl):
+                hits.append((position, CloseReason.STOPLOSS))
+        else:
+            if tp and price <= _as_decimal(tp):
+                hits.append((position, CloseReason.TAKEPROFIT))
+            elif sl and price >= _as_decimal(sl):
+                hits.append((position, CloseReason.STOPLOSS))
+    return hits
+
 
 class SLTPMonitor:
     """
     Background task that monitors positions for stop-loss/take-profit triggers.
     
     Design:
-    - Polling-based (no websocket complexity in V1)
-    - Configurable interval (default: 5 seconds)
+    - Polling-based; on_price() also accepts pushed prices from a stream
+    - Configurable interval (default: 5 seconds), backing off while idle
     - Uses last traded price from Mudrex API
+    - Short-lived price cache (optionally kept warm by a prefetch thread)
     - Thread-safe
     
     Example:
@@ -51,6 +105,9 @@ class SLTPMonitor:
         on_sl_triggered: Optional[Callable] = None,
         on_tp_triggered: Optional[Callable] = None,
         on_liquidation_warning: Optional[Callable] = None,
+        price_ttl: float = 1.0,
+        prefetch: bool = False,
+        poll_max: float = 60.0,
     ):
         """
         Initialize the SL/TP monitor.
@@ -61,17 +118,41 @@ class SLTPMonitor:
             on_sl_triggered: Callback when stop-loss triggers
             on_tp_triggered: Callback when take-profit triggers
             on_liquidation_warning: Callback when position nears liquidation
+            price_ttl: Seconds a fetched price is reused by checks (0 disables)
+            prefetch: Refresh open-position prices from a second thread every
+                interval/2 seconds, so checks mostly read the cache
+            poll_max: Longest gap between full checks while there are no open
+                positions or pending orders (the gap doubles from `interval`)
         """
         self.engine = engine
         self.interval = interval
         self.on_sl_triggered = on_sl_triggered
         self.on_tp_triggered = on_tp_triggered
         self.on_liquidation_warning = on_liquidation_warning
+        self.price_ttl = price_ttl
+        self.prefetch = prefetch
+        self.poll_max = max(poll_max, interval)
+        
+        # Current gap between checks: interval, doubled per idle check
+        self._current_sleep = interval
+        self._wake_event = threading.Event()
         
-        self._running = False
+        # Set while stopped; cleared by start(). Loops wait on it instead of sleeping
+        self._stop_event = threading.Event()
+        self._stop_event.set()
         self._thread: Optional[threading.Thread] = None
+        self._prefetch_thread: Optional[threading.Thread] = None
         self._lock = threading.Lock()
         
+        # Price cache: symbol -> (price, time.monotonic() when fetched)
+        self._price_cache: Dict[str, Tuple[Decimal, float]] = {}
+        
+        # Open positions, and the same grouped by symbol, as of
+        # engine.positions_version (see _open_snapshot)
+        self._open_positions: List[PaperPosition] = []
+        self._open_by_symbol: Dict[str, List[PaperPosition]] = {}
+        self._positions_version: Optional[int] = None
+        
         # Statistics
         self.sl_triggered_count = 0
         self.tp_triggered_count = 0
@@ -79,37 +160,120 @@ class SLTPMonitor:
     
     def start(self) -> None:
         """Start the background monitoring thread."""
-        if self._running:
+        if not self._stop_event.is_set():
             logger.warning("SL/TP monitor already running")
             return
         
-        self._running = True
+        self._stop_event.clear()
+        self._current_sleep = self.interval
+        self._wake_event.clear()
         self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self._thread.start()
         
+        if self.prefetch:
+            self._prefetch_thread = threading.Thread(target=self._prefetch_loop, daemon=True)
+            self._prefetch_thread.start()
+        
         logger.info(f"SL/TP monitor started (interval: {self.interval}s)")
     
     def stop(self) -> None:
         """Stop the background monitoring thread."""
-        self._running = False
+        self._stop_event.set()
+        self._wake_event.set()
         
         if self._thread and self._thread.is_alive():
             self._thread.join(timeout=self.interval + 1)
+        if self._prefetch_thread and self._prefetch_thread.is_alive():
+            self._prefetch_thread.join(timeout=1)
         
         logger.info("SL/TP monitor stopped")
     
+    def wake(self) -> None:
+        """Run the next check now and reset any idle backoff."""
+        self._current_sleep = self.interval
+        self._wake_event.set()
+    
     def _monitor_loop(self) -> None:
         """Main monitoring loop."""
-        while self._running:
+        while not self._stop_event.is_set():
+            positions_version = self.engine.positions_version
+            idle = False
             try:
-                self.check_all_positions()
+                idle = self.check_all_positions() == 0 and not self.engine.pending_orders
                 self.engine.check_limit_orders()
             except Exception as e:
-                logger.error(f"Error in SL/TP monitor: {e}")
+                logger.error("Error in SL/TP monitor: %s", e)
+            
+            # Nothing to watch: double the gap up to poll_max
+            if idle:
+                self._current_sleep = min(self.poll_max, self._current_sleep * 2)
+            else:
+                self._current_sleep = self.interval
+            self._wait(self._current_sleep, positions_version)
+    
+    def _wait(self, timeout: float, positions_version: int) -> None:
+        """
+        Sleep up to `timeout` seconds between checks.
+        
+        Returns early on stop() or wake(). A backed-off wait also ends
+        within one interval of a position opening or an order being placed.
+        """
+        deadline = time.monotonic() + timeout
+        engine = self.engine
+        while not self._stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            if self._wake_event.wait(min(remaining, self.interval)):
+                break
+            if engine.positions_version != positions_version or engine.pending_orders:
+                self._current_sleep = self.interval
+                break
+        self._wake_event.clear()
+    
+    def _prefetch_loop(self) -> None:
+        """Keep the price cache warm for open positions' symbols."""
+        while not self._stop_event.is_set():
+            try:
+                with self._lock:
+                    symbols = list(self._open_snapshot()[1])
+                if symbols:
+                    self._refresh_prices(symbols)
+            except Exception as e:
+                logger.error("Error prefetching prices: %s", e)
             
-            time.sleep(self.interval)
+            self._stop_event.wait(max(self.interval / 2, 0.1))
+    
+    def _refresh_prices(self, symbols: Iterable[str]) -> Dict[str, Decimal]:
+        """Fetch prices from the feed and store them in the cache."""
+        fetched_at = time.monotonic()
+        prices = self.engine.price_feed.get_prices_batch(list(symbols))
+        cache = self._price_cache
+        for symbol, price in prices.items():
+            cache[symbol] = (price, fetched_at)
+        return prices
+    
+    def _get_prices(self, symbols: Iterable[str]) -> Dict[str, Decimal]:
+        """Prices for symbols, fetching only those not cached within price_ttl."""
+        if self.price_ttl <= 0:
+            return self.engine.price_feed.get_prices_batch(list(symbols))
+        
+        fresh_after = time.monotonic() - self.price_ttl
+        cache = self._price_cache
+        prices = {}
+        stale = []
+        for symbol in symbols:
+            cached = cache.get(symbol)
+            if cached is not None and cached[1] > fresh_after:
+                prices[symbol] = cached[0]
+            else:
+                stale.append(symbol)
+        
+        if stale:
+            prices.update(self._refresh_prices(stale))
+        return prices
     
-    def check_all_positions(self) -> None:
+    def check_all_positions(self) -> int:
         """
         Check all open positions for SL/TP triggers.
         
@@ -118,106 +282,137 @@ class SLTPMonitor:
         2. Fetches current price for each symbol
         3. Checks if SL or TP should trigger
         4. Executes position close if triggered
+        
+        Returns:
+            Number of open positions checked
         """
+        # The lock covers only the snapshot here and each close below, so
+        # price fetches never run while another check or on_price() waits
         with self._lock:
             self.checks_performed += 1
-            
-            # Get all open positions
-            open_positions = list(self.engine.positions.values())
-            open_positions = [p for p in open_positions if p.status == PaperPositionStatus.OPEN]
-            
-            if not open_positions:
-                return
-            
-            # Group by symbol to minimize API calls
-            symbols = set(p.symbol for p in open_positions)
-            prices = self.engine.price_feed.get_prices_batch(list(symbols))
-            
-            for position in open_positions:
-                if position.symbol not in prices:
-                    continue
-                
-                current_price = prices[position.symbol]
-                
-                # Update position PnL
-                position.update_pnl(current_price)
-                
-                # Check triggers
-                triggered = self._check_position_triggers(position, current_price)
-                
-                if not triggered:
-                    # Check liquidation warning
-                    self._check_liquidation_warning(position, current_price)
+            open_positions, by_symbol = self._open_snapshot()
+        
+        if not open_positions:
+            return 0
+        
+        prices = self._get_prices(by_symbol)
+        
+        # Update every position's PnL, then screen each symbol's SL/TP
+        # levels and liquidation distance against its one price
+        self.engine.wallet.unrealized_pnl += update_all_pnls(open_positions, prices)
+        for symbol, group in by_symbol.items():
+            current_price = prices.get(symbol)
+            if current_price is not None:
+                self._check_symbol(group, current_price)
+        
+        return len(open_positions)
     
-    def _check_position_triggers(
-        self,
-        position,
-        current_price: Decimal
-    ) -> bool:
+    def on_price(self, symbol: str, price: Decimal) -> None:
         """
-        Check if SL or TP should trigger for a position.
+        Check a symbol's open positions against a pushed price.
         
-        Priority: TP is checked first (profit-taking is primary intent).
+        For feeding a price stream (e.g. a websocket or a backtest replay)
+        so SL/TP fire on the tick instead of the next poll. The price is
+        also cached, so checks within price_ttl reuse it without a fetch.
         
-        Returns: True if a trigger fired
+        Args:
+            symbol: Trading pair
+            price: Latest traded price
         """
-        # Check Take Profit first (user's primary intent)
-        if position.takeprofit_price:
-            tp = Decimal(str(position.takeprofit_price))
-            
-            if position.side == "LONG" and current_price >= tp:
-                self._trigger_takeprofit(position, current_price)
-                return True
-            elif position.side == "SHORT" and current_price <= tp:
-                self._trigger_takeprofit(position, current_price)
-                return True
-        
-        # Check Stop Loss
-        if position.stoploss_price:
-            sl = Decimal(str(position.stoploss_price))
-            
-            if position.side == "LONG" and current_price <= sl:
-                self._trigger_stoploss(position, current_price)
-                return True
-            elif position.side == "SHORT" and current_price >= sl:
-                self._trigger_stoploss(position, current_price)
-                return True
-        
-        return False
+        self._price_cache[symbol] = (price, time.monotonic())
+        
+        with self._lock:
+            group = self._open_snapshot()[1].get(symbol)
+        if group:
+            self.engine.wallet.unrealized_pnl += update_all_pnls(group, {symbol: price})
+            self._check_symbol(group, price)
+    
+    def _open_snapshot(self) -> Tuple[List[PaperPosition], Dict[str, List[PaperPosition]]]:
+        """
+        Open positions and the same grouped by symbol (one price lookup
+        per symbol), re-read from the engine only when they changed.
+        
+        Callers hold _lock; the lists are replaced, never mutated.
+        """
+        version = self.engine.positions_version
+        if version != self._positions_version:
+            # Read the version first: a change racing with the copy just
+            # means the next check copies again
+            open_positions = []
+            by_symbol: Dict[str, List[PaperPosition]] = {}
+            for p in list(self.engine.positions.values()):
+                if p.status == PaperPositionStatus.OPEN:
+                    open_positions.append(p)
+                    group = by_symbol.get(p.symbol)
+                    if group is None:
+                        by_symbol[p.symbol] = [p]
+                    else:
+                        group.append(p)
+            self._open_positions = open_positions
+            self._open_by_symbol = by_symbol
+            self._positions_version = version
+        return self._open_positions, self._open_by_symbol
+    
+    def _check_symbol(self, positions: List[PaperPosition], current_price: Decimal) -> None:
+        """Fire SL/TP hits and liquidation warnings for one symbol's positions."""
+        triggered = set()
+        for position, reason in check_triggers(positions, current_price):
+            triggered.add(position.position_id)
+            self._fire_trigger(position, current_price, reason)
+        
+        # Liquidation warnings for positions that stayed open
+        for position in positions:
+            if position.position_id not in triggered:
+                self._check_liquidation_warning(position, current_price)
+    
+    def _fire_trigger(self, position, price: Decimal, reason: CloseReason) -> None:
+        """Dispatch a check_triggers() hit to the TP or SL handler."""
+        if reason is CloseReason.TAKEPROFIT:
+            self._trigger_takeprofit(position, price)
+        else:
+            self._trigger_stoploss(position, price)
     
     def _trigger_stoploss(self, position, price: Decimal) -> None:
         """Execute stop-loss close."""
         logger.info(
-            f"🔴 STOP-LOSS TRIGGERED: {position.position_id} "
-            f"{position.side} {position.symbol} @ {price}"
+            _SL_TRIGGERED_FMT,
+            position.position_id, position.side, position.symbol, price,
         )
         
         try:
-            self.engine._close_position_internal(position, price, CloseReason.STOPLOSS)
-            self.sl_triggered_count += 1
+            with self._lock:
+                # A concurrent check may have closed it since the snapshot
+                if position.status != PaperPositionStatus.OPEN:
+                    return
+                self.engine._close_position_internal(position, price, CloseReason.STOPLOSS)
+                self.sl_triggered_count += 1
             
             if self.on_sl_triggered:
                 self.on_sl_triggered(position, price)
                 
         except Exception as e:
-            logger.error(f"Failed to execute stop-loss for {position.position_id}: {e}")
+            logger.error("Failed to execute stop-loss for %s: %s", position.position_id, e)
     
     def _trigger_takeprofit(self, position, price: Decimal) -> None:
         """Execute take-profit close."""
         logger.info(
-            f"🟢 TAKE-PROFIT TRIGGERED: {position.position_id} "
-            f"{position.side} {position.symbol} @ {price}"
+            _TP_TRIGGERED_FMT,
+            position.position_id, position.side, position.symbol, price,
         )
         
         try:
-            self.engine._close_position_internal(position, price, CloseReason.TAKEPROFIT)
-            self.tp_triggered_count += 1
+            with self._lock:
+                # A concurrent check may have closed it since the snapshot
+                if position.status != PaperPositionStatus.OPEN:
+                    return
+                self.engine._close_position_internal(position, price, CloseReason.TAKEPROFIT)
+                self.tp_triggered_count += 1
             
             if self.on_tp_triggered:
                 self.on_tp_triggered(position, price)
                 
         except Exception as e:
-            logger.error(f"Failed to execute take-profit for {position.position_id}: {e}")
+            logger.error("Failed to execute take-profit for %s: %s", position.position_id, e)
     
     def _check_liquidation_warning(self, position, current_price: Decimal) -> None:
         """Check if position is approaching liquidation (warning only)."""
@@ -227,10 +422,10 @@ class SLTPMonitor:
         if not position.liquidation_price:
             return
         
-        liq_price = Decimal(str(position.liquidation_price))
+        liq_price = _as_decimal(position.liquidation_price)
         
         # Calculate distance to liquidation as percentage
-        if position.side == "LONG":
+        if position.is_long:
             distance = (current_price - liq_price) / current_price * 100
             is_near = distance < 10  # Within 10% of liquidation
         else:
@@ -239,8 +434,8 @@ class SLTPMonitor:
         
         if is_near:
             logger.warning(
-                f"⚠️ LIQUIDATION WARNING: {position.position_id} {position.symbol} "
-                f"is {distance:.1f}% from liquidation (current: {current_price}, liq: {liq_price})"
+                _LIQ_WARNING_FMT,
+                position.position_id, position.symbol, distance, current_price, liq_price,
             )
             
             if self.on_liquidation_warning:
@@ -249,8 +444,10 @@ class SLTPMonitor:
     def get_status(self) -> dict:
         """Get monitor status and statistics."""
         return {
-            "running": self._running,
+            "running": self.is_running,
             "interval": self.interval,
+            "price_ttl": self.price_ttl,
+            "current_sleep": self._current_sleep,
             "checks_performed": self.checks_performed,
             "sl_triggered_count": self.sl_triggered_count,
             "tp_triggered_count": self.tp_triggered_count,
@@ -259,7 +456,7 @@ class SLTPMonitor:
     @property
     def is_running(self) -> bool:
         """Check if monitor is running."""
-        return self._running
+        return not self._stop_event.is_set()
 
 
 class ManualTriggerChecker:
@@ -278,9 +475,16 @@ class ManualTriggerChecker:
         ...     time.sleep(5)
     """
     
-    def __init__(self, engine: "PaperTradingEngine"):
+    def __init__(self, engine: "PaperTradingEngine", price_ttl: float = 0.0):
+        """
+        Args:
+            engine: PaperTradingEngine instance to check
+            price_ttl: Seconds to reuse fetched prices between checks. Off by
+                default so each check sees the feed's latest price (e.g. a
+                mock feed stepped through a backtest).
+        """
         self.engine = engine
-        self._monitor = SLTPMonitor(engine, interval=0)
+        self._monitor = SLTPMonitor(engine, interval=0, price_ttl=price_ttl)
     
     def check(self) -> dict:
         """
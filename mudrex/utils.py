@@ -2,7 +2,30 @@
 Helper utilities for smarter order handling.
 """
 
-from typing import Tuple
+from decimal import Decimal
+from functools import lru_cache
+from typing import Tuple, Union
+
+# validate_quantity(): largest accepted distance from a step multiple, in steps
+_STEP_TOLERANCE = 1e-6
+
+
+@lru_cache(maxsize=256, typed=True)
+def step_precision(step: Union[float, str]) -> int:
+    """
+    Decimal places to round to for a quantity or price step.
+    
+    Cached: there are few distinct step sizes across symbols.
+    
+    Args:
+        step: Step size as a number or as the API's string
+    
+    Returns:
+        Digits after the decimal point of str(step) (exponent form such
+        as 1e-05 included), or 0 if there are none
+    """
+    return max(0, -Decimal(str(step)).as_tuple().exponent)
+
 
 def calculate_order_from_usd(
     usd_amount: float,
@@ -28,9 +51,8 @@ def calculate_order_from_usd(
     raw_quantity = usd_amount / price
     rounded_quantity = round(raw_quantity / quantity_step) * quantity_step
     
-    # Determine precision
-    precision = len(str(quantity_step).split('.')[-1]) if '.' in str(quantity_step) else 0
-    rounded_quantity = round(rounded_quantity, precision)
+    # Trim float noise to the step's decimal places
+    rounded_quantity = round(rounded_quantity, step_precision(quantity_step))
     
     actual_value = rounded_quantity * price
     
@@ -51,6 +73,7 @@ def validate_quantity(quantity: float, quantity_step: float) -> bool:
     if quantity_step == 0:
         return True
     
-    remainder = quantity % quantity_step
-    # Allow small floating point errors
-    return abs(remainder) < (quantity_step * 0.01)
+    # Distance to the nearest multiple, allowing float noise of up to a
+    # millionth of a step (e.g. 0.1 * 3 == 0.30000000000000004)
+    multiple = round(quantity / quantity_step)
+    return abs(quantity - multiple * quantity_step) <= _STEP_TOLERANCE * abs(quantity_step)
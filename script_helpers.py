@@ -0,0 +1,20 @@
+"""
+Shared helpers for the manual trading scripts in the repo root.
+"""
+
+import time
+
+
+def wait_for_position(client, symbol, closed=False, timeout=3.0, interval=0.1):
+    """
+    Poll open positions until one for symbol shows up (or, with
+    closed=True, is gone), giving up after timeout seconds.
+    
+    Returns the open position for symbol, or None.
+    """
+    deadline = time.monotonic() + timeout
+    while True:
+        position = next((p for p in client.positions.list_open() if p.symbol == symbol), None)
+        if (position is None) == closed or time.monotonic() >= deadline:
+            return position
+        time.sleep(interval)
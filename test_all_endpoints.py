@@ -5,8 +5,8 @@ Tests all SDK endpoints and performs sample trading.
 """
 
 from mudrex import MudrexClient
+from script_helpers import wait_for_position
 import sys
-import time
 from datetime import datetime
 
 # API Credentials
@@ -68,16 +68,16 @@ def test_assets_endpoints(client):
         # Show first 10 assets
         print_info("First 10 assets:")
         for i, asset in enumerate(assets[:10], 1):
-            print(f"  {i}. {asset.symbol} - ${asset.price if hasattr(asset, 'price') else 'N/A'}")
+            print(f"  {i}. {asset.symbol} - ${getattr(asset, 'price', 'N/A')}")
         
         # Test getting specific asset - ADAUSDT (the one that was failing!)
         print("\n📊 Getting ADAUSDT (Previously Failing Symbol)...")
         ada = client.assets.get("ADAUSDT")
         print_success(f"ADAUSDT Details:")
         print_info(f"  Symbol: {ada.symbol}")
-        print_info(f"  Price: ${ada.price if hasattr(ada, 'price') else 'N/A'}")
-        print_info(f"  Min Quantity: {ada.min_quantity if hasattr(ada, 'min_quantity') else 'N/A'}")
-        print_info(f"  Max Leverage: {ada.max_leverage if hasattr(ada, 'max_leverage') else 'N/A'}x")
+        print_info(f"  Price: ${getattr(ada, 'price', 'N/A')}")
+        print_info(f"  Min Quantity: {getattr(ada, 'min_quantity', 'N/A')}")
+        print_info(f"  Max Leverage: {getattr(ada, 'max_leverage', 'N/A')}x")
         
         # Search for BTC assets
         print("\n📊 Searching for BTC assets...")
@@ -110,7 +110,7 @@ def test_positions_endpoints(client):
         
         if open_positions:
             for pos in open_positions:
-                print_info(f"  {pos.symbol}: Qty {pos.quantity}, PnL ${pos.unrealized_pnl if hasattr(pos, 'unrealized_pnl') else 'N/A'}")
+                print_info(f"  {pos.symbol}: Qty {pos.quantity}, PnL ${getattr(pos, 'unrealized_pnl', 'N/A')}")
         else:
             print_info("  No open positions")
         
@@ -121,7 +121,7 @@ def test_positions_endpoints(client):
         
         if closed_positions:
             for pos in closed_positions[:5]:
-                print_info(f"  {pos.symbol}: PnL ${pos.realized_pnl if hasattr(pos, 'realized_pnl') else 'N/A'}")
+                print_info(f"  {pos.symbol}: PnL ${getattr(pos, 'realized_pnl', 'N/A')}")
         
         return True
     except Exception as e:
@@ -142,7 +142,7 @@ def test_orders_endpoints(client):
         
         if open_orders:
             for order in open_orders:
-                print_info(f"  {order.symbol}: {order.side} {order.quantity} @ {order.price if hasattr(order, 'price') else 'Market'}")
+                print_info(f"  {order.symbol}: {order.side} {order.quantity} @ {getattr(order, 'price', 'Market')}")
         else:
             print_info("  No open orders")
         
@@ -162,8 +162,8 @@ def test_leverage_endpoints(client):
         print("\n📊 Getting Leverage for BTCUSDT...")
         leverage_info = client.leverage.get("BTCUSDT")
         print_success(f"BTCUSDT Leverage:")
-        print_info(f"  Current: {leverage_info.leverage if hasattr(leverage_info, 'leverage') else 'N/A'}x")
-        print_info(f"  Margin Type: {leverage_info.margin_type if hasattr(leverage_info, 'margin_type') else 'N/A'}")
+        print_info(f"  Current: {getattr(leverage_info, 'leverage', 'N/A')}x")
+        print_info(f"  Margin Type: {getattr(leverage_info, 'margin_type', 'N/A')}")
         
         return True
     except Exception as e:
@@ -191,8 +191,9 @@ def perform_sample_trade(client, assets):
         
         # Get current price and details
         asset = client.assets.get(symbol)
-        current_price = float(asset.price) if hasattr(asset, 'price') else None
-        min_qty = float(asset.min_quantity) if hasattr(asset, 'min_quantity') else 1
+        price = getattr(asset, 'price', None)
+        current_price = float(price) if price is not None else None
+        min_qty = float(getattr(asset, 'min_quantity', 1))
         
         print_info(f"\nTrading Asset: {symbol}")
         print_info(f"Current Price: ${current_price}")
@@ -224,26 +225,22 @@ def perform_sample_trade(client, assets):
         )
         
         print_success(f"Order placed successfully!")
-        print_info(f"  Order ID: {order.order_id if hasattr(order, 'order_id') else 'N/A'}")
+        print_info(f"  Order ID: {getattr(order, 'order_id', 'N/A')}")
         print_info(f"  Symbol: {symbol}")
         print_info(f"  Side: LONG")
         print_info(f"  Quantity: {quantity}")
         
-        # Wait a moment for order to execute
+        # Wait for the order to execute, then check positions
         print("\n⏳ Waiting for order execution...")
-        time.sleep(3)
-        
-        # Check positions
         print("\n📊 Checking open positions...")
-        positions = client.positions.list_open()
-        ada_position = next((p for p in positions if p.symbol == symbol), None)
+        ada_position = wait_for_position(client, symbol)
         
         if ada_position:
             print_success(f"Position opened successfully!")
             print_info(f"  Symbol: {ada_position.symbol}")
-            print_info(f"  Quantity: {ada_position.quantity if hasattr(ada_position, 'quantity') else 'N/A'}")
-            print_info(f"  Entry Price: ${ada_position.entry_price if hasattr(ada_position, 'entry_price') else 'N/A'}")
-            print_info(f"  Unrealized PnL: ${ada_position.unrealized_pnl if hasattr(ada_position, 'unrealized_pnl') else 'N/A'}")
+            print_info(f"  Quantity: {getattr(ada_position, 'quantity', 'N/A')}")
+            print_info(f"  Entry Price: ${getattr(ada_position, 'entry_price', 'N/A')}")
+            print_info(f"  Unrealized PnL: ${getattr(ada_position, 'unrealized_pnl', 'N/A')}")
             
             # Ask if user wants to close position
             close = input("\nDo you want to close this position now? (yes/no): ")
@@ -257,11 +254,9 @@ def perform_sample_trade(client, assets):
                     reduce_only=True
                 )
                 print_success("Close order placed!")
-                time.sleep(2)
                 
                 # Check if position is closed
-                positions_after = client.positions.list_open()
-                ada_after = next((p for p in positions_after if p.symbol == symbol), None)
+                ada_after = wait_for_position(client, symbol, closed=True)
                 
                 if not ada_after:
                     print_success("Position closed successfully!")
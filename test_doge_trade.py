@@ -2,8 +2,10 @@
 Test trade with DOGEUSDT - affordable for your balance!
 """
 
+from dataclasses import asdict
+
 from mudrex import MudrexClient
-import time
+from script_helpers import wait_for_position
 
 API_SECRET = "e2SYcr7wmpipC6N977QIcc64VaY0FSaz"
 
@@ -53,19 +55,16 @@ def main():
         )
         
         print(f"✅ Order placed!")
-        print(f"   Order ID: {order.order_id if hasattr(order, 'order_id') else order.__dict__}")
+        print(f"   Order ID: {order.order_id if hasattr(order, 'order_id') else asdict(order)}")
         
         # Wait and check position
         print(f"\n3️⃣ Waiting for execution...")
-        time.sleep(3)
-        
-        positions = client.positions.list_open()
-        doge_pos = next((p for p in positions if p.symbol == symbol), None)
+        doge_pos = wait_for_position(client, symbol)
         
         if doge_pos:
             print(f"✅ Position opened!")
             print(f"\n📊 Position Details:")
-            pos_data = doge_pos.__dict__
+            pos_data = asdict(doge_pos)
             for key, value in pos_data.items():
                 print(f"   {key}: {value}")
             
@@ -83,7 +82,7 @@ def main():
                 )
                 
                 print(f"   ✅ Close order placed!")
-                time.sleep(3)
+                wait_for_position(client, symbol, closed=True)
                 
                 # Check final balance
                 final_balance = client.wallet.get_futures_balance()
@@ -0,0 +1,153 @@
+"""
+Tests for Paper Trading Engine
+==============================
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from mudrex.paper.engine import PaperTradingEngine
+from mudrex.paper.price_feed import MockPriceFeedService
+from mudrex.paper.sltp_monitor import SLTPMonitor
+
+
+class _CountingFeed(MockPriceFeedService):
+    cache_ttl = 60
+    
+    def __init__(self, prices):
+        super().__init__(prices)
+        self.batches = 0
+    
+    def get_prices_batch(self, symbols):
+        self.batches += 1
+        return super().get_prices_batch(symbols)
+
+
+@pytest.fixture
+def engine():
+    feed = MockPriceFeedService({"BTCUSDT": Decimal("100"), "ETHUSDT": Decimal("10")})
+    return PaperTradingEngine(Decimal("100000"), feed, enable_logging=False)
+
+
+def _without_timestamp(state):
+    return {key: value for key, value in state.items() if key != "exported_at"}
+
+
+class TestGetWallet:
+    def test_skips_refresh_until_positions_change(self):
+        feed = _CountingFeed({"BTCUSDT": Decimal("100")})
+        engine = PaperTradingEngine(Decimal("100000"), feed, enable_logging=False)
+        engine.create_market_order("BTCUSDT", "LONG", Decimal("1"), 5)
+        
+        engine.get_wallet()
+        batches = feed.batches
+        engine.get_wallet()
+        
+        # Within the feed's cache TTL nothing changed, so no refetch
+        assert feed.batches == batches
+        
+        feed.set_price("BTCUSDT", Decimal("110"))
+        engine.create_market_order("BTCUSDT", "LONG", Decimal("1"), 5)
+        wallet = engine.get_wallet()
+        
+        assert feed.batches == batches + 1
+        assert wallet.unrealized_pnl == Decimal("10")
+    
+    def test_pushed_pnl_updates_wallet_without_refresh(self):
+        feed = _CountingFeed({"BTCUSDT": Decimal("100"), "ETHUSDT": Decimal("10")})
+        engine = PaperTradingEngine(Decimal("100000"), feed, enable_logging=False)
+        engine.create_market_order("BTCUSDT", "LONG", Decimal("1"), 5)
+        order = engine.create_market_order("ETHUSDT", "SHORT", Decimal("2"), 5)
+        engine.get_wallet()
+        batches = feed.batches
+        
+        SLTPMonitor(engine).on_price("BTCUSDT", Decimal("110"))
+        
+        assert engine.get_wallet().unrealized_pnl == Decimal("10")
+        
+        feed.set_price("ETHUSDT", Decimal("9"))
+        engine.get_position(order.position_id)
+        
+        assert engine.get_wallet().unrealized_pnl == Decimal("12")
+        assert feed.batches == batches
+    
+    def test_closed_position_leaves_the_total(self, engine):
+        engine.create_market_order("BTCUSDT", "LONG", Decimal("1"), 5)
+        order = engine.create_market_order("ETHUSDT", "SHORT", Decimal("2"), 5)
+        monitor = SLTPMonitor(engine)
+        monitor.on_price("BTCUSDT", Decimal("110"))
+        monitor.on_price("ETHUSDT", Decimal("9"))
+        
+        engine.close_position(order.position_id, close_price=Decimal("9"))
+        
+        assert engine.wallet.unrealized_pnl == Decimal("10")
+    
+    def test_feed_without_ttl_refreshes_every_call(self, engine):
+        engine.create_market_order("BTCUSDT", "LONG", Decimal("1"), 5)
+        engine.get_wallet()
+        
+        engine.price_feed.set_price("BTCUSDT", Decimal("90"))
+        
+        assert engine.get_wallet().unrealized_pnl == Decimal("-10")
+
+
+class TestStateRoundTrip:
+    def _trade(self, engine):
+        engine.create_market_order("BTCUSDT", "LONG", Decimal("1.5"), 5)
+        order = engine.create_market_order("ETHUSDT", "SHORT", Decimal("3"), 10)
+        engine.create_limit_order("BTCUSDT", "LONG", Decimal("1"), Decimal("90"), 2)
+        engine.close_position(order.position_id)
+    
+    def test_from_state_restores_export(self, engine):
+        self._trade(engine)
+        state = engine.export_state()
+        
+        restored = PaperTradingEngine.from_state(state, engine.price_feed)
+        
+        assert _without_timestamp(restored.export_state()) == _without_timestamp(state)
+        assert restored.pending_orders == engine.pending_orders
+        assert restored.get_wallet().unrealized_pnl == engine.get_wallet().unrealized_pnl
+    
+    def test_from_state_takes_configuration(self, engine):
+        self._trade(engine)
+        
+        restored = PaperTradingEngine.from_state(
+            engine.export_state(), engine.price_feed,
+            fee_rate=Decimal("0.001"), enable_logging=False,
+        )
+        
+        assert restored.fee_rate == Decimal("0.001")
+        assert restored.enable_logging is False
+        assert restored.positions_version == 0
+    
+    def test_import_state_replaces_existing_state(self, engine):
+        self._trade(engine)
+        state = engine.export_state()
+        other = PaperTradingEngine(Decimal("500"), engine.price_feed, enable_logging=False)
+        other.create_market_order("ETHUSDT", "LONG", Decimal("1"), 1)
+        
+        other.import_state(state)
+        
+        assert _without_timestamp(other.export_state()) == _without_timestamp(state)
+    
+    def test_export_and_import_do_not_share_containers(self, engine):
+        self._trade(engine)
+        state = engine.export_state()
+        state["pending_orders"]["BTCUSDT"].append("bogus")
+        state["leverage_settings"]["BTCUSDT"] = 99
+        
+        assert "bogus" not in engine.pending_orders["BTCUSDT"]
+        assert engine.leverage_settings.get("BTCUSDT") != 99
+        
+        restored = PaperTradingEngine.from_state(engine.export_state(), engine.price_feed)
+        restored.pending_orders["BTCUSDT"].clear()
+        
+        assert engine.pending_orders["BTCUSDT"]
+    
+    def test_export_trade_history_from(self, engine):
+        self._trade(engine)
+        
+        tail = engine.export_state(trade_history_from=1)["trade_history"]
+        
+        assert [t["trade_id"] for t in tail] == [t.trade_id for t in engine.trade_history[1:]]
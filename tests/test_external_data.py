@@ -0,0 +1,221 @@
+"""
+Tests for Paper Trading External Data
+=====================================
+"""
+
+import threading
+import time
+from datetime import datetime, timezone
+
+import pytest
+import requests
+
+from mudrex.paper.external_data import (
+    ExternalDataError,
+    ExternalDataService,
+    KlineFrame,
+    _convert_symbol,
+)
+
+
+def _ticker_item(symbol, price):
+    return {
+        "symbol": symbol,
+        "lastPrice": price,
+        "markPrice": price,
+        "indexPrice": price,
+        "fundingRate": "0.0001",
+        "nextFundingTime": "1700000000000",
+        "openInterest": "0",
+        "volume24h": "0",
+    }
+
+
+class _FakeResponse:
+    def __init__(self, data):
+        self._data = data
+    
+    def raise_for_status(self):
+        pass
+    
+    def json(self):
+        return self._data
+
+
+class _FakeSession:
+    """Serves /v5/market/* from in-memory data and records every request."""
+    
+    def __init__(self, prices=None, klines=None):
+        self.prices = dict(prices or {})
+        self.klines = klines or []
+        self.requests = []
+        self.fail = False
+        self.gate = None
+    
+    def get(self, url, params=None, timeout=None):
+        params = dict(params or ())
+        self.requests.append((url.rsplit("/", 1)[-1], params.get("symbol")))
+        if self.gate is not None:
+            self.gate.wait(timeout=5)
+        if self.fail:
+            raise requests.ConnectionError("connection refused")
+        
+        if url.endswith("/kline"):
+            return _FakeResponse({"retCode": 0, "result": {"list": list(self.klines)}})
+        
+        symbol = params.get("symbol")
+        items = [
+            _ticker_item(s, p) for s, p in self.prices.items()
+            if symbol is None or s == symbol
+        ]
+        return _FakeResponse({"retCode": 0, "result": {"list": items}})
+
+
+@pytest.fixture
+def session():
+    return _FakeSession({"BTCUSDT": "100", "ETHUSDT": "10", "SOLUSDT": "1", "XRPUSDT": "0.5"})
+
+
+@pytest.fixture
+def service(session):
+    svc = ExternalDataService(cache_ttl=60, error_ttl=60)
+    svc._session = session
+    return svc
+
+
+class TestConvertSymbol:
+    def test_upper_cases_and_memoizes(self):
+        _convert_symbol.cache_clear()
+        
+        assert _convert_symbol("btcusdt") == "BTCUSDT"
+        assert _convert_symbol("btcusdt") == "BTCUSDT"
+        assert _convert_symbol.cache_info().hits == 1
+
+
+class TestTickerCache:
+    def test_cached_ticker_is_not_refetched(self, service, session):
+        first = service.get_ticker("BTCUSDT")
+        
+        assert service.get_ticker("BTCUSDT") is first
+        assert session.requests == [("tickers", "BTCUSDT")]
+    
+    def test_least_recently_used_is_evicted(self, service, session):
+        service.cache_maxsize = 2
+        service.get_ticker("BTCUSDT")
+        service.get_ticker("ETHUSDT")
+        service.get_ticker("BTCUSDT")  # ETHUSDT is now least recently used
+        service.get_ticker("SOLUSDT")
+        
+        assert list(service._ticker_cache) == ["BTCUSDT", "SOLUSDT"]
+    
+    def test_failures_are_cached_for_error_ttl(self, service, session):
+        session.fail = True
+        for _ in range(2):
+            with pytest.raises(ExternalDataError, match="connection refused"):
+                service.get_ticker("BTCUSDT")
+        
+        assert len(session.requests) == 1
+        
+        session.fail = False
+        service.error_ttl = 0
+        
+        assert service.get_ticker("BTCUSDT").symbol == "BTCUSDT"
+        assert "BTCUSDT" not in service._error_cache
+    
+    def test_concurrent_misses_share_one_fetch(self, service, session):
+        session.gate = threading.Event()
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(service.get_ticker("BTCUSDT")))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        while not session.requests:
+            time.sleep(0.01)
+        session.gate.set()
+        for thread in threads:
+            thread.join()
+        
+        assert session.requests == [("tickers", "BTCUSDT")]
+        assert len(results) == 4
+        assert all(ticker is results[0] for ticker in results)
+
+
+class TestGetTickers:
+    def test_few_misses_fetch_per_symbol(self, service, session):
+        tickers = service.get_tickers(["BTCUSDT", "ETHUSDT"])
+        
+        assert set(tickers) == {"BTCUSDT", "ETHUSDT"}
+        assert sorted(session.requests) == [("tickers", "BTCUSDT"), ("tickers", "ETHUSDT")]
+    
+    def test_many_misses_use_one_bulk_request(self, service, session):
+        service.get_ticker("XRPUSDT")
+        session.requests.clear()
+        
+        tickers = service.get_tickers(["btcusdt", "ETHUSDT", "SOLUSDT", "XRPUSDT", "NOPEUSDT"])
+        
+        assert session.requests == [("tickers", None), ("tickers", "NOPEUSDT")]
+        assert set(tickers) == {"btcusdt", "ETHUSDT", "SOLUSDT", "XRPUSDT"}
+        # Tickers keep the symbol the caller asked for
+        assert tickers["btcusdt"].symbol == "btcusdt"
+        assert service.get_ticker("btcusdt") is tickers["btcusdt"]
+    
+    def test_bulk_failure_falls_back_per_symbol(self, service, session):
+        calls = []
+        
+        def fail_bulk():
+            calls.append(None)
+            raise ExternalDataError("boom")
+        
+        service._fetch_all_tickers = fail_bulk
+        tickers = service.get_tickers(["BTCUSDT", "ETHUSDT", "SOLUSDT"])
+        
+        assert calls == [None]
+        assert set(tickers) == {"BTCUSDT", "ETHUSDT", "SOLUSDT"}
+        assert len(session.requests) == 3
+    
+    def test_prefetch_does_not_evict(self, service, session):
+        service.cache_maxsize = 2
+        service.get_ticker("BTCUSDT")
+        
+        tickers = service.prefetch_all_tickers()
+        
+        assert set(tickers) == {"BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT"}
+        assert len(service._ticker_cache) == 2
+        assert "BTCUSDT" in service._ticker_cache
+        assert service._ticker_cache["BTCUSDT"][0] is tickers["BTCUSDT"]
+
+
+class TestKlines:
+    ROWS = [
+        # Newest first, as the API returns them
+        ["1700000060000", "101", "103", "100", "102", "7", "0"],
+        ["1700000000000", "100", "102", "99", "101", "5", "0"],
+    ]
+    
+    def test_frame_columns_are_chronological(self, service, session):
+        session.klines = self.ROWS
+        
+        frame = service.get_klines_frame("BTCUSDT", "1", 2)
+        
+        assert list(frame.timestamps) == [1700000000000, 1700000060000]
+        assert list(frame.closes) == [101.0, 102.0]
+        assert list(frame.volumes) == [5.0, 7.0]
+        assert len(frame) == 2
+    
+    def test_frame_bars_match_klines(self, service, session):
+        session.klines = self.ROWS
+        klines = service.get_klines("BTCUSDT", "1", 2)
+        frame = service.get_klines_frame("BTCUSDT", "1", 2)
+        
+        assert [frame[i] for i in range(len(frame))] == klines
+        assert klines[0].timestamp == datetime.fromtimestamp(1700000000, tz=timezone.utc)
+    
+    def test_from_klines_round_trip(self, service, session):
+        session.klines = self.ROWS
+        klines = service.get_klines("BTCUSDT", "1", 2)
+        
+        frame = KlineFrame.from_klines(klines)
+        
+        assert [frame[i] for i in range(len(frame))] == klines
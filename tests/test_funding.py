@@ -0,0 +1,144 @@
+"""
+Tests for Paper Trading Funding
+===============================
+"""
+
+import gc
+import json
+import time
+import weakref
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from mudrex.paper.engine import PaperTradingEngine
+from mudrex.paper.external_data import MockExternalDataService
+from mudrex.paper.funding import FundingMonitor
+from mudrex.paper.price_feed import MockPriceFeedService
+
+
+def _ts(*args) -> float:
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+@pytest.fixture
+def engine():
+    feed = MockPriceFeedService({"BTCUSDT": Decimal("100"), "ETHUSDT": Decimal("10")})
+    return PaperTradingEngine(Decimal("100000"), feed, enable_logging=False)
+
+
+@pytest.fixture
+def external_data():
+    data = MockExternalDataService()
+    data.set_ticker("BTCUSDT", Decimal("100"), funding_rate=Decimal("0.0001"))
+    data.set_ticker("ETHUSDT", Decimal("10"), funding_rate=Decimal("-0.0003"))
+    return data
+
+
+@pytest.fixture
+def monitor(engine, external_data):
+    return FundingMonitor(engine, external_data)
+
+
+class TestFundingPayments:
+    def test_payer_follows_rate_sign(self, engine, monitor):
+        engine.create_market_order("BTCUSDT", "LONG", Decimal("2"), 5)
+        engine.create_market_order("ETHUSDT", "SHORT", Decimal("3"), 5)
+        balance = engine.wallet.balance
+        
+        payments = {p.symbol: p for p in monitor.process_funding_now()}
+        
+        assert payments["BTCUSDT"].payment_amount == Decimal("-0.02")
+        assert payments["ETHUSDT"].payment_amount == Decimal("-0.009")
+        assert engine.wallet.balance == balance - Decimal("0.029")
+    
+    def test_amounts_are_exact(self, engine, external_data, monitor):
+        external_data.set_ticker(
+            "BTCUSDT", Decimal("12345.678912345"), funding_rate=Decimal("0.000123456789")
+        )
+        engine.create_market_order("BTCUSDT", "LONG", Decimal("0.123456789"), 5)
+        
+        payment, = monitor.process_funding_now()
+        
+        value = Decimal("0.123456789") * Decimal("12345.678912345")
+        assert payment.position_value == value
+        assert payment.payment_amount == -value * Decimal("0.000123456789")
+
+
+class TestFundingState:
+    def test_state_bytes_round_trip(self, engine, external_data, monitor):
+        engine.create_market_order("BTCUSDT", "LONG", Decimal("2"), 5)
+        monitor.process_funding_now()
+        
+        state = json.loads(monitor.to_state_bytes())
+        
+        assert state == monitor.to_state()
+        restored = FundingMonitor(engine, external_data)
+        restored.from_state(state)
+        assert restored.payments == monitor.payments
+        assert restored.get_total_funding() == monitor.get_total_funding()
+    
+    
+    def test_ledger_keeps_exact_amounts(self, engine, external_data, monitor):
+        external_data.set_ticker(
+            "BTCUSDT", Decimal("12345.678912345"), funding_rate=Decimal("0.000123456789")
+        )
+        engine.create_market_order("BTCUSDT", "LONG", Decimal("0.123456789"), 5)
+        payment, = monitor.process_funding_now()
+        
+        restored = FundingMonitor(engine, external_data)
+        restored.from_state(monitor.to_state())
+        
+        assert monitor.payments[0].payment_amount == payment.payment_amount
+        assert restored.payments[0].payment_amount == payment.payment_amount
+        assert monitor.to_state()["payments"][0]["payment_amount"] == str(payment.payment_amount)
+
+
+class TestFundingScheduler:
+    def test_started_monitor_is_kept_until_stopped(self, engine, external_data):
+        monitor = FundingMonitor(engine, external_data, enabled=False)
+        monitor.start()
+        ref = weakref.ref(monitor)
+        del monitor
+        gc.collect()
+        
+        assert ref() is not None and ref().is_running
+        
+        ref().stop()
+        # The scheduler thread may still be finishing the first cycle
+        deadline = time.monotonic() + 5
+        while ref() is not None and time.monotonic() < deadline:
+            gc.collect()
+            time.sleep(0.01)
+        
+        assert ref() is None
+
+
+class TestFundingTimes:
+    def setup_method(self):
+        self.monitor = FundingMonitor(engine=None, external_data=None)
+    
+    def test_times_are_sorted_funding_hours(self):
+        times = list(self.monitor._get_funding_times_between(
+            _ts(2024, 1, 1, 3), _ts(2024, 1, 4, 3)
+        ))
+        
+        assert times == sorted(times)
+        assert len(times) == 9
+        for ts in times:
+            assert datetime.fromtimestamp(ts, tz=timezone.utc).hour in FundingMonitor.FUNDING_HOURS
+    
+    def test_start_exclusive_end_inclusive(self):
+        times = list(self.monitor._get_funding_times_between(
+            _ts(2024, 1, 1, 8), _ts(2024, 1, 1, 16)
+        ))
+        
+        assert times == [int(_ts(2024, 1, 1, 16))]
+    
+    def test_no_times_within_one_interval(self):
+        times = self.monitor._get_funding_times_between(
+            _ts(2024, 1, 1, 9), _ts(2024, 1, 1, 15, 59)
+        )
+        
+        assert not times
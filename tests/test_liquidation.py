@@ -0,0 +1,195 @@
+"""
+Tests for Paper Trading Liquidation
+===================================
+"""
+
+import threading
+import time
+from decimal import Decimal
+
+import pytest
+
+from mudrex.paper.engine import PaperTradingEngine
+from mudrex.paper.external_data import MockExternalDataService
+from mudrex.paper.liquidation import LiquidationEngine, LiquidationEvent
+from mudrex.paper.models import PaperPositionStatus
+from mudrex.paper.price_feed import MockPriceFeedService
+
+
+def _open(engine, *args):
+    order = engine.create_market_order(*args)
+    return engine.positions[order.position_id]
+
+
+@pytest.fixture
+def engine():
+    feed = MockPriceFeedService({"BTCUSDT": Decimal("100"), "ETHUSDT": Decimal("10")})
+    return PaperTradingEngine(Decimal("100000"), feed, enable_logging=False)
+
+
+@pytest.fixture
+def external_data():
+    data = MockExternalDataService()
+    data.set_mark_price("BTCUSDT", Decimal("100"))
+    data.set_mark_price("ETHUSDT", Decimal("10"))
+    return data
+
+
+@pytest.fixture
+def liquidation(engine, external_data):
+    return LiquidationEngine(engine, external_data)
+
+
+class TestMarginStatus:
+    def test_money_values_are_exact_decimal(self, engine, liquidation):
+        position = _open(engine, "BTCUSDT", "LONG", Decimal("1.234"), 7)
+        
+        status = liquidation.get_margin_status(position, Decimal("97.123456789"))
+        
+        notional = Decimal("1.234") * Decimal("100")
+        assert status.initial_margin == notional / 7
+        assert status.maintenance_margin == notional * Decimal("0.005")
+        assert status.unrealized_pnl == Decimal("1.234") * (Decimal("97.123456789") - 100)
+        assert status.margin_ratio == status.margin_balance / status.maintenance_margin
+        assert status.liquidation_price == Decimal("86.21")
+    
+    def test_dust_position(self, engine, liquidation):
+        position = _open(engine, "BTCUSDT", "LONG", Decimal("0.000000001"), 10)
+        
+        status = liquidation.get_margin_status(position, Decimal("100"))
+        
+        # Margin per unit is 10, so the 90% estimate sits 9 below entry
+        assert position.calculate_liquidation_price() == Decimal("91")
+        assert not status.is_liquidatable
+
+
+class TestOnMarkPrice:
+    def test_liquidates_crossed_position(self, engine, liquidation):
+        position = _open(engine, "BTCUSDT", "LONG", Decimal("1"), 10)
+        liquidation._check_positions()  # Index the position
+        
+        liquidation.on_mark_price("BTCUSDT", Decimal("80"))
+        
+        assert position.status == PaperPositionStatus.CLOSED
+        assert [e.position_id for e in liquidation.liquidations] == [position.position_id]
+    
+    def test_ignores_price_before_liquidation(self, engine, liquidation):
+        position = _open(engine, "BTCUSDT", "LONG", Decimal("1"), 10)
+        liquidation._check_positions()
+        
+        liquidation.on_mark_price("BTCUSDT", Decimal("95"))
+        liquidation.on_mark_price("ETHUSDT", Decimal("1"))
+        
+        assert position.status == PaperPositionStatus.OPEN
+        assert not liquidation.liquidations
+    
+    def test_short_liquidates_above(self, engine, liquidation):
+        position = _open(engine, "ETHUSDT", "SHORT", Decimal("5"), 20)
+        liquidation._check_positions()
+        
+        liquidation.on_mark_price("ETHUSDT", Decimal("11"))
+        
+        assert position.status == PaperPositionStatus.CLOSED
+    
+    def test_index_sorted_and_only_crossed_liquidate(self, engine, liquidation):
+        # The engine nets one position per symbol and side, so a second
+        # BTCUSDT LONG (at higher leverage, listed first) comes from a state
+        safe = _open(engine, "BTCUSDT", "LONG", Decimal("1"), 2)
+        state = engine.export_state()
+        risky_data = dict(state["positions"][safe.position_id], position_id="risky", leverage=20)
+        state["positions"] = {"risky": risky_data, **state["positions"]}
+        engine.import_state(state)
+        safe, risky = engine.positions[safe.position_id], engine.positions["risky"]
+        liquidation._check_positions()
+        
+        index = liquidation._liq_index["BTCUSDT"]
+        assert index.long_ids == [safe.position_id, "risky"]
+        assert index.long_cents == sorted(index.long_cents)
+        
+        liquidation.on_mark_price("BTCUSDT", Decimal("94"))
+        
+        assert risky.status == PaperPositionStatus.CLOSED
+        assert safe.status == PaperPositionStatus.OPEN
+    
+    def test_index_cleared_when_no_positions(self, engine, liquidation):
+        position = _open(engine, "BTCUSDT", "LONG", Decimal("1"), 10)
+        liquidation._check_positions()
+        engine.close_position(position.position_id)
+        
+        liquidation._check_positions()
+        
+        assert liquidation._liq_index == {}
+
+
+class TestLiquidationState:
+    def _liquidate(self, engine, liquidation, symbol, price):
+        _open(engine, symbol, "LONG", Decimal("1"), 10)
+        liquidation._check_positions()
+        liquidation.on_mark_price(symbol, price)
+    
+    def test_event_dict_keeps_iso_time(self, engine, liquidation):
+        self._liquidate(engine, liquidation, "BTCUSDT", Decimal("80"))
+        event, = liquidation.liquidations
+        
+        data = event.to_dict()
+        
+        assert data["liquidation_time"] == event.liquidation_time.isoformat()
+        assert "liquidation_time_ns" in data
+        assert LiquidationEvent.from_dict(data).liquidation_time == event.liquidation_time
+        
+        del data["liquidation_time_ns"]
+        assert LiquidationEvent.from_dict(data).liquidation_time == event.liquidation_time
+    
+    def test_total_loss_survives_capped_history(self, engine, external_data):
+        liquidation = LiquidationEngine(engine, external_data, max_history=1)
+        self._liquidate(engine, liquidation, "BTCUSDT", Decimal("80"))
+        self._liquidate(engine, liquidation, "ETHUSDT", Decimal("8"))
+        total = liquidation.get_total_liquidation_losses()
+        
+        restored = LiquidationEngine(engine, external_data, max_history=1)
+        restored.from_state(liquidation.to_state())
+        
+        assert len(restored.liquidations) == 1
+        assert restored.get_total_liquidation_losses() == total
+        assert total > liquidation.liquidations[0].total_loss
+
+
+class TestConcurrentLiquidation:
+    def test_mark_price_and_check_loop_liquidate_once(
+        self, engine, external_data, liquidation, monkeypatch
+    ):
+        position = _open(engine, "BTCUSDT", "LONG", Decimal("1"), 10)
+        liquidation._check_positions()
+        
+        # Widen the window between the engine's "still open?" check and the
+        # close itself, so both callers are inside close_position together
+        closes = []
+        close_internal = engine._close_position_internal
+        
+        def slow_close(*args, **kwargs):
+            closes.append(args[0].position_id)
+            time.sleep(0.05)
+            return close_internal(*args, **kwargs)
+        
+        monkeypatch.setattr(engine, "_close_position_internal", slow_close)
+        external_data.set_mark_price("BTCUSDT", Decimal("80"))
+        
+        start = threading.Barrier(2)
+        
+        def from_stream():
+            start.wait()
+            liquidation.on_mark_price("BTCUSDT", Decimal("80"))
+        
+        def from_loop():
+            start.wait()
+            liquidation._check_positions()
+        
+        threads = [threading.Thread(target=from_stream), threading.Thread(target=from_loop)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert closes == [position.position_id]
+        assert len(liquidation.liquidations) == 1
+        assert engine.wallet.locked_margin == 0
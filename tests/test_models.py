@@ -3,8 +3,9 @@ Tests for Mudrex SDK Models
 ===========================
 """
 
+import sys
+
 import pytest
-from datetime import datetime
 from mudrex.models import (
     WalletBalance,
     FuturesBalance,
@@ -43,6 +44,11 @@ class TestWalletBalance:
         assert balance.total == "0"
         assert balance.available == "0"
         assert balance.currency == "USDT"
+    
+    def test_available_is_withdrawable(self):
+        balance = WalletBalance.from_dict({"total": "100", "withdrawable": "60"})
+        
+        assert balance.available == balance.withdrawable == "60"
 
 
 class TestAsset:
@@ -124,22 +130,27 @@ class TestOrder:
         assert order.leverage == "10"
 
 
+@pytest.fixture
+def position_data():
+    """Base position payload; tests add or override keys."""
+    return {
+        "position_id": "pos_12345",
+        "asset_id": "BTCUSDT",
+        "symbol": "BTCUSDT",
+        "side": "LONG",
+        "quantity": "0.001",
+        "entry_price": "100000",
+        "mark_price": "101000",
+        "leverage": "10",
+        "margin": "10",
+        "unrealized_pnl": "1.00",
+        "realized_pnl": "0",
+    }
+
+
 class TestPosition:
-    def test_from_dict(self):
-        data = {
-            "position_id": "pos_12345",
-            "asset_id": "BTCUSDT",
-            "symbol": "BTCUSDT",
-            "side": "LONG",
-            "quantity": "0.001",
-            "entry_price": "100000",
-            "mark_price": "101000",
-            "leverage": "10",
-            "margin": "10",
-            "unrealized_pnl": "1.00",
-            "realized_pnl": "0",
-        }
-        position = Position.from_dict(data)
+    def test_from_dict(self, position_data):
+        position = Position.from_dict(position_data)
         
         assert position.position_id == "pos_12345"
         assert position.side == OrderType.LONG
@@ -163,55 +174,45 @@ class TestPosition:
         
         # PnL = 1.00, Margin = 10, so percentage = 10%
         assert position.pnl_percentage == 10.0
-    
-    def test_from_dict_with_nested_stoploss(self):
-        """Test that Position correctly parses nested stoploss/takeprofit from API response.
         
-        The Mudrex API returns SL/TP as nested objects:
-        {"stoploss": {"price": "4100", "order_id": "...", "order_type": "SHORT"}}
-        """
-        data = {
-            "id": "pos_12345",
-            "symbol": "ETHUSDT",
-            "order_type": "LONG",
-            "quantity": "0.02",
-            "entry_price": "4133.41",
-            "mark_price": "4150.00",
-            "leverage": "50",
-            "margin": "10",
-            "unrealized_pnl": "0.33",
-            "realized_pnl": "0",
-            "liquidation_price": "4071.1",
-            "stoploss": {"price": "4100", "order_id": "sl_123", "order_type": "SHORT"},
-            "takeprofit": {"price": "5000", "order_id": "tp_123", "order_type": "SHORT"},
-            "status": "OPEN"
-        }
+        # Recomputed once the inputs change
+        position.unrealized_pnl = "-2.50"
+        assert position.pnl_percentage == -25.0
+    
+    def test_from_dict_legacy_keys(self, position_data):
+        data = {**position_data, "id": "pos_legacy", "order_type": "SHORT"}
+        del data["position_id"], data["side"]
         position = Position.from_dict(data)
         
-        assert position.stoploss_price == "4100"
-        assert position.takeprofit_price == "5000"
+        assert position.position_id == "pos_legacy"
+        assert position.side == OrderType.SHORT
     
-    def test_from_dict_with_flat_stoploss(self):
-        """Test backwards compatibility with flat stoploss_price field."""
-        data = {
-            "id": "pos_12345",
-            "symbol": "BTCUSDT",
-            "order_type": "SHORT",
-            "quantity": "0.001",
-            "entry_price": "100000",
-            "mark_price": "99000",
-            "leverage": "10",
-            "margin": "100",
-            "unrealized_pnl": "10",
-            "realized_pnl": "0",
+    @pytest.mark.parametrize("sl_tp, expected_sl, expected_tp", [
+        # The Mudrex API returns SL/TP as nested objects:
+        # {"stoploss": {"price": "4100", "order_id": "...", "order_type": "SHORT"}}
+        pytest.param({
+            "stoploss": {"price": "4100", "order_id": "sl_123", "order_type": "SHORT"},
+            "takeprofit": {"price": "5000", "order_id": "tp_123", "order_type": "SHORT"},
+        }, "4100", "5000", id="nested"),
+        # Backwards compatibility with flat stoploss_price/takeprofit_price fields
+        pytest.param({
             "stoploss_price": "101000",
             "takeprofit_price": "95000",
-            "status": "OPEN"
-        }
-        position = Position.from_dict(data)
+        }, "101000", "95000", id="flat"),
+    ])
+    def test_from_dict_stoploss_takeprofit(self, position_data, sl_tp, expected_sl, expected_tp):
+        """Test that Position parses SL/TP from nested objects or flat fields."""
+        position = Position.from_dict({**position_data, **sl_tp})
+        
+        assert position.stoploss_price == expected_sl
+        assert position.takeprofit_price == expected_tp
+    
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10+")
+    def test_slotted(self):
+        position = Position.from_dict({"position_id": "pos_1", "symbol": "BTCUSDT"})
         
-        assert position.stoploss_price == "101000"
-        assert position.takeprofit_price == "95000"
+        assert hasattr(Position, "__slots__")
+        assert not hasattr(position, "__dict__")
 
 
 class TestEnums:
@@ -225,3 +226,14 @@ class TestEnums:
     
     def test_margin_type(self):
         assert MarginType.ISOLATED.value == "ISOLATED"
+    
+    def test_from_dict_lookup_matches_enum_call(self):
+        order = Order.from_dict({"order_type": "SHORT", "trigger_type": "LIMIT", "status": "FILLED"})
+        
+        assert order.order_type is OrderType("SHORT")
+        assert order.trigger_type is TriggerType("LIMIT")
+        assert order.status is OrderStatus("FILLED")
+    
+    def test_from_dict_unknown_value_raises(self):
+        with pytest.raises(ValueError):
+            Order.from_dict({"order_type": "SIDEWAYS"})
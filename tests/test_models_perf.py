@@ -0,0 +1,110 @@
+"""
+Benchmarks for Mudrex SDK Model Parsing
+=======================================
+
+Marked ``benchmark`` and deselected by default; run with
+``pytest -m benchmark tests/test_models_perf.py`` (skipped unless
+pytest-benchmark is installed). Peak traced memory of one parse pass is recorded in each
+benchmark's extra_info.
+"""
+
+import random
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.benchmark
+
+from mudrex.models import Order, Position
+
+
+SYMBOLS = ["BTCUSDT", "ETHUSDT", "SOLUSDT", "XRPUSDT", "DOGEUSDT"]
+SIZES = [100, 1000, 10000]
+
+
+def _position_payloads(n: int) -> list:
+    rng = random.Random(42)
+    payloads = []
+    for i in range(n):
+        entry = rng.uniform(1, 100000)
+        payload = {
+            "id": f"pos_{i}",
+            "asset_id": f"asset_{i % len(SYMBOLS)}",
+            "symbol": SYMBOLS[i % len(SYMBOLS)],
+            "side": rng.choice(["LONG", "SHORT"]),
+            "quantity": f"{rng.uniform(0.001, 10):.3f}",
+            "entry_price": f"{entry:.2f}",
+            "mark_price": f"{entry * rng.uniform(0.9, 1.1):.2f}",
+            "leverage": str(rng.randint(1, 50)),
+            "margin": f"{rng.uniform(10, 1000):.2f}",
+            "unrealized_pnl": f"{rng.uniform(-50, 50):.2f}",
+            "realized_pnl": "0",
+            "status": "OPEN",
+            "created_at": "2024-01-01T00:00:00Z",
+        }
+        if i % 2:
+            payload["stoploss"] = {"price": f"{entry * 0.95:.2f}", "order_id": f"sl_{i}", "order_type": "SHORT"}
+        payloads.append(payload)
+    return payloads
+
+
+def _order_payloads(n: int) -> list:
+    rng = random.Random(42)
+    return [
+        {
+            "id": f"ord_{i}",
+            "asset_id": f"asset_{i % len(SYMBOLS)}",
+            "symbol": SYMBOLS[i % len(SYMBOLS)],
+            "order_type": rng.choice(["LONG", "SHORT"]),
+            "trigger_type": rng.choice(["MARKET", "LIMIT"]),
+            "status": rng.choice(["OPEN", "FILLED", "CANCELLED"]),
+            "quantity": f"{rng.uniform(0.001, 10):.3f}",
+            "filled_quantity": "0",
+            "price": f"{rng.uniform(1, 100000):.2f}",
+            "leverage": str(rng.randint(1, 50)),
+            "created_at": "2024-01-01T00:00:00Z",
+        }
+        for i in range(n)
+    ]
+
+
+def _peak_memory(parse, payloads) -> int:
+    tracemalloc.start()
+    try:
+        parse(payloads)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _parse_all(model):
+    def parse(payloads):
+        from_dict = model.from_dict
+        return [from_dict(d) for d in payloads]
+    return parse
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_position_from_dict(benchmark, n):
+    payloads = _position_payloads(n)
+    parse = _parse_all(Position)
+    parse(payloads)  # warm-up
+    
+    benchmark.extra_info["peak_bytes"] = _peak_memory(parse, payloads)
+    positions = benchmark(parse, payloads)
+    
+    assert len(positions) == n
+
+
+@pytest.mark.parametrize("n", SIZES)
+def test_order_from_dict(benchmark, n):
+    payloads = _order_payloads(n)
+    parse = _parse_all(Order)
+    parse(payloads)  # warm-up
+    
+    benchmark.extra_info["peak_bytes"] = _peak_memory(parse, payloads)
+    orders = benchmark(parse, payloads)
+    
+    assert len(orders) == n
@@ -0,0 +1,226 @@
+"""
+Tests for Paper Trading Persistence
+===================================
+"""
+
+import json
+import zlib
+from decimal import Decimal
+
+import pytest
+
+from mudrex.paper.engine import PaperTradingEngine
+from mudrex.paper.models import PaperWallet
+from mudrex.paper import persistence
+from mudrex.paper.persistence import InMemoryPaperDB, PaperDB, _pack, _unpack
+from mudrex.paper.price_feed import MockPriceFeedService
+
+
+@pytest.fixture
+def engine():
+    feed = MockPriceFeedService({"BTCUSDT": Decimal("100"), "ETHUSDT": Decimal("10")})
+    return PaperTradingEngine(Decimal("100000"), feed, enable_logging=False)
+
+
+class TestInMemoryPaperDB:
+    def test_appends_new_trades(self, engine):
+        db = InMemoryPaperDB()
+        engine.create_market_order("BTCUSDT", "LONG", Decimal("1"), 5)
+        db.save_state(engine)
+        first = db.load_state()
+        
+        engine.create_market_order("ETHUSDT", "SHORT", Decimal("2"), 5)
+        db.save_state(engine)
+        second = db.load_state()
+        
+        assert [t["trade_id"] for t in second["trade_history"]] == [
+            t.trade_id for t in engine.trade_history
+        ]
+        # The earlier saved state is not changed by the later save
+        assert len(first["trade_history"]) == 1
+        assert first["trade_history"] is not second["trade_history"]
+    
+    def test_reset_history_is_exported_again(self, engine):
+        db = InMemoryPaperDB()
+        engine.create_market_order("BTCUSDT", "LONG", Decimal("1"), 5)
+        db.save_state(engine)
+        
+        engine.reset_wallet()
+        engine.create_market_order("ETHUSDT", "LONG", Decimal("1"), 5)
+        db.save_state(engine)
+        
+        trades = db.load_state()["trade_history"]
+        assert [t["trade_id"] for t in trades] == [engine.trade_history[0].trade_id]
+    
+    def test_delete_state(self, engine):
+        db = InMemoryPaperDB()
+        db.save_state(engine)
+        
+        assert db.delete_state()
+        assert db.load_state() is None
+        assert not db.delete_state()
+
+
+class TestPaperDB:
+    def test_every_connection_uses_wal(self, tmp_path):
+        path = tmp_path / "paper.db"
+        for _ in range(2):
+            db = PaperDB(str(path))
+            mode = db._get_connection().execute("PRAGMA journal_mode").fetchone()[0]
+            db.close()
+            path.unlink()
+            
+            assert mode == "wal"
+    
+    def test_save_load_round_trip(self, engine, tmp_path):
+        engine.create_market_order("BTCUSDT", "LONG", Decimal("1"), 5)
+        order = engine.create_market_order("ETHUSDT", "SHORT", Decimal("2"), 5)
+        engine.close_position(order.position_id)
+        expected = engine.export_state()
+        
+        db = PaperDB(str(tmp_path / "paper.db"))
+        db.save_state(engine)
+        db.close()
+        
+        reopened = PaperDB(str(tmp_path / "paper.db"))
+        restored = PaperTradingEngine.from_state(reopened.load_state(), engine.price_feed)
+        reopened.close()
+        
+        del expected["exported_at"]
+        state = restored.export_state()
+        del state["exported_at"]
+        assert state == expected
+    
+    def test_incremental_save_writes_only_changed_rows(self, engine, tmp_path):
+        engine.create_market_order("BTCUSDT", "LONG", Decimal("1"), 5)
+        order = engine.create_market_order("ETHUSDT", "SHORT", Decimal("2"), 5)
+        db = PaperDB(str(tmp_path / "paper.db"))
+        db.save_state(engine)
+        
+        statements = []
+        db._get_connection().set_trace_callback(statements.append)
+        
+        def detail_writes():
+            writes = [
+                s.split()[2] for s in statements
+                if s.startswith(("INSERT INTO paper_", "DELETE FROM paper_"))
+            ]
+            statements.clear()
+            return sorted(writes)
+        
+        db.save_state(engine)
+        assert detail_writes() == []
+        
+        # Closing updates one position row and appends one trade row
+        engine.close_position(order.position_id)
+        db.save_state(engine)
+        assert detail_writes() == ["paper_positions", "paper_trades"]
+        
+        # Reset drops every row the engine no longer has
+        engine.reset_wallet()
+        db.save_state(engine)
+        assert detail_writes() == ["paper_orders"] * 2 + ["paper_positions"] * 2 + ["paper_trades"] * 3
+        
+        state = db.load_state()
+        db.close()
+        assert state["positions"] == {}
+        assert state["trade_history"] == []
+    
+    def test_incremental_save_serializes_only_changed_rows(self, engine, tmp_path, monkeypatch):
+        engine.create_market_order("BTCUSDT", "LONG", Decimal("1"), 5)
+        order = engine.create_market_order("ETHUSDT", "SHORT", Decimal("2"), 5)
+        db = PaperDB(str(tmp_path / "paper.db"))
+        db.save_state(engine)
+        
+        encoded = []
+        to_json = persistence._to_json
+        monkeypatch.setattr(persistence, "_to_json", lambda obj: encoded.append(obj) or to_json(obj))
+        
+        db.save_state(engine)
+        # Only the main state row is encoded again
+        assert len(encoded) == 1 and "wallet" in encoded[0]
+        
+        encoded.clear()
+        engine.close_position(order.position_id)
+        db.save_state(engine)
+        db.close()
+        
+        assert len(encoded) == 3
+        assert encoded[1]["position_id"] == order.position_id
+        assert encoded[2]["action"] == "CLOSE"
+    
+    def test_export_to_json_is_indented(self, engine, tmp_path):
+        engine.create_market_order("BTCUSDT", "LONG", Decimal("1"), 5)
+        db = PaperDB(str(tmp_path / "paper.db"))
+        db.save_state(engine)
+        path = tmp_path / "export.json"
+        
+        db.export_to_json(str(path))
+        
+        text = path.read_text()
+        assert text.startswith('{\n  "')
+        assert json.loads(text) == db.load_state()
+        db.close()
+    
+    def test_large_state_is_stored_compressed(self, engine, tmp_path):
+        engine.leverage_settings.update({f"COIN{i}USDT": 5 for i in range(200)})
+        db = PaperDB(str(tmp_path / "paper.db"))
+        db.save_state(engine)
+        
+        stored_type = db._get_connection().execute(
+            "SELECT typeof(state_json) FROM paper_state"
+        ).fetchone()[0]
+        state = db.load_state()
+        db.close()
+        
+        assert stored_type == "blob"
+        assert state["leverage_settings"] == engine.leverage_settings
+
+
+class TestPack:
+    def test_short_text_stays_plain(self):
+        assert _pack('{"a": 1}') == '{"a": 1}'
+    
+    def test_long_text_round_trips(self):
+        text = '{"data": "%s"}' % ("x" * 2000)
+        packed = _pack(text)
+        
+        assert isinstance(packed, bytes)
+        assert len(packed) < len(text)
+        assert _unpack(packed) == text
+    
+    def test_reads_zlib_blobs(self):
+        text = '{"data": "%s"}' % ("y" * 2000)
+        
+        assert _unpack(zlib.compress(text.encode())) == text
+
+
+class TestPaperWalletRoundTrip:
+    def test_to_dict_from_dict_exact(self):
+        wallet = PaperWallet(balance=Decimal("1000"), available=Decimal("1000"))
+        wallet.lock_margin(Decimal("123.456789012"))
+        wallet.deduct_fee(Decimal("0.0000001"))
+        wallet.realize_pnl(Decimal("-7.12345678"), Decimal("23.456789012"))
+        
+        restored = PaperWallet.from_dict(wallet.to_dict())
+        
+        assert restored == wallet
+        assert restored.total_fees_paid == Decimal("0.0000001")
+        assert restored.balance == restored.available + restored.locked_margin
+    
+    def test_saved_format_is_decimal_strings(self):
+        wallet = PaperWallet(balance=Decimal("10000.5"), available=Decimal("10000.5"))
+        data = wallet.to_dict()
+        
+        assert data["balance"] == "10000.5"
+        assert data["locked_margin"] == "0"
+    
+    def test_engine_state_round_trip(self, engine):
+        engine.create_market_order("BTCUSDT", "LONG", Decimal("1.5"), 5)
+        wallet = engine.wallet.to_dict()
+        
+        db = InMemoryPaperDB()
+        db.save_state(engine)
+        restored = PaperTradingEngine.from_state(db.load_state(), engine.price_feed)
+        
+        assert restored.wallet.to_dict() == wallet
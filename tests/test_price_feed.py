@@ -0,0 +1,84 @@
+"""
+Tests for Paper Trading Price Feed
+==================================
+"""
+
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+from mudrex.exceptions import MudrexAPIError, MudrexNotFoundError, MudrexServerError
+from mudrex.paper.price_feed import PriceFeedService, _is_not_found
+
+
+class _FakeAssets:
+    def __init__(self):
+        self.threads = set()
+    
+    def get(self, symbol):
+        self.threads.add(threading.current_thread().name)
+        return SimpleNamespace(price="1.5")
+
+
+class TestPriceFeedExecutor:
+    def test_batches_share_one_pool(self):
+        feed = PriceFeedService(_FakeAssets(), cache_ttl=0, max_fetch_workers=2)
+        try:
+            feed.get_prices_batch(["BTCUSDT", "ETHUSDT"])
+            executor = feed._executor
+            prices = feed.get_prices_batch(["BTCUSDT", "ETHUSDT", "SOLUSDT"])
+            
+            assert feed._executor is executor
+            assert set(prices) == {"BTCUSDT", "ETHUSDT", "SOLUSDT"}
+        finally:
+            feed.close()
+    
+    def test_close_stops_pool(self):
+        assets = _FakeAssets()
+        feed = PriceFeedService(assets, cache_ttl=0, max_fetch_workers=2)
+        feed.get_prices_batch(["BTCUSDT", "ETHUSDT"])
+        executor = feed._executor
+        feed.close()
+        
+        assert feed._executor is None
+        assert executor._shutdown
+        assert all(name.startswith("price-feed") for name in assets.threads)
+    
+    def test_single_fetch_needs_no_pool(self):
+        feed = PriceFeedService(_FakeAssets(), max_fetch_workers=4)
+        
+        assert feed.get_prices_batch(["BTCUSDT"]) == {"BTCUSDT": feed.get_price("BTCUSDT")}
+        assert feed._executor is None
+
+
+class TestIsNotFound:
+    @pytest.mark.parametrize("error", [
+        MudrexNotFoundError("Resource missing", status_code=404),
+        MudrexAPIError("Unexpected", status_code=404),
+        MudrexAPIError("Asset not found", status_code=400),
+        MudrexAPIError("Symbol Not Found"),
+        KeyError("symbol not found"),
+    ])
+    def test_not_found(self, error):
+        assert _is_not_found(error)
+    
+    @pytest.mark.parametrize("error", [
+        MudrexAPIError("Invalid quantity", status_code=400),
+        MudrexServerError("upstream route not found", status_code=502),
+        MudrexAPIError("Gateway error 404 upstream", status_code=500),
+        TimeoutError("timed out"),
+    ])
+    def test_other_failures(self, error):
+        assert not _is_not_found(error)
+    
+    def test_404_text_only_counts_when_asked(self):
+        error = RuntimeError("HTTP 404")
+        
+        assert not _is_not_found(error)
+        assert _is_not_found(error, match_404=True)
+    
+    def test_api_error_404_text_is_not_a_status(self):
+        error = MudrexAPIError("Code 404 in body", status_code=400)
+        
+        assert not _is_not_found(error, match_404=True)
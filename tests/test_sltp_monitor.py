@@ -0,0 +1,233 @@
+"""
+Tests for Paper Trading SL/TP Monitor
+=====================================
+"""
+
+import threading
+import time
+from decimal import Decimal
+
+import pytest
+
+from mudrex.paper.engine import PaperTradingEngine
+from mudrex.paper.models import CloseReason, PaperPositionStatus
+from mudrex.paper.price_feed import MockPriceFeedService
+from mudrex.paper.sltp_monitor import SLTPMonitor, check_triggers
+
+
+class _CountingFeed(MockPriceFeedService):
+    def __init__(self, prices):
+        super().__init__(prices)
+        self.batches = []
+    
+    def get_prices_batch(self, symbols):
+        self.batches.append(sorted(symbols))
+        return super().get_prices_batch(symbols)
+
+
+def _open(engine, *args, **kwargs):
+    order = engine.create_market_order(*args, **kwargs)
+    return engine.positions[order.position_id]
+
+
+@pytest.fixture
+def engine():
+    feed = MockPriceFeedService({"BTCUSDT": Decimal("100"), "ETHUSDT": Decimal("10")})
+    return PaperTradingEngine(Decimal("100000"), feed, enable_logging=False)
+
+
+@pytest.fixture
+def triggered():
+    return []
+
+
+@pytest.fixture
+def monitor(engine, triggered):
+    return SLTPMonitor(
+        engine,
+        on_sl_triggered=lambda *args: triggered.append("SL"),
+        on_tp_triggered=lambda *args: triggered.append("TP"),
+    )
+
+
+class TestCheckTriggers:
+    def test_takeprofit_wins_when_both_hit(self, engine):
+        position = _open(engine, "BTCUSDT", "LONG", Decimal("1"), 5)
+        # Levels set directly so both sit on the same side of the price
+        position.stoploss_price = Decimal("120")
+        position.takeprofit_price = Decimal("110")
+        
+        assert check_triggers([position], Decimal("130")) == [(position, CloseReason.TAKEPROFIT)]
+    
+    def test_positions_without_levels_are_skipped(self, engine):
+        position = _open(engine, "BTCUSDT", "LONG", Decimal("1"), 5)
+        
+        assert check_triggers([position], Decimal("1")) == []
+
+
+class TestOnPrice:
+    def test_long_stoploss(self, engine, monitor, triggered):
+        position = _open(engine, "BTCUSDT", "LONG", Decimal("1"), 5, stoploss_price=Decimal("95"))
+        
+        monitor.on_price("BTCUSDT", Decimal("94"))
+        
+        assert position.status == PaperPositionStatus.CLOSED
+        assert monitor.sl_triggered_count == 1
+        assert triggered == ["SL"]
+    
+    def test_short_takeprofit(self, engine, monitor, triggered):
+        position = _open(
+            engine, "ETHUSDT", "SHORT", Decimal("5"), 5, takeprofit_price=Decimal("9")
+        )
+        
+        monitor.on_price("ETHUSDT", Decimal("8.5"))
+        
+        assert position.status == PaperPositionStatus.CLOSED
+        assert monitor.tp_triggered_count == 1
+        assert triggered == ["TP"]
+    
+    def test_price_inside_levels_updates_pnl_only(self, engine, monitor, triggered):
+        position = _open(
+            engine, "BTCUSDT", "LONG", Decimal("2"), 5,
+            stoploss_price=Decimal("95"), takeprofit_price=Decimal("110"),
+        )
+        
+        monitor.on_price("BTCUSDT", Decimal("105"))
+        
+        assert position.status == PaperPositionStatus.OPEN
+        assert position.unrealized_pnl == Decimal("10")
+        assert triggered == []
+    
+    def test_other_symbols_are_untouched(self, engine, monitor):
+        position = _open(engine, "BTCUSDT", "LONG", Decimal("1"), 5, stoploss_price=Decimal("95"))
+        
+        monitor.on_price("ETHUSDT", Decimal("1"))
+        
+        assert position.status == PaperPositionStatus.OPEN
+        assert monitor.sl_triggered_count == 0
+    
+    def test_sees_positions_opened_after_first_price(self, engine, monitor):
+        monitor.on_price("BTCUSDT", Decimal("100"))
+        position = _open(engine, "BTCUSDT", "LONG", Decimal("1"), 5, stoploss_price=Decimal("95"))
+        
+        monitor.on_price("BTCUSDT", Decimal("90"))
+        
+        assert position.status == PaperPositionStatus.CLOSED
+
+
+class TestPriceCache:
+    @pytest.fixture
+    def feed(self):
+        return _CountingFeed({"BTCUSDT": Decimal("100"), "ETHUSDT": Decimal("10")})
+    
+    @pytest.fixture
+    def engine(self, feed):
+        return PaperTradingEngine(Decimal("100000"), feed, enable_logging=False)
+    
+    def test_checks_reuse_prices_within_ttl(self, engine, feed):
+        monitor = SLTPMonitor(engine, price_ttl=60)
+        _open(engine, "BTCUSDT", "LONG", Decimal("1"), 5)
+        _open(engine, "ETHUSDT", "LONG", Decimal("1"), 5)
+        feed.batches.clear()
+        
+        monitor.check_all_positions()
+        monitor.check_all_positions()
+        
+        assert feed.batches == [["BTCUSDT", "ETHUSDT"]]
+    
+    def test_only_expired_prices_are_refetched(self, engine, feed):
+        monitor = SLTPMonitor(engine, price_ttl=60)
+        _open(engine, "BTCUSDT", "LONG", Decimal("1"), 5)
+        _open(engine, "ETHUSDT", "LONG", Decimal("1"), 5)
+        monitor.check_all_positions()
+        feed.batches.clear()
+        
+        price, _ = monitor._price_cache["ETHUSDT"]
+        monitor._price_cache["ETHUSDT"] = (price, time.monotonic() - 120)
+        monitor.check_all_positions()
+        
+        assert feed.batches == [["ETHUSDT"]]
+    
+    def test_zero_ttl_fetches_every_check(self, engine, feed):
+        monitor = SLTPMonitor(engine, price_ttl=0)
+        _open(engine, "BTCUSDT", "LONG", Decimal("1"), 5)
+        feed.batches.clear()
+        
+        monitor.check_all_positions()
+        monitor.check_all_positions()
+        
+        assert len(feed.batches) == 2
+    
+    def test_pushed_price_is_used_by_checks(self, engine, feed):
+        monitor = SLTPMonitor(engine, price_ttl=60)
+        position = _open(engine, "BTCUSDT", "LONG", Decimal("1"), 5, stoploss_price=Decimal("95"))
+        feed.batches.clear()
+        
+        monitor.on_price("BTCUSDT", Decimal("96"))
+        feed.set_price("BTCUSDT", Decimal("90"))
+        monitor.check_all_positions()
+        
+        # The check reused the pushed 96 instead of fetching 90
+        assert feed.batches == []
+        assert position.status == PaperPositionStatus.OPEN
+        assert position.unrealized_pnl == Decimal("-4")
+
+
+class TestIdleBackoff:
+    def test_idle_gap_doubles_up_to_poll_max(self, engine):
+        monitor = SLTPMonitor(engine, interval=0.01, poll_max=0.04)
+        monitor.start()
+        try:
+            deadline = time.monotonic() + 5
+            while monitor.checks_performed < 4 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            monitor.stop()
+        
+        assert monitor._current_sleep == 0.04
+    
+    def test_wake_resets_backoff_and_ends_wait(self, engine):
+        monitor = SLTPMonitor(engine, interval=1, poll_max=60)
+        monitor._stop_event.clear()
+        monitor._current_sleep = 32
+        
+        monitor.wake()
+        started = time.monotonic()
+        monitor._wait(30, engine.positions_version)
+        
+        assert time.monotonic() - started < 1
+        assert monitor._current_sleep == 1
+        assert not monitor._wake_event.is_set()
+    
+    def test_backed_off_wait_ends_when_position_opens(self, engine):
+        monitor = SLTPMonitor(engine, interval=0.01, poll_max=60)
+        monitor._stop_event.clear()
+        monitor._current_sleep = 32
+        waiter = threading.Thread(target=monitor._wait, args=(30, engine.positions_version))
+        waiter.start()
+        
+        _open(engine, "BTCUSDT", "LONG", Decimal("1"), 5)
+        waiter.join(timeout=5)
+        
+        assert not waiter.is_alive()
+        assert monitor._current_sleep == 0.01
+
+
+class TestOpenSnapshot:
+    def test_reused_until_positions_version_changes(self, engine, monitor):
+        first = _open(engine, "BTCUSDT", "LONG", Decimal("1"), 5)
+        snapshot = monitor._open_snapshot()
+        
+        assert monitor._open_snapshot()[0] is snapshot[0]
+        assert snapshot[1] == {"BTCUSDT": [first]}
+        
+        second = _open(engine, "ETHUSDT", "SHORT", Decimal("1"), 5)
+        positions, by_symbol = monitor._open_snapshot()
+        
+        assert positions is not snapshot[0]
+        assert positions == [first, second]
+        assert snapshot[0] == [first]  # Earlier snapshot is not mutated
+        
+        engine.close_position(first.position_id)
+        
+        assert monitor._open_snapshot()[1] == {"ETHUSDT": [second]}
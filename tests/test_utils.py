@@ -0,0 +1,50 @@
+"""
+Tests for Order Helper Utilities
+================================
+"""
+
+from mudrex.utils import calculate_order_from_usd, step_precision, validate_quantity
+
+
+class TestStepPrecision:
+    def test_decimal_places(self):
+        assert step_precision(0.001) == 3
+        assert step_precision("0.10") == 2
+        assert step_precision(1) == 0
+    
+    def test_exponent_form(self):
+        assert step_precision(1e-05) == 5
+
+
+class TestValidateQuantity:
+    def test_exact_multiples(self):
+        assert validate_quantity(0.3, 0.1)
+        assert validate_quantity(2.6, 0.1)
+        assert validate_quantity(0.00012, 1e-05)
+    
+    def test_not_multiples(self):
+        assert not validate_quantity(0.35, 0.1)
+        assert not validate_quantity(5.5, 1)
+    
+    def test_zero_step(self):
+        assert validate_quantity(1.234, 0)
+    
+    def test_float_noise(self):
+        assert validate_quantity(0.1 * 3, 0.1)
+        assert validate_quantity(0.7000000000000001, 0.1)
+        assert validate_quantity(3.3000000000000003, 0.1)
+        assert validate_quantity(100.00000000000001, 0.1)
+    
+    def test_tiny_quantities(self):
+        assert validate_quantity(5e-324, 0.1) is True
+        assert validate_quantity(1e-300, 1e-05) is True
+        assert validate_quantity(3e-06, 1e-05) is False
+
+
+class TestCalculateOrderFromUsd:
+    def test_rounds_to_step(self):
+        qty, value = calculate_order_from_usd(5.0, 1.905, 0.1)
+        
+        assert qty == 2.6
+        assert validate_quantity(qty, 0.1)
+        assert abs(value - 4.953) < 1e-9